@@ -0,0 +1,224 @@
+from datetime import date as _date, timedelta
+from theDB import *
+from conflictEngine import conflict_engine
+from seedingEngine import seeding_engine
+from scheduleGenerator import DEFAULT_SLOTS
+
+WINS_NEEDED = 4
+# 2-2-1-1-1: the higher seed hosts games 1, 2, 5 and 7.
+HIGHER_SEED_HOSTS = (True, True, False, False, True, False, True)
+SERIES_REST_DAYS = 1
+
+ROUND_NAMES = ("First Round", "Semifinals", "Finals")
+ROUND_PHASES = ("Playoff", "Playoff", "Finals")
+FIRST_ROUND_SEEDS = ((1, 8), (4, 5), (2, 7), (3, 6))
+
+
+class Series:
+    """One best-of-seven series. high/low are team ids (high is the better seed), None while undecided."""
+    def __init__(self, round_index, high=None, low=None, high_seed=None, low_seed=None):
+        self.round_index = round_index
+        self.high, self.low = high, low
+        self.high_seed, self.low_seed = high_seed, low_seed
+        self.wins = {}
+        self.games = []
+        self.last_date = None
+        self.opens_after = None
+
+    @property
+    def round_name(self):
+        return ROUND_NAMES[self.round_index]
+
+    @property
+    def phase(self):
+        return ROUND_PHASES[self.round_index]
+
+    @property
+    def ready(self):
+        return self.high is not None and self.low is not None
+
+    def record(self, game_date, winner):
+        self.games.append((game_date, winner))
+        self.last_date = game_date
+        if winner is not None:
+            self.wins[winner] = self.wins.get(winner, 0) + 1
+
+    @property
+    def winner(self):
+        return next((t for t, w in self.wins.items() if w >= WINS_NEEDED), None)
+
+    @property
+    def is_active(self):
+        return self.ready and self.winner is None
+
+    @property
+    def next_game_number(self):
+        return len(self.games) + 1
+
+    def next_home(self):
+        hosts_high = HIGHER_SEED_HOSTS[min(len(self.games), len(HIGHER_SEED_HOSTS) - 1)]
+        return (self.high, self.low) if hosts_high else (self.low, self.high)
+
+    def score(self):
+        return self.wins.get(self.high, 0), self.wins.get(self.low, 0)
+
+
+class Proposal:
+    """Next game of an active series placed on a free venue slot."""
+    __slots__ = ("series", "home", "away", "venue_id", "date", "start", "end")
+
+    def __init__(self, series, home, away, venue_id, date, start, end):
+        self.series = series
+        self.home, self.away = home, away
+        self.venue_id = venue_id
+        self.date, self.start, self.end = date, start, end
+
+    def as_row(self):
+        return (self.home, self.away, self.venue_id, self.date, self.start, self.end)
+
+
+class Bracket:
+    """Eight-team playoff bracket of one season, filled from finalized playoff and finals games."""
+    def __init__(self, seeding, games):
+        self.seeding = seeding
+        self.season_start_year = seeding.season_start_year
+        seeds = seeding.playoff_seeds()
+        first = [Series(0, seeds[h - 1], seeds[l - 1], h, l) for h, l in FIRST_ROUND_SEEDS]
+        self.rounds = [first, [Series(1), Series(1)], [Series(2)]]
+        self._seed_of = {tid: i + 1 for i, tid in enumerate(seeds) if tid is not None}
+
+        by_pair = {}
+        for g in games:
+            by_pair.setdefault(frozenset((g['team1_id'], g['team2_id'])), []).append(g)
+        for r, series_list in enumerate(self.rounds):
+            for i, series in enumerate(series_list):
+                if r:
+                    feeders = self.rounds[r - 1][2 * i:2 * i + 2]
+                    self._fill(series, *(s.winner for s in feeders))
+                    series.opens_after = max((s.last_date for s in feeders if s.last_date), default=None)
+                if not series.ready: continue
+                window = season_calendar.phase_window(series.phase, self.season_start_year)
+                for g in by_pair.get(frozenset((series.high, series.low)), []):
+                    if window[0].isoformat() <= g['game_date'] <= window[1].isoformat():
+                        series.record(g['game_date'], g['winner_team_id'])
+
+    def _fill(self, series, a, b):
+        if a is None or b is None: return
+        (sa, a), (sb, b) = sorted(((self._seed_of.get(a, 99), a), (self._seed_of.get(b, 99), b)))
+        series.high, series.low, series.high_seed, series.low_seed = a, b, sa, sb
+
+    def all_series(self):
+        return [s for series_list in self.rounds for s in series_list]
+
+    def active_series(self, phase=None):
+        return [s for s in self.all_series() if s.is_active and (phase is None or s.phase == phase)]
+
+    @property
+    def champion(self):
+        return self.rounds[-1][0].winner
+
+    def active_teams(self, phase=None):
+        """Names of the teams still playing a series in phase."""
+        name = self.seeding.team_name
+        return sorted(name(t) for s in self.active_series(phase) for t in (s.high, s.low))
+
+    def opponent(self, team_name, phase=None):
+        """Name of team_name's opponent in its active series, or None."""
+        name = self.seeding.team_name
+        for s in self.active_series(phase):
+            if team_name == name(s.high): return name(s.low)
+            if team_name == name(s.low): return name(s.high)
+        return None
+
+    def describe(self):
+        name = self.seeding.team_name
+        lines = []
+        for r, series_list in enumerate(self.rounds):
+            lines.append(ROUND_NAMES[r])
+            for s in series_list:
+                if not s.ready:
+                    lines.append("  (awaiting earlier results)")
+                    continue
+                w_high, w_low = s.score()
+                status = f"{name(s.winner)} wins" if s.winner else f"Game {s.next_game_number} next"
+                lines.append(f"  ({s.high_seed}) {name(s.high)} {w_high} - {w_low} {name(s.low)} ({s.low_seed})  {status}")
+        if self.champion:
+            lines.append(f"Champion: {name(self.champion)}")
+        return "\n".join(lines)
+
+
+class BracketEngine:
+    """
+    Playoff bracket per season, built from the seeding engine's ranks and
+    play-in results plus one indexed scan of the playoff and finals
+    window. The bracket is kept until the seeding state for the season is
+    recomputed, which happens when one of its games is finalized.
+    """
+    def __init__(self, db=None):
+        self.db = db
+        self._brackets = {}
+
+    def bracket(self, year_str, teams_dict):
+        """Bracket for the Year field's season, or None when there are fewer than 8 ranked teams."""
+        seeding = seeding_engine.state(year_str, teams_dict)
+        if seeding is None or seeding.playoff_seeds() is None:
+            return None
+        cached = self._brackets.get(seeding.season_start_year)
+        if cached is not None and cached[0] is seeding:
+            return cached[1]
+        bracket = Bracket(seeding, self._playoff_games(seeding.season_start_year, is_final=1))
+        self._brackets[seeding.season_start_year] = (seeding, bracket)
+        return bracket
+
+    def _playoff_games(self, season, is_final):
+        start, _ = season_calendar.phase_window("Playoff", season)
+        _, end = season_calendar.phase_window("Finals", season)
+        cur = self.db.cursor()
+        try:
+            cur.execute("""
+                SELECT id, team1_id, team2_id, game_date, start_time, winner_team_id FROM games
+                WHERE is_final = ? AND game_date BETWEEN ? AND ?
+                ORDER BY game_date, start_time, id
+            """, (is_final, start.isoformat(), end.isoformat()))
+            return cur.fetchall()
+        finally:
+            cur.close()
+
+    def propose_next_games(self, bracket, venue_ids, slots=None, today=None):
+        """
+        One Proposal per active series that has no game scheduled yet: the
+        next game of the series, hosted per HIGHER_SEED_HOSTS, on the first
+        date after the rest days with a venue slot the conflict engine accepts.
+        """
+        if not venue_ids: return []
+        slots = slots or DEFAULT_SLOTS
+        today = today or _date.today()
+        pending = {frozenset((g['team1_id'], g['team2_id']))
+                   for g in self._playoff_games(bracket.season_start_year, is_final=0)}
+        accepted = []
+        proposals = []
+        for series in bracket.active_series():
+            if frozenset((series.high, series.low)) in pending: continue
+            home, away = series.next_home()
+            start, end = season_calendar.phase_window(series.phase, bracket.season_start_year)
+            day = max(start, today + timedelta(days=1))
+            last = series.last_date or series.opens_after
+            if last:
+                day = max(day, _date.fromisoformat(last) + timedelta(days=SERIES_REST_DAYS + 1))
+            placed = None
+            while day <= end and placed is None:
+                for s_time, e_time in slots:
+                    for vid in venue_ids:
+                        row = (home, away, vid, day.isoformat(), s_time, e_time)
+                        if conflict_engine.check_batch(accepted + [row])[-1] is None:
+                            placed = row
+                            break
+                    if placed: break
+                day += timedelta(days=1)
+            if placed:
+                accepted.append(placed)
+                proposals.append(Proposal(series, *placed))
+        return proposals
+
+
+bracket_engine = BracketEngine(mydb)
@@ -0,0 +1,76 @@
+from theDB import *
+from conflictIndex import ConflictIndex
+
+class ConflictEngine(ConflictIndex):
+    """ConflictIndex of every booked game, answering the scheduling conflict rules.
+
+    Loaded lazily from the games table and kept current from GameChanged and
+    VenueChanged events, so check_conflicts never touches the database.
+    """
+    def __init__(self, db=None):
+        super().__init__()
+        self.db = db
+        self._synced_version = None
+
+    def attach(self):
+        bus.subscribe(GameChanged, self._on_games_changed)
+        bus.subscribe(VenueChanged, self._on_venue_changed)
+        return self
+
+    def load(self):
+        self._venue_days.clear()
+        self._team_days.clear()
+        self._team_day_venues.clear()
+        self._games.clear()
+        cur = self.db.cursor()
+        try:
+            cur.execute("SELECT id, venueName FROM venues")
+            self._venue_names = {r['id']: r['venueName'] for r in cur.fetchall()}
+            cur.execute("SELECT id, team1_id, team2_id, venue_id, game_date, start_time, end_time FROM games")
+            for r in cur.fetchall():
+                self._insert(r['id'], r['team1_id'], r['team2_id'], r['venue_id'],
+                             r['game_date'], r['start_time'], r['end_time'])
+        finally:
+            cur.close()
+        self._synced_version = games_version()
+
+    def _ensure_loaded(self):
+        if self.db is not None and self._synced_version != games_version():
+            self.load()
+
+    def _on_games_changed(self, event):
+        if self._synced_version is None:
+            return
+        if isinstance(event, GamesReset) or self._synced_version + 1 != games_version():
+            self._synced_version = None
+            return
+        if isinstance(event, (ScoreChanged, GameFinalized)):
+            self._synced_version = games_version()
+            return
+
+        game_id = event.game_id
+        self._remove(game_id)
+        if isinstance(event, (GameScheduled, GameUpdated)):
+            cur = self.db.cursor()
+            try:
+                cur.execute("SELECT id, team1_id, team2_id, venue_id, game_date, start_time, end_time FROM games WHERE id = ?", (game_id,))
+                r = cur.fetchone()
+                if r:
+                    self._insert(r['id'], r['team1_id'], r['team2_id'], r['venue_id'],
+                                 r['game_date'], r['start_time'], r['end_time'])
+                    if r['venue_id'] not in self._venue_names:
+                        cur.execute("SELECT venueName FROM venues WHERE id = ?", (r['venue_id'],))
+                        v = cur.fetchone()
+                        if v: self._venue_names[r['venue_id']] = v['venueName']
+            finally:
+                cur.close()
+        self._synced_version = games_version()
+
+    def _on_venue_changed(self, event):
+        if event.change == "deleted":
+            self._venue_names.pop(event.venue_id, None)
+        elif event.name:
+            self._venue_names[event.venue_id] = event.name
+
+
+conflict_engine = ConflictEngine(mydb).attach()
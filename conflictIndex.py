@@ -0,0 +1,175 @@
+from bisect import bisect_left
+
+def _to_minutes(hhmm):
+    try:
+        h, m = str(hhmm).split(":")[:2]
+        return int(h) * 60 + int(m)
+    except Exception:
+        return 0
+
+
+class _DayIntervals:
+    """Games for one venue or team on one day, sorted by start minute.
+
+    This stands in for an interval tree: max_ends[i] is the latest end among
+    entries[0..i], so an overlap query is a single O(log k) bisect (every
+    entry starting before `end` is a candidate, and one of them overlaps iff
+    the largest of their end times is after `start`). add and remove locate
+    their slot by bisect too but shift the list and redo the running max from
+    there, O(k). k is the number of games one venue or team has on one day,
+    a handful at most, so a balanced tree would only add overhead.
+    """
+    __slots__ = ("starts", "entries", "max_ends")
+
+    def __init__(self):
+        self.starts = []
+        self.entries = []
+        self.max_ends = []
+
+    def add(self, start, end, game_id):
+        idx = bisect_left(self.starts, start)
+        self.starts.insert(idx, start)
+        self.entries.insert(idx, (start, end, game_id))
+        self._reindex(idx)
+
+    def remove(self, game_id, start):
+        idx = bisect_left(self.starts, start)
+        for idx in range(idx, len(self.entries)):
+            entry = self.entries[idx]
+            if entry[0] != start:
+                return
+            if entry[2] == game_id:
+                del self.starts[idx]
+                del self.entries[idx]
+                self._reindex(idx)
+                return
+
+    def _reindex(self, idx):
+        del self.max_ends[idx:]
+        running = self.max_ends[-1] if self.max_ends else -1
+        for _, end, _ in self.entries[idx:]:
+            running = max(running, end)
+            self.max_ends.append(running)
+
+    def overlaps(self, start, end):
+        idx = bisect_left(self.starts, end)
+        return idx > 0 and self.max_ends[idx - 1] > start
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class ConflictIndex:
+    """Venue/team booking index answering the scheduling conflict rules.
+
+    Holds no database handle, so it can be built from plain rows anywhere,
+    including worker processes; ConflictEngine keeps one in sync with the DB.
+    """
+    def __init__(self):
+        self._venue_days = {}
+        self._team_days = {}
+        self._team_day_venues = {}
+        self._games = {}
+        self._venue_names = {}
+        self._temp_id = 0
+
+    @classmethod
+    def from_rows(cls, rows, venue_names=None):
+        """Builds a detached index from (id, team1_id, team2_id, venue_id, date, start, end) rows."""
+        index = cls()
+        index._venue_names = dict(venue_names or {})
+        for r in rows:
+            index._insert(*r)
+        return index
+
+    def _ensure_loaded(self):
+        pass
+
+    def _insert(self, game_id, team1_id, team2_id, venue_id, date_iso, start, end):
+        s_min = start if isinstance(start, int) else _to_minutes(start or "00:00")
+        e_min = end if isinstance(end, int) else _to_minutes(end or "00:00")
+        self._games[game_id] = (team1_id, team2_id, venue_id, date_iso, s_min, e_min)
+        self._venue_days.setdefault((venue_id, date_iso), _DayIntervals()).add(s_min, e_min, game_id)
+        for tid in {team1_id, team2_id}:
+            if tid is None: continue
+            self._team_days.setdefault((tid, date_iso), _DayIntervals()).add(s_min, e_min, game_id)
+            venues_today = self._team_day_venues.setdefault((tid, date_iso), {})
+            venues_today[venue_id] = venues_today.get(venue_id, 0) + 1
+
+    def _remove(self, game_id):
+        g = self._games.pop(game_id, None)
+        if not g: return
+        team1_id, team2_id, venue_id, date_iso, s_min, _ = g
+        self._discard(self._venue_days, (venue_id, date_iso), game_id, s_min)
+        for tid in {team1_id, team2_id}:
+            if tid is None: continue
+            self._discard(self._team_days, (tid, date_iso), game_id, s_min)
+            venues_today = self._team_day_venues.get((tid, date_iso))
+            if venues_today:
+                venues_today[venue_id] -= 1
+                if venues_today[venue_id] <= 0: del venues_today[venue_id]
+                if not venues_today: del self._team_day_venues[(tid, date_iso)]
+
+    def _discard(self, index, key, game_id, start):
+        day = index.get(key)
+        if day is None: return
+        day.remove(game_id, start)
+        if not day: del index[key]
+
+    def _venue_name(self, venue_id):
+        return self._venue_names.get(venue_id, str(venue_id))
+
+    def find_conflict(self, team1_id, team2_id, venue_id, date_iso, start, end, team_names=None, venue_name=None):
+        """Returns a conflict message, or None when the game can be booked."""
+        self._ensure_loaded()
+        names = team_names or (team1_id, team2_id)
+        teams = ((team1_id, names[0]), (team2_id, names[1]))
+        s_min = start if isinstance(start, int) else _to_minutes(start)
+        e_min = end if isinstance(end, int) else _to_minutes(end)
+
+        for tid, tname in teams:
+            venues_today = self._team_day_venues.get((tid, date_iso))
+            if venues_today:
+                other = next((v for v in venues_today if v != venue_id), None)
+                if other is not None:
+                    return f"Team '{tname}' already playing at '{self._venue_name(other)}' on this day."
+
+        day = self._venue_days.get((venue_id, date_iso))
+        if day and day.overlaps(s_min, e_min):
+            return f"Venue '{venue_name or self._venue_name(venue_id)}' is booked during this time."
+
+        for tid, tname in teams:
+            day = self._team_days.get((tid, date_iso))
+            if day and day.overlaps(s_min, e_min):
+                return f"Team '{tname}' has a game during this time."
+        return None
+
+    def check_batch(self, proposals, keep=False, labels=None):
+        """Validates many (team1_id, team2_id, venue_id, date_iso, start, end) proposals in one call.
+
+        Proposals are checked against the booked games and against the earlier
+        accepted proposals of the same batch. Returns one message-or-None per
+        proposal. With keep=True, accepted proposals stay booked in the engine
+        (only useful for detached indexes built with from_rows). labels, when
+        given, holds ((team1_name, team2_name), venue_name) per proposal for the
+        messages.
+        """
+        self._ensure_loaded()
+        results = []
+        provisional = []
+        for i, (team1_id, team2_id, venue_id, date_iso, start, end) in enumerate(proposals):
+            if team1_id == team2_id:
+                results.append("Teams must be different.")
+                continue
+            team_names, venue_name = labels[i] if labels else (None, None)
+            msg = self.find_conflict(team1_id, team2_id, venue_id, date_iso, start, end, team_names, venue_name)
+            results.append(msg)
+            if msg is None:
+                self._temp_id -= 1
+                self._insert(self._temp_id, team1_id, team2_id, venue_id, date_iso, start, end)
+                provisional.append(self._temp_id)
+        if not keep:
+            for gid in provisional:
+                self._remove(gid)
+        return results
+
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from theDB import connections
+
+# How often the Tk side checks whether a pending query has finished.
+POLL_INTERVAL_MS = 20
+
+class DbExecutor:
+    """
+    Runs read-only queries on background threads so the Tk main loop never
+    waits on SQLite. Each worker thread uses its own WAL reader from
+    theDB.connections, so queries run while the scorer writes; results are
+    returned as futures and handed back to the UI through `after`, so
+    callbacks always run on the Tk thread. Writes stay on the Tk thread
+    through ScheduleManager and the shared `mydb` connection.
+    """
+    def __init__(self, workers=2):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-read")
+
+    def _call(self, fn, args):
+        return fn(connections.reader(), *args)
+
+    def submit(self, fn, *args):
+        """Runs fn(conn, *args) on a worker thread and returns a concurrent.futures.Future."""
+        return self._pool.submit(self._call, fn, args)
+
+    def query(self, sql, params=()):
+        """Future for the fetched rows of one SELECT."""
+        return self.submit(lambda conn: conn.execute(sql, params).fetchall())
+
+    def deliver(self, widget, future, on_done, on_error=None):
+        """Calls on_done(result) on the Tk thread once the future completes, unless widget was destroyed."""
+        def poll():
+            try:
+                if not widget.winfo_exists(): return
+            except Exception:
+                return
+            if not future.done():
+                widget.after(POLL_INTERVAL_MS, poll)
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                else:
+                    print(f"[DbExecutor] Query failed: {e}")
+                return
+            on_done(result)
+        widget.after(POLL_INTERVAL_MS, poll)
+
+    def run(self, widget, fn, on_done, *args, on_error=None):
+        """submit() + deliver(): runs fn(conn, *args) off-thread and passes the result to on_done on the Tk thread."""
+        future = self.submit(fn, *args)
+        self.deliver(widget, future, on_done, on_error)
+        return future
+
+
+db_executor = DbExecutor()
@@ -0,0 +1,94 @@
+class Event:
+    """Base class for everything published on the bus."""
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for cls in type(self).__mro__
+                           for k in getattr(cls, "__slots__", ()))
+        return f"{type(self).__name__}({fields})"
+
+
+class GameChanged(Event):
+    """A committed write to the games table. seasons holds the season start years it touched."""
+    __slots__ = ("game_id", "seasons")
+
+    def __init__(self, game_id=None, seasons=()):
+        self.game_id = game_id
+        self.seasons = tuple(sorted({s for s in seasons if s is not None}))
+
+class GameScheduled(GameChanged):
+    __slots__ = ()
+
+class GameUpdated(GameChanged):
+    """Teams, venue, date or time of a game changed."""
+    __slots__ = ()
+
+class GameDeleted(GameChanged):
+    __slots__ = ()
+
+class ScoreChanged(GameChanged):
+    __slots__ = ()
+
+class GameFinalized(GameChanged):
+    __slots__ = ("winner_team_id",)
+
+    def __init__(self, game_id=None, seasons=(), winner_team_id=None):
+        super().__init__(game_id, seasons)
+        self.winner_team_id = winner_team_id
+
+class GamesReset(GameChanged):
+    """Many games changed at once (bulk insert, team delete, replay); game_id is None."""
+    __slots__ = ()
+
+
+class RosterChanged(Event):
+    """A team or its players changed. change is "added", "renamed", "deleted" or "players"."""
+    __slots__ = ("team_id", "change", "name")
+
+    def __init__(self, team_id, change, name=None):
+        self.team_id = team_id
+        self.change = change
+        self.name = name
+
+class VenueChanged(Event):
+    """change is "added", "updated" or "deleted"."""
+    __slots__ = ("venue_id", "change", "name")
+
+    def __init__(self, venue_id, change, name=None):
+        self.venue_id = venue_id
+        self.change = change
+        self.name = name
+
+
+class EventBus:
+    """Synchronous in-process publish/subscribe keyed on event class.
+
+    Subscribing to a base class (e.g. GameChanged) receives every subclass.
+    Callbacks run in subscription order regardless of the class they
+    subscribed to, so caches that subscribe at import time are always
+    updated before the tabs that read from them.
+    """
+    def __init__(self):
+        self._subscribers = []
+
+    def subscribe(self, event_type, callback):
+        self._subscribers.append((event_type, callback))
+        return callback
+
+    def unsubscribe(self, event_type, callback):
+        try:
+            self._subscribers.remove((event_type, callback))
+        except ValueError:
+            pass
+
+    def publish(self, event):
+        for event_type, callback in list(self._subscribers):
+            if not isinstance(event, event_type):
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"[EventBus] {type(event).__name__} subscriber failed: {e}")
+
+
+bus = EventBus()
@@ -0,0 +1,77 @@
+import json
+from theDB import *
+
+class ReplayEngine:
+    """Rebuilds scoring state from the append-only game_events log.
+
+    box_score() starts from a game's latest snapshot and folds in only the
+    events after it; rebuild() streams the whole log once and rewrites every
+    derived counter (box scores, career points, game scores, standings).
+    """
+    def __init__(self, mgr=None):
+        self.mgr = mgr or ScheduleManager()
+        self.db = self.mgr.mydb
+
+    def box_score(self, game_id):
+        """Returns {'players': {player_id: points}, 'teams': {team_id: points}} for one game."""
+        cur = self.db.cursor()
+        try:
+            players, teams, since = {}, {}, 0
+            cur.execute("SELECT last_event_id, box_score FROM game_snapshots WHERE game_id = ?", (game_id,))
+            snap = cur.fetchone()
+            if snap:
+                box = json.loads(snap['box_score'])
+                players = {int(k): v for k, v in box['players'].items()}
+                teams = {int(k): v for k, v in box['teams'].items()}
+                since = snap['last_event_id']
+
+            cur.execute("""
+                SELECT player_id, team_id, delta FROM game_events
+                WHERE game_id = ? AND id > ? ORDER BY id
+            """, (game_id, since))
+            for e in cur:
+                if not e['delta']:
+                    continue
+                if e['player_id'] is not None:
+                    players[e['player_id']] = players.get(e['player_id'], 0) + e['delta']
+                if e['team_id'] is not None:
+                    teams[e['team_id']] = teams.get(e['team_id'], 0) + e['delta']
+            return {'players': players, 'teams': teams}
+        finally:
+            cur.close()
+
+    def replay(self):
+        """One streaming pass over the log. Returns (box_scores, team_scores, careers, last_event_ids)."""
+        box_scores = {}
+        team_scores = {}
+        careers = {}
+        last_event_ids = {}
+        cur = self.db.cursor()
+        try:
+            cur.execute("SELECT id, game_id, player_id, team_id, delta FROM game_events ORDER BY id")
+            for e in cur:
+                gid, pid, tid, delta = e['game_id'], e['player_id'], e['team_id'], e['delta']
+                if gid is not None:
+                    last_event_ids[gid] = e['id']
+                if not delta:
+                    continue
+                if pid is not None:
+                    careers[pid] = careers.get(pid, 0) + delta
+                if gid is None:
+                    continue
+                if pid is not None:
+                    box_scores[(gid, pid)] = box_scores.get((gid, pid), 0) + delta
+                if tid is not None:
+                    team_scores[(gid, tid)] = team_scores.get((gid, tid), 0) + delta
+        finally:
+            cur.close()
+        return box_scores, team_scores, careers, last_event_ids
+
+    def rebuild(self):
+        """Recomputes game_player_stats, players.points, game scores, wins, standings and snapshots from events."""
+        self.mgr.replaceScoringTotals(*self.replay())
+
+    def correct(self, game_id, player_id, team_id, delta):
+        """Fixes a bad entry by logging a compensating event and replaying."""
+        self.mgr.recordCorrection(game_id, player_id, team_id, delta)
+        self.rebuild()
@@ -0,0 +1,191 @@
+from theDB import *
+
+_GAME_SELECT = """
+    SELECT g.id, g.team1_id, g.team2_id, g.venue_id,
+           t1.teamName AS team1, t2.teamName AS team2, v.venueName AS venue,
+           g.game_date, g.start_time, g.end_time,
+           g.team1_score, g.team2_score, g.is_final, g.winner_team_id, g.season_start_year
+    FROM games g
+    LEFT JOIN teams t1 ON g.team1_id = t1.id
+    LEFT JOIN teams t2 ON g.team2_id = t2.id
+    LEFT JOIN venues v ON g.venue_id = v.id
+"""
+
+class GameRecord:
+    """One scheduled game with its team and venue names.
+
+    Also answers game['field'] and game.get('field') so the tabs' older
+    dict-based code keeps working unchanged.
+    """
+    __slots__ = ("id", "team1_id", "team2_id", "venue_id", "team1", "team2", "venue",
+                 "date", "start", "end", "team1_score", "team2_score", "is_final",
+                 "winner_team_id", "season_start_year", "phase")
+
+    def __init__(self, row):
+        self.id = row['id']
+        self.team1_id = row['team1_id']
+        self.team2_id = row['team2_id']
+        self.venue_id = row['venue_id']
+        self.team1 = row['team1'] or 'Unknown'
+        self.team2 = row['team2'] or 'Unknown'
+        self.venue = row['venue'] or 'Unknown'
+        self.date = row['game_date']
+        self.start = row['start_time'] or '00:00'
+        self.end = row['end_time'] or '00:00'
+        self.team1_score = row['team1_score'] or 0
+        self.team2_score = row['team2_score'] or 0
+        self.is_final = bool(row['is_final'])
+        self.winner_team_id = row['winner_team_id']
+        self.season_start_year = row['season_start_year']
+        self.phase = ""
+
+    @property
+    def sort_key(self):
+        return (self.date or '', self.start, self.id)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in GameRecord.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in GameRecord.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def keys(self):
+        return GameRecord.__slots__
+
+    def __repr__(self):
+        return f"GameRecord(#{self.id} {self.team1} vs {self.team2} {self.date} {self.start})"
+
+
+def _with_phases(records):
+    """Maps records by id, classifying all their dates in one SeasonCalendar call."""
+    records = list(records)
+    for g, (_, phase) in zip(records, season_calendar.classify_many([g.date for g in records])):
+        g.phase = phase or ""
+    return {g.id: g for g in records}
+
+
+class GameStore:
+    """Single in-memory copy of the games-with-names join shared by every tab.
+
+    Loaded once, then patched one row at a time from GameChanged events; a
+    GamesReset (bulk write) or a missed event triggers a full reload on the
+    next read. Team and venue renames are applied in place. `version` changes whenever the contents change.
+    """
+    def __init__(self, db=None):
+        self.db = db
+        self.version = 0
+        self._records = {}
+        self._sorted = None
+        self._by_season = None
+        self._synced_version = None
+
+    def attach(self):
+        bus.subscribe(GameChanged, self._on_games_changed)
+        bus.subscribe(RosterChanged, self._on_roster_changed)
+        bus.subscribe(VenueChanged, self._on_venue_changed)
+        return self
+
+    def load(self):
+        cur = self.db.cursor()
+        try:
+            cur.execute(_GAME_SELECT)
+            self._records = _with_phases(GameRecord(r) for r in cur.fetchall())
+        finally:
+            cur.close()
+        self._synced_version = games_version()
+        self._touch()
+
+    def prime(self, rows, version):
+        """Loads rows fetched elsewhere (e.g. a warm-up thread) if no game write happened since `version`."""
+        if version != games_version() or self._synced_version == version:
+            return False
+        self._records = _with_phases(GameRecord(r) for r in rows)
+        self._synced_version = version
+        self._touch()
+        return True
+
+    def _ensure_loaded(self):
+        if self._synced_version != games_version():
+            self.load()
+
+    def _touch(self):
+        self.version += 1
+        self._sorted = None
+        self._by_season = None
+
+    def _on_games_changed(self, event):
+        if self._synced_version is None:
+            return
+        if isinstance(event, GamesReset) or self._synced_version + 1 != games_version():
+            self._synced_version = None
+            return
+        if isinstance(event, GameDeleted):
+            self._records.pop(event.game_id, None)
+        else:
+            self._upsert(event.game_id)
+        self._synced_version = games_version()
+        self._touch()
+
+    def _upsert(self, game_id):
+        cur = self.db.cursor()
+        try:
+            cur.execute(_GAME_SELECT + " WHERE g.id = ?", (game_id,))
+            r = cur.fetchone()
+        finally:
+            cur.close()
+        if r:
+            self._records[game_id] = GameRecord(r)
+            self._records[game_id].phase = season_calendar.phase_of(r['game_date'])
+        else:
+            self._records.pop(game_id, None)
+
+    def _on_roster_changed(self, event):
+        if event.change == "renamed" and self._synced_version is not None:
+            self.rename_team(event.team_id, event.name)
+
+    def _on_venue_changed(self, event):
+        if event.change == "updated" and self._synced_version is not None:
+            self.rename_venue(event.venue_id, event.name)
+
+    def rename_team(self, team_id, name):
+        self._ensure_loaded()
+        for g in self._records.values():
+            if g.team1_id == team_id: g.team1 = name
+            if g.team2_id == team_id: g.team2 = name
+        self._touch()
+
+    def rename_venue(self, venue_id, name):
+        self._ensure_loaded()
+        for g in self._records.values():
+            if g.venue_id == venue_id: g.venue = name
+        self._touch()
+
+    def get(self, game_id):
+        self._ensure_loaded()
+        return self._records.get(game_id)
+
+    def all(self):
+        """Every game ordered by date and start time. Do not mutate the returned list."""
+        self._ensure_loaded()
+        if self._sorted is None:
+            self._sorted = sorted(self._records.values(), key=lambda g: g.sort_key)
+        return self._sorted
+
+    def by_season(self, season_start_year):
+        """Games of one season (keyed by the season's start year), in date order."""
+        self._ensure_loaded()
+        if self._by_season is None:
+            groups = {}
+            for g in self.all():
+                groups.setdefault(g.season_start_year, []).append(g)
+            self._by_season = groups
+        return self._by_season.get(season_start_year, [])
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._records)
+
+
+game_store = GameStore(mydb).attach()
@@ -0,0 +1,50 @@
+import re
+
+KIND_LABELS = {'team': "Team", 'player': "Player", 'venue': "Venue", 'game': "Game"}
+
+# Relative weight of a match in the title vs the body (bm25 column weights;
+# kind and ref_id are unindexed and weighted 0).
+_BM25 = "bm25(search_index, 0.0, 0.0, 10.0, 1.0)"
+
+class SearchResult:
+    """One ranked hit from the global search."""
+    __slots__ = ("kind", "ref_id", "title", "detail", "score")
+
+    def __init__(self, row):
+        self.kind = row['kind']
+        self.ref_id = row['ref_id']
+        self.title = row['title']
+        self.detail = row['body']
+        self.score = row['score']
+
+    @property
+    def label(self):
+        detail = f" — {self.detail.strip()}" if self.detail and self.detail.strip() else ""
+        return f"{KIND_LABELS.get(self.kind, self.kind)}: {self.title}{detail}"
+
+    def __repr__(self):
+        return f"SearchResult({self.kind} #{self.ref_id} {self.title!r})"
+
+
+def match_expression(query):
+    """Turns free text into an FTS5 query: every word must match, the last one as a prefix."""
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    terms = [f'"{w}"' for w in words[:-1]] + [f'"{words[-1]}"*']
+    return " ".join(terms)
+
+
+def search(conn, query, limit=20, kinds=None):
+    """Ranked SearchResults for query. conn can be `mydb` or a reader from the DB executor."""
+    expr = match_expression(query)
+    if expr is None:
+        return []
+    sql = f"SELECT kind, ref_id, title, body, {_BM25} AS score FROM search_index WHERE search_index MATCH ?"
+    params = [expr]
+    if kinds:
+        sql += f" AND kind IN ({','.join('?' * len(kinds))})"
+        params.extend(kinds)
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+    return [SearchResult(r) for r in conn.execute(sql, params).fetchall()]
@@ -0,0 +1,167 @@
+import json
+import os
+from datetime import datetime, timezone
+from theDB import *
+
+JOURNAL_DIR = DB_FILE.with_name('live_journal')
+
+class ScoreJournal:
+    """Append-only, fsync'd file of point changes not yet written to the database."""
+    def __init__(self, game_id):
+        self.path = JOURNAL_DIR / f"game_{game_id}.jsonl"
+        self._fh = None
+
+    def append(self, seq, player_id, team_id, delta, ts):
+        if self._fh is None:
+            JOURNAL_DIR.mkdir(exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(json.dumps({'seq': seq, 'player_id': player_id, 'team_id': team_id, 'delta': delta, 'ts': ts}) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def read(self):
+        entries = []
+        if not self.path.exists():
+            return entries
+        with open(self.path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break  # torn final line from a crash mid-write
+        return entries
+
+    def clear(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class LiveGameState:
+    """
+    In-memory score state for one game. Clicks update it instantly and are
+    journaled; coalesced per-player deltas are written to SQLite by flush().
+    """
+    def __init__(self, game_id, team1_id, team2_id, mgr=None):
+        self.game_id = game_id
+        self.team1_id = team1_id
+        self.team2_id = team2_id
+        self.mgr = mgr or ScheduleManager()
+        self.journal = ScoreJournal(game_id)
+
+        self.player_points = {}
+        self.team_totals = {team1_id: 0, team2_id: 0}
+        self.is_final = False
+        self.winner_team_id = None
+        self._pending = {}
+        self._pending_events = []
+        self._seq = 0
+
+        last_seq = self._load()
+        self._recover(last_seq)
+
+    def _load(self):
+        cur = mydb.cursor()
+        try:
+            cur.execute("SELECT is_final, winner_team_id FROM games WHERE id = ?", (self.game_id,))
+            row = cur.fetchone()
+            if row:
+                self.is_final = bool(row['is_final'])
+                self.winner_team_id = row['winner_team_id']
+
+            cur.execute("""
+                SELECT p.id, p.team_id, COALESCE(gps.points, 0) as game_points
+                FROM players p
+                LEFT JOIN game_player_stats gps ON p.id = gps.player_id AND gps.game_id = ?
+                WHERE p.team_id IN (?, ?)
+            """, (self.game_id, self.team1_id, self.team2_id))
+            for r in cur.fetchall():
+                self.player_points[r['id']] = r['game_points']
+                self.team_totals[r['team_id']] = self.team_totals.get(r['team_id'], 0) + r['game_points']
+
+            cur.execute("SELECT last_seq FROM live_scoring_state WHERE game_id = ?", (self.game_id,))
+            r = cur.fetchone()
+            return r['last_seq'] if r else 0
+        finally:
+            cur.close()
+
+    def _recover(self, last_seq):
+        self._seq = last_seq
+        entries = self.journal.read()
+        if self.is_final:
+            self.journal.clear()
+            return
+        for e in entries:
+            if e['seq'] > last_seq:
+                self._apply(e['player_id'], e['team_id'], e['delta'], e.get('ts'))
+            self._seq = max(self._seq, e['seq'])
+        if self._pending:
+            print(f"[LiveScoring] Recovered {len(self._pending)} unsaved player score(s) for game #{self.game_id}")
+            self.flush()
+        elif entries:
+            self.journal.clear()
+
+    def _apply(self, player_id, team_id, delta, ts):
+        self.player_points[player_id] = self.player_points.get(player_id, 0) + delta
+        self.team_totals[team_id] = self.team_totals.get(team_id, 0) + delta
+        self._pending[player_id] = self._pending.get(player_id, 0) + delta
+        self._pending_events.append((ts, player_id, team_id, delta))
+
+    def add_points(self, player_id, team_id, delta):
+        """Records a change and returns (player game points, team total). Raises ValueError if not allowed."""
+        if self.is_final:
+            raise ValueError("Game is over.")
+        if self.player_points.get(player_id, 0) + delta < 0:
+            raise ValueError("Cannot reduce points below zero.")
+        self._seq += 1
+        ts = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]  # same format as SQLite's default
+        self.journal.append(self._seq, player_id, team_id, delta, ts)
+        self._apply(player_id, team_id, delta, ts)
+        return self.player_points[player_id], self.team_totals[team_id]
+
+    @property
+    def has_pending(self):
+        return bool(self._pending)
+
+    def flush(self):
+        if not self._pending:
+            return
+        self.mgr.applyScoreDeltas(
+            self.game_id, self._pending,
+            self.team_totals.get(self.team1_id, 0), self.team_totals.get(self.team2_id, 0),
+            last_seq=self._seq, events=self._pending_events,
+        )
+        self._pending = {}
+        self._pending_events = []
+        self.journal.clear()
+
+    def finalize(self):
+        self.flush()
+        self.winner_team_id = self.mgr.endGame(self.game_id)
+        self.is_final = True
+        return self.winner_team_id
+
+
+def recover_pending_journals():
+    """Writes back any journals left behind by a crash or an app closed mid-game."""
+    if not JOURNAL_DIR.exists():
+        return
+    for path in JOURNAL_DIR.glob("game_*.jsonl"):
+        try:
+            game_id = int(path.stem.split("_", 1)[1])
+            cur = mydb.cursor()
+            try:
+                cur.execute("SELECT team1_id, team2_id FROM games WHERE id = ?", (game_id,))
+                row = cur.fetchone()
+            finally:
+                cur.close()
+            if row:
+                LiveGameState(game_id, row['team1_id'], row['team2_id'])
+            else:
+                path.unlink()
+        except Exception as e:
+            print(f"[LiveScoring] Could not recover {path.name}: {e}")
@@ -0,0 +1,116 @@
+from theDB import *
+
+class TeamRating:
+    """A team's current Elo rating and its place in the power rankings."""
+    __slots__ = ("team_id", "teamName", "rating", "games", "rank")
+
+    def __init__(self, row, rank):
+        self.team_id = row['team_id']
+        self.teamName = row['teamName']
+        self.rating = row['rating']
+        self.games = row['games']
+        self.rank = rank
+
+    def __repr__(self):
+        return f"TeamRating(#{self.rank} {self.teamName} {self.rating:.0f})"
+
+
+def win_probability(rating_a, rating_b):
+    """Elo expectation that a team rated rating_a beats one rated rating_b."""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+
+def season_ratings(conn, years):
+    """{season_start_year: {team_id: rating after the team's last rated game that season}}."""
+    years = list(years)
+    if not years:
+        return {}
+    rows = conn.execute(f"""
+        SELECT h.season_start_year, h.team_id, h.rating_after
+        FROM rating_history h
+        JOIN (
+            SELECT season_start_year, team_id, MAX(seq) AS seq FROM rating_history
+            WHERE season_start_year IN ({','.join('?' * len(years))})
+            GROUP BY season_start_year, team_id
+        ) last ON last.team_id = h.team_id AND last.seq = h.seq
+    """, years).fetchall()
+    out = {}
+    for r in rows:
+        out.setdefault(r['season_start_year'], {})[r['team_id']] = r['rating_after']
+    return out
+
+
+class RatingEngine:
+    """
+    Read side of the Elo ratings kept by ScheduleManager (team_ratings and
+    rating_history). The power rankings are cached until a game result
+    changes; rebuild() replays every finalized game.
+    """
+    def __init__(self, db=None, mgr=None):
+        self.db = db
+        self.mgr = mgr
+        self._rankings = None
+
+    def attach(self):
+        bus.subscribe(GameChanged, self._on_games_changed)
+        bus.subscribe(RosterChanged, self._on_roster_changed)
+        return self
+
+    def rankings(self):
+        """Every rated team, best first."""
+        if self._rankings is None:
+            rows = self.db.execute("""
+                SELECT r.team_id, t.teamName, r.rating, r.games
+                FROM team_ratings r JOIN teams t ON t.id = r.team_id
+                ORDER BY r.rating DESC, t.teamName
+            """).fetchall()
+            self._rankings = [TeamRating(r, i) for i, r in enumerate(rows, 1)]
+        return self._rankings
+
+    def rating(self, team_id):
+        """Current rating of a team; unrated teams sit at ELO_INITIAL."""
+        return next((r.rating for r in self.rankings() if r.team_id == team_id), ELO_INITIAL)
+
+    def history(self, team_id, season_start_year=None):
+        """[(game_id, game_date, rating_before, rating_after)] in the order the games were rated."""
+        sql = "SELECT game_id, game_date, rating_before, rating_after FROM rating_history WHERE team_id = ?"
+        params = [team_id]
+        if season_start_year is not None:
+            sql += " AND season_start_year = ?"
+            params.append(season_start_year)
+        rows = self.db.execute(sql + " ORDER BY seq", params).fetchall()
+        return [(r['game_id'], r['game_date'], r['rating_before'], r['rating_after']) for r in rows]
+
+    def rating_on(self, team_id, game_date):
+        """Rating a team carried after its last rated game on or before game_date (ISO)."""
+        row = self.db.execute("""
+            SELECT rating_after FROM rating_history
+            WHERE team_id = ? AND game_date <= ?
+            ORDER BY seq DESC LIMIT 1
+        """, (team_id, game_date)).fetchone()
+        return row['rating_after'] if row else ELO_INITIAL
+
+    def predict(self, team1_id, team2_id):
+        """Probability that team1 beats team2 on current ratings."""
+        return win_probability(self.rating(team1_id), self.rating(team2_id))
+
+    def rebuild(self):
+        rated = (self.mgr or ScheduleManager()).rebuildRatings()
+        self._rankings = None
+        return rated
+
+    def _on_games_changed(self, event):
+        if isinstance(event, ScoreChanged):
+            row = self.db.execute("SELECT is_final FROM games WHERE id = ?", (event.game_id,)).fetchone()
+            if not (row and row['is_final']):
+                return
+        if isinstance(event, GameScheduled):
+            return
+        self._rankings = None
+
+    def _on_roster_changed(self, event):
+        if event.change in ("renamed", "deleted"):
+            self._rankings = None
+
+
+rating_engine = RatingEngine(mydb).attach()
@@ -0,0 +1,90 @@
+import os
+from datetime import date as _date, timedelta
+from theDB import *
+from conflictIndex import _to_minutes
+from scheduleSearch import search
+
+DEFAULT_SLOTS = [("13:00", "15:00"), ("16:00", "18:00"), ("19:00", "21:00")]
+
+
+class ScheduleGenerator:
+    """Builds a conflict-free Regular Season for every team with a full 12-player roster.
+
+    Several randomized candidates are searched in parallel by scheduleSearch
+    worker processes and the best one (fewest unplaced games, then best
+    home/away balance, then the earliest finish) is kept. generate() only
+    reads, so the UI runs it on db_executor; write() belongs on the Tk thread.
+    """
+    def __init__(self, mgr, teams_dict, venue_names, season_start_year, slots=None,
+                 games_per_team=None, min_rest_days=1, candidates=None, workers=None):
+        self.mgr = mgr
+        self.teams_dict = teams_dict
+        self.venue_names = list(venue_names)
+        self.season_start_year = season_start_year
+        self.slots = slots or DEFAULT_SLOTS
+        self.games_per_team = games_per_team
+        self.min_rest_days = min_rest_days
+        self.workers = workers or os.cpu_count() or 1
+        self.candidates = candidates or max(4, self.workers)
+
+    def _resolve(self, conn):
+        names = [t for t, roster in self.teams_dict.items() if len(roster) == 12]
+        cur = conn.cursor()
+        try:
+            team_ids = []
+            if names:
+                cur.execute(f"SELECT id FROM teams WHERE teamName IN ({','.join(['?'] * len(names))}) ORDER BY teamName", names)
+                team_ids = [r['id'] for r in cur.fetchall()]
+            venue_ids = []
+            if self.venue_names:
+                cur.execute(f"SELECT id FROM venues WHERE venueName IN ({','.join(['?'] * len(self.venue_names))}) ORDER BY venueName", self.venue_names)
+                venue_ids = [r['id'] for r in cur.fetchall()]
+        finally:
+            cur.close()
+        return team_ids, venue_ids
+
+    def _season_dates(self):
+        start, end = Season().phase_window("Regular Season", self.season_start_year)
+        start = max(start, _date.today() + timedelta(days=1))
+        days = (end - start).days + 1
+        return [(start + timedelta(days=i)).isoformat() for i in range(max(days, 0))]
+
+    def _existing_games(self, conn, dates):
+        if not dates: return []
+        cur = conn.cursor()
+        try:
+            cur.execute("""
+                SELECT id, team1_id, team2_id, venue_id, game_date, start_time, end_time
+                FROM games WHERE game_date BETWEEN ? AND ?
+            """, (dates[0], dates[-1]))
+            return [(r['id'], r['team1_id'], r['team2_id'], r['venue_id'], r['game_date'],
+                     _to_minutes(r['start_time'] or "00:00"), _to_minutes(r['end_time'] or "00:00"))
+                    for r in cur.fetchall()]
+        finally:
+            cur.close()
+
+    def generate(self, conn=None):
+        """Returns (games, unplaced) where games are (team1_id, team2_id, venue_id, date, start, end) tuples."""
+        conn = conn or self.mgr.mydb
+        team_ids, venue_ids = self._resolve(conn)
+        if len(team_ids) < 2: raise ValueError("Need at least 2 teams with full 12-player rosters.")
+        if not venue_ids: raise ValueError("Need at least one available venue.")
+        dates = self._season_dates()
+        if not dates: raise ValueError("The Regular Season window for this year has already passed.")
+
+        games_per_team = self.games_per_team or 2 * (len(team_ids) - 1)
+        slots = [(_to_minutes(s), _to_minutes(e)) for s, e in self.slots]
+        existing = self._existing_games(conn, dates)
+        jobs = [(seed, team_ids, venue_ids, slots, dates, games_per_team, self.min_rest_days, existing)
+                for seed in range(self.candidates)]
+
+        results = search(jobs, self.workers)
+
+        (unplaced, _, _), placed = min(results, key=lambda r: r[0])
+        games = [(h, a, v, d, f"{s // 60:02d}:{s % 60:02d}", f"{e // 60:02d}:{e % 60:02d}")
+                 for h, a, v, d, s, e in placed]
+        games.sort(key=lambda g: (g[3], g[4]))
+        return games, unplaced
+
+    def write(self, games):
+        return self.mgr.scheduleGames(games)
@@ -0,0 +1,137 @@
+"""
+Candidate search for ScheduleGenerator. Deliberately free of theDB: jobs are
+plain tuples (ids, minute slots, ISO dates, existing bookings) and
+_build_candidate only needs this module and conflictIndex, so the process
+pool workers never touch the database.
+"""
+import multiprocessing
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from conflictIndex import ConflictIndex
+
+def _round_robin_rounds(team_ids):
+    """Circle-method single round robin: n-1 rounds (n rounds when n is odd)."""
+    ts = list(team_ids)
+    if len(ts) % 2:
+        ts.append(None)
+    n = len(ts)
+    rounds = []
+    for r in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            a, b = ts[i], ts[n - 1 - i]
+            if a is None or b is None: continue
+            pairs.append((a, b) if (r + i) % 2 == 0 else (b, a))
+        rounds.append(pairs)
+        ts = [ts[0], ts[-1]] + ts[1:-1]
+    return rounds
+
+def _season_pairings(team_ids, games_per_team):
+    """Repeats the round robin (flipping home/away each cycle) until every team has games_per_team games."""
+    base = _round_robin_rounds(team_ids)
+    counts = {t: 0 for t in team_ids}
+    rounds = []
+    cycle = 0
+    while any(c < games_per_team for c in counts.values()):
+        added = 0
+        for pairs in base:
+            round_games = []
+            for a, b in pairs:
+                if counts[a] >= games_per_team or counts[b] >= games_per_team: continue
+                round_games.append((b, a) if cycle % 2 else (a, b))
+                counts[a] += 1
+                counts[b] += 1
+                added += 1
+            if round_games:
+                rounds.append(round_games)
+        cycle += 1
+        if not added:
+            break
+    return rounds
+
+def _build_candidate(args):
+    """Greedy placement of one shuffled pairing order."""
+    seed, team_ids, venue_ids, slots, dates, games_per_team, min_rest_days, existing = args
+    rng = random.Random(seed)
+    order = list(team_ids)
+    rng.shuffle(order)
+    engine = ConflictIndex.from_rows(existing)
+    gap = min_rest_days + 1
+
+    last_day = {}
+    balance = {t: 0 for t in team_ids}
+    placed = []
+    unplaced = 0
+
+    for round_games in _season_pairings(order, games_per_team):
+        for home, away in round_games:
+            if balance[home] > balance[away]:
+                home, away = away, home
+            day = max(last_day.get(home, -gap), last_day.get(away, -gap)) + gap
+            booked = False
+            while day < len(dates) and not booked:
+                venue_order = list(venue_ids)
+                rng.shuffle(venue_order)
+                for s_min, e_min in slots:
+                    for vid in venue_order:
+                        if engine.check_batch([(home, away, vid, dates[day], s_min, e_min)], keep=True)[0] is None:
+                            placed.append((home, away, vid, dates[day], s_min, e_min))
+                            booked = True
+                            break
+                    if booked: break
+                if not booked:
+                    day += 1
+            if booked:
+                last_day[home] = last_day[away] = day
+                balance[home] += 1
+                balance[away] -= 1
+            else:
+                unplaced += 1
+
+    imbalance = sum(abs(b) for b in balance.values())
+    last = max(last_day.values()) if last_day else 0
+    return (unplaced, imbalance, last), placed
+
+
+def _pool_context():
+    # forkserver workers fork from a single-threaded server rather than from
+    # the app, whose DbExecutor threads would otherwise be copied mid-flight.
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["scheduleSearch"])
+    return ctx
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _get_pool(workers):
+    """The shared process pool, started on first use and kept so later searches skip worker start-up."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool[0] != workers:
+            if _pool is not None:
+                _pool[1].shutdown(wait=False)
+            _pool = (workers, ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()))
+        return _pool[1]
+
+def _drop_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool[1].shutdown(wait=False)
+        _pool = None
+
+def search(jobs, workers):
+    """Runs every job across up to `workers` processes (in-process for one); returns one (key, placed) per job."""
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        return [_build_candidate(job) for job in jobs]
+    try:
+        return list(_get_pool(workers).map(_build_candidate, jobs))
+    except (OSError, BrokenProcessPool) as e:
+        _drop_pool()
+        print(f"[ScheduleSearch] process pool unavailable ({e}); searching in-process")
+        return [_build_candidate(job) for job in jobs]
@@ -0,0 +1,162 @@
+from theDB import *
+from standingsEngine import standings_engine
+
+FULL_ROSTER = 12
+
+def _season_input(year_str):
+    """Season start year for the schedule form's Year field (the year the season ends in)."""
+    try:
+        return int(str(year_str).strip()) - 1
+    except ValueError:
+        return None
+
+
+class SeedingState:
+    """Regular-season ranks of one season and everything the schedule form derives from them."""
+    def __init__(self, season_start_year, ranks, playin_results):
+        self.season_start_year = season_start_year
+        self.ranks = ranks
+        self.playin_results = playin_results
+        self.playin_pairs = self._playin_pairs() if len(ranks) >= 10 else []
+
+    def _result(self, id_a, id_b):
+        winner = self.playin_results.get(frozenset((id_a, id_b)))
+        if winner is None: return False, None, None
+        return True, winner, (id_b if winner == id_a else id_a)
+
+    def _playin_pairs(self):
+        """Play-in games still to be played: 7v8 and 9v10, then the loser of 7v8 against the winner of 9v10."""
+        seed7, seed8, seed9, seed10 = self.ranks[6:10]
+        get_result = self._result
+
+        g78_done, _, g78_lose = get_result(seed7['id'], seed8['id'])
+        g910_done, g910_win, _ = get_result(seed9['id'], seed10['id'])
+
+        pairs = []
+        if not g78_done: pairs.append((seed7['name'], seed8['name']))
+        if not g910_done: pairs.append((seed9['name'], seed10['name']))
+
+        if g78_done and g910_done:
+            gLast_done, _, _ = get_result(g78_lose, g910_win)
+            if not gLast_done:
+                l78 = next((t['name'] for t in self.ranks if t['id'] == g78_lose), "Unknown")
+                w910 = next((t['name'] for t in self.ranks if t['id'] == g910_win), "Unknown")
+                pairs.append((l78, w910))
+        return pairs
+
+    def playoff_seeds(self):
+        """Team ids of playoff seeds 1-8 (None where the play-in is undecided), or None with fewer than 8 teams."""
+        if len(self.ranks) < 8:
+            return None
+        seeds = [r['id'] for r in self.ranks[:8]]
+        if len(self.ranks) >= 10:
+            seed7, seed8, seed9, seed10 = (r['id'] for r in self.ranks[6:10])
+            g78_done, g78_win, g78_lose = self._result(seed7, seed8)
+            g910_done, g910_win, _ = self._result(seed9, seed10)
+            last_done, last_win, _ = self._result(g78_lose, g910_win) if g78_done and g910_done else (False, None, None)
+            seeds[6] = g78_win if g78_done else None
+            seeds[7] = last_win if last_done else None
+        return seeds
+
+    def team_name(self, team_id):
+        return next((r['name'] for r in self.ranks if r['id'] == team_id), "Unknown")
+
+    def playin_opponents(self, team_name):
+        return [b if a == team_name else a for a, b in self.playin_pairs if team_name in (a, b)]
+
+    def team1_options(self, phase):
+        """Play-in Team 1 choices, or a single placeholder explaining why there are none.
+
+        Playoff and Finals choices come from BracketEngine; other phases return None.
+        """
+        if phase != "Play-in":
+            return None
+        if len(self.ranks) < 10: return ["Need 10+ Teams"]
+        if not self.playin_pairs: return ["All Matches Played"]
+        return sorted({name for pair in self.playin_pairs for name in pair})
+
+
+class SeedingEngine:
+    """
+    Memoized seeding for the schedule form.
+
+    One SeedingState per season start year, ranked by the standings
+    engine's tiebroken Regular Season table plus one play-in query, and
+    reused until a game of that season is finalized, deleted, or has its
+    final score or date changed. The set of full-roster teams is part of
+    the key, so roster changes recompute too.
+    """
+    def __init__(self, db=None):
+        self.db = db
+        self._states = {}
+
+    def attach(self):
+        bus.subscribe(GameChanged, self._on_games_changed)
+        return self
+
+    def state(self, year_str, teams_dict):
+        """SeedingState for the Year field's season, or None when the year is not a number."""
+        season = _season_input(year_str)
+        if season is None:
+            return None
+        eligible = tuple(sorted(name for name, roster in teams_dict.items() if len(roster) == FULL_ROSTER))
+        cached = self._states.get(season)
+        if cached is not None and cached[0] == eligible:
+            return cached[1]
+        state = self._compute(season, eligible)
+        self._states[season] = (eligible, state)
+        return state
+
+    def _compute(self, season, eligible):
+        if not eligible:
+            return SeedingState(season, [], {})
+        wanted = set(eligible)
+        table = standings_engine.standings(season, "Regular Season")
+        ranks = [{'id': r.id, 'name': r.teamName} for r in table.rows if r.teamName in wanted]
+        cur = self.db.cursor()
+        try:
+            missing = sorted(wanted - {r['name'] for r in ranks})
+            if missing:
+                # Full-roster teams without a Regular Season game rank last.
+                cur.execute(f"SELECT id, teamName FROM teams WHERE teamName IN ({','.join('?' * len(missing))}) ORDER BY teamName", missing)
+                ranks.extend({'id': r['id'], 'name': r['teamName']} for r in cur.fetchall())
+            results = {}
+            if len(ranks) >= 10:
+                pi_start, pi_end = season_calendar.phase_range("Play-in", season + 1)
+                ids = [r['id'] for r in ranks[6:10]]
+                marks = ','.join('?' * len(ids))
+                cur.execute(f"""
+                    SELECT team1_id, team2_id, winner_team_id FROM games
+                    WHERE team1_id IN ({marks}) AND team2_id IN ({marks})
+                      AND game_date BETWEEN ? AND ? AND is_final = 1
+                    ORDER BY game_date, start_time, id
+                """, ids + ids + [pi_start.isoformat(), pi_end.isoformat()])
+                for r in cur.fetchall():
+                    results.setdefault(frozenset((r['team1_id'], r['team2_id'])), r['winner_team_id'])
+        finally:
+            cur.close()
+        return SeedingState(season, ranks, results)
+
+    def invalidate(self, season=None):
+        if season is None:
+            self._states.clear()
+        else:
+            self._states.pop(season, None)
+
+    def _on_games_changed(self, event):
+        if isinstance(event, GameScheduled):
+            return
+        if isinstance(event, GamesReset):
+            self.invalidate()
+            return
+        if isinstance(event, (ScoreChanged, GameUpdated)) and not self._is_final(event.game_id):
+            return
+        for season in event.seasons:
+            self.invalidate(season)
+
+    def _is_final(self, game_id):
+        row = self.db.execute("SELECT is_final FROM games WHERE id = ?", (game_id,)).fetchone()
+        return bool(row and row['is_final'])
+
+
+seeding_engine = SeedingEngine(mydb).attach()
@@ -0,0 +1,252 @@
+from theDB import *
+
+# Records come precomputed from team_season_standings, which ScheduleManager
+# keeps current in the same transaction as every game write.
+_TOTALS_SQL = """
+    SELECT team_id, SUM(wins) AS wins, SUM(losses) AS losses, SUM(ties) AS ties,
+           SUM(points_for) AS points_for, SUM(points_against) AS points_against
+    FROM team_season_standings
+    WHERE season_year = ? {phase}
+    GROUP BY team_id
+"""
+
+# The head-to-head matrix for the tiebreakers: one row per (team1, team2)
+# orientation. Finals only count toward the results, but every scheduled
+# pairing is returned so teams without a result still appear.
+_MATCHUP_SQL = """
+    SELECT team1_id, team2_id,
+           SUM(is_final) AS games,
+           SUM(is_final AND winner_team_id = team1_id) AS wins1,
+           SUM(is_final AND winner_team_id = team2_id) AS wins2,
+           SUM(CASE WHEN is_final THEN COALESCE(team1_score, 0) ELSE 0 END) AS pts1,
+           SUM(CASE WHEN is_final THEN COALESCE(team2_score, 0) ELSE 0 END) AS pts2
+    FROM games
+    WHERE season_start_year = ? AND game_date BETWEEN ? AND ?
+      AND team1_id IS NOT NULL AND team2_id IS NOT NULL
+    GROUP BY team1_id, team2_id
+"""
+
+TIEBREAKERS = ("head-to-head", "point differential", "common opponents", "points scored")
+
+
+class HeadToHead:
+    """Team x team results of one season: games[i][j], wins[i][j] and points[i][j] (scored by i against j)."""
+    def __init__(self, team_ids, rows):
+        self.team_ids = list(team_ids)
+        self.index = {tid: i for i, tid in enumerate(self.team_ids)}
+        n = len(self.team_ids)
+        self.games = [[0] * n for _ in range(n)]
+        self.wins = [[0] * n for _ in range(n)]
+        self.points = [[0] * n for _ in range(n)]
+        for r in rows:
+            a, b = self.index[r['team1_id']], self.index[r['team2_id']]
+            for i, j, w, pf in ((a, b, r['wins1'], r['pts1']), (b, a, r['wins2'], r['pts2'])):
+                self.games[i][j] += r['games'] or 0
+                self.wins[i][j] += w or 0
+                self.points[i][j] += pf or 0
+
+    def record(self, team_id, opponents):
+        """(wins, games) of team_id against the given opponent ids."""
+        i = self.index[team_id]
+        cols = [self.index[o] for o in opponents if o != team_id]
+        return sum(self.wins[i][j] for j in cols), sum(self.games[i][j] for j in cols)
+
+    def opponents(self, team_id):
+        i = self.index[team_id]
+        return {self.team_ids[j] for j, g in enumerate(self.games[i]) if g}
+
+
+class StandingRow:
+    """One team's line in a season table; totals is its team_season_standings row (None before a finished game).
+
+    Also answers row['field'] like the sqlite rows it replaces.
+    """
+    __slots__ = ("id", "teamName", "wins", "losses", "ties", "total_pts", "points_against", "rank", "tiebreak")
+
+    def __init__(self, team_id, name, totals=None):
+        self.id = team_id
+        self.teamName = name
+        self.wins = totals['wins'] if totals else 0
+        self.losses = totals['losses'] if totals else 0
+        self.ties = totals['ties'] if totals else 0
+        self.total_pts = totals['points_for'] if totals else 0
+        self.points_against = totals['points_against'] if totals else 0
+        self.rank = None
+        self.tiebreak = None
+
+    @property
+    def games(self):
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_pct(self):
+        return (self.wins + 0.5 * self.ties) / self.games if self.games else 0.0
+
+    @property
+    def point_diff(self):
+        return self.total_pts - self.points_against
+
+    def __getitem__(self, key):
+        if key not in StandingRow.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f"StandingRow(#{self.rank} {self.teamName} {self.wins}-{self.losses})"
+
+
+def _pct(wins, games):
+    return wins / games if games else 0.5
+
+
+class SeasonStandings:
+    """
+    Ranked table of one season (optionally one phase). Teams are ordered by
+    win percentage; a tied group is split by the first of TIEBREAKERS that
+    separates it, and every smaller group that remains restarts from the
+    top of the list. Groups nothing separates stay in name order.
+    """
+    def __init__(self, season_start_year, phase, h2h, names, totals):
+        self.season_start_year = season_start_year
+        self.phase = phase
+        self.h2h = h2h
+        self._rows = {tid: StandingRow(tid, names.get(tid, "Unknown"), totals.get(tid)) for tid in h2h.team_ids}
+        self.rows = []
+        for _, group in self._buckets(list(self._rows), lambda t: self._rows[t].win_pct):
+            self.rows.extend(self._rows[t] for t in self._break(group))
+        for rank, row in enumerate(self.rows, 1):
+            row.rank = rank
+
+    @staticmethod
+    def _buckets(team_ids, key):
+        values = {t: key(t) for t in team_ids}
+        groups = {}
+        for t in team_ids:
+            groups.setdefault(values[t], []).append(t)
+        return sorted(groups.items(), key=lambda kv: -kv[0])
+
+    def _criteria(self, group):
+        h2h = self.h2h
+        members = set(group)
+        common = set.intersection(*(h2h.opponents(t) for t in group)) - members
+        return (
+            lambda t: _pct(*h2h.record(t, members)),
+            lambda t: self._rows[t].point_diff,
+            lambda t: _pct(*h2h.record(t, common)),
+            lambda t: self._rows[t].total_pts,
+        )
+
+    def _break(self, group):
+        if len(group) == 1:
+            return group
+        for name, key in zip(TIEBREAKERS, self._criteria(group)):
+            buckets = self._buckets(group, key)
+            if len(buckets) > 1:
+                for t in group:
+                    self._rows[t].tiebreak = name
+                ordered = []
+                for _, sub in buckets:
+                    ordered.extend(self._break(sub))
+                return ordered
+        return sorted(group, key=lambda t: self._rows[t].teamName.lower())
+
+    def row(self, team_id):
+        return self._rows.get(team_id)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+
+def compute_standings(conn, season_start_year, phase=None):
+    """
+    Builds SeasonStandings from the precomputed totals plus one grouped
+    matchup query for the tiebreakers; safe to call from a DB executor thread.
+    """
+    if phase:
+        start, end = season_calendar.phase_window(phase, season_start_year)
+        totals = conn.execute(_TOTALS_SQL.format(phase="AND phase = ?"), (season_start_year, phase)).fetchall()
+    else:
+        start, end = season_calendar.window(season_start_year)
+        totals = conn.execute(_TOTALS_SQL.format(phase=""), (season_start_year,)).fetchall()
+    totals = {r['team_id']: r for r in totals}
+    rows = conn.execute(_MATCHUP_SQL, (season_start_year, start.isoformat(), end.isoformat())).fetchall()
+    team_ids = sorted({r['team1_id'] for r in rows} | {r['team2_id'] for r in rows} | set(totals))
+    names = {}
+    if team_ids:
+        marks = ','.join('?' * len(team_ids))
+        names = {r['id']: r['teamName'] for r in
+                 conn.execute(f"SELECT id, teamName FROM teams WHERE id IN ({marks})", team_ids).fetchall()}
+    return SeasonStandings(season_start_year, phase, HeadToHead(team_ids, rows), names, totals)
+
+
+class StandingsEngine:
+    """
+    Cache of SeasonStandings keyed by (season, phase). A season's tables are
+    dropped when one of its games is scheduled, moved, deleted or
+    finalized, or a final score is corrected; live scoring of unfinished
+    games leaves them alone. version(season) lets off-thread callers detect
+    that a season changed while they were computing.
+    """
+    def __init__(self, db=None):
+        self.db = db
+        self._tables = {}
+        self._versions = {}
+        self._epoch = 0
+
+    def attach(self):
+        bus.subscribe(GameChanged, self._on_games_changed)
+        bus.subscribe(RosterChanged, self._on_roster_changed)
+        return self
+
+    def version(self, season):
+        return (self._epoch, self._versions.get(season, 0))
+
+    def cached(self, season, phase=None):
+        return self._tables.get((season, phase))
+
+    def store(self, table, version):
+        if version != self.version(table.season_start_year):
+            return False
+        self._tables[(table.season_start_year, table.phase)] = table
+        return True
+
+    def standings(self, season, phase=None):
+        """Synchronous lookup on the shared connection, filling the cache."""
+        table = self.cached(season, phase)
+        if table is None:
+            version = self.version(season)
+            table = compute_standings(self.db, season, phase)
+            self.store(table, version)
+        return table
+
+    def invalidate(self, season=None):
+        if season is None:
+            self._epoch += 1
+            self._tables.clear()
+            return
+        self._versions[season] = self._versions.get(season, 0) + 1
+        for key in [k for k in self._tables if k[0] == season]:
+            del self._tables[key]
+
+    def _on_games_changed(self, event):
+        if isinstance(event, GamesReset):
+            self.invalidate()
+            return
+        if isinstance(event, ScoreChanged) and not self._is_final(event.game_id):
+            return
+        for season in event.seasons:
+            self.invalidate(season)
+
+    def _on_roster_changed(self, event):
+        if event.change in ("renamed", "deleted"):
+            self.invalidate()
+
+    def _is_final(self, game_id):
+        row = self.db.execute("SELECT is_final FROM games WHERE id = ?", (game_id,)).fetchone()
+        return bool(row and row['is_final'])
+
+
+standings_engine = StandingsEngine(mydb).attach()
@@ -1,645 +1,899 @@
-import customtkinter as ctk
-from tkinter import messagebox
-from theDB import *
-
-app = None
-sched_mgr = None
-refs = {}
-
-load_scheduled_games_from_db = lambda: None
-refresh_scheduled_games_table = lambda *a, **k: None
-update_schedule_optionmenus = lambda *a, **k: None
-refresh_standings_table = lambda *a, **k: None 
-
-teams_cache = {}
-
-class TeamSidebarManager:
-    def __init__(self):
-        self.buttons_list = []
-
-    def load_data(self):
-        teams_cache.clear()
-        cur = sched_mgr.mydb.cursor()
-        try:
-            cur.execute("SELECT id, teamName FROM teams ORDER BY teamName")
-            rows = cur.fetchall()
-            for r in rows:
-                teams_cache[r['teamName']] = []
-                pc = sched_mgr.mydb.cursor()
-                pc.execute("SELECT id, name, jerseyNumber FROM players WHERE team_id = ? ORDER BY CAST(jerseyNumber AS INTEGER) ASC", (r['id'],))
-                players = []
-                for p in pc.fetchall():
-                    pid = p['id'] if 'id' in p.keys() else p[0]
-                    name = p['name'] if 'name' in p.keys() else p[1]
-                    jersey = p['jerseyNumber'] if 'jerseyNumber' in p.keys() else p[2]
-                    players.append({'id': pid, 'name': name, 'jersey': jersey})
-                teams_cache[r['teamName']] = players
-                pc.close()
-        finally:
-            cur.close()
-
-    def refresh_sidebar_ui(self, scroll_frame, players_area, search_var=None):
-        for btn in list(self.buttons_list):
-            try:
-                btn.destroy()
-            except Exception:
-                pass
-        self.buttons_list.clear()
-
-        team_names = list(teams_cache.keys())
-
-        if search_var and search_var.get().strip():
-            query = search_var.get().strip().lower()
-            filtered = []
-            for t in team_names:
-                if query in t.lower():
-                    filtered.append(t)
-                    continue
-                
-                for p in teams_cache.get(t, []):
-                    p_name = p['name'] if isinstance(p, dict) else str(p)
-                    if query in p_name.lower():
-                        filtered.append(t)
-                        break
-            team_names = filtered
-
-        team_names.sort()
-
-        for t in team_names:
-            b = ctk.CTkButton(
-                scroll_frame,
-                text=f"🏆 {t}",
-                width=220,
-                height=35,
-                command=lambda name=t: _show_team_wrapper(name, players_area),
-                hover_color="#4A90E2",
-                fg_color="#2E2E2E"
-            )
-            b.pack(padx=8, pady=4, fill="x")
-            self.buttons_list.append(b)
-        
-        if refs and 'teams_buttons' in refs:
-            refs['teams_buttons'] = self.buttons_list
-
-class TeamRosterViewer:
-    def __init__(self, parent_frame):
-        self.parent = parent_frame
-
-    def display_team(self, team_name):
-        try:
-            if isinstance(refs, dict):
-                refs['current_team'] = team_name
-        except Exception:
-            pass
-
-        for w in self.parent.winfo_children():
-            w.destroy()
-
-        title = ctk.CTkLabel(self.parent, text=f"🏆 Team: {team_name}", font=ctk.CTkFont(size=18, weight="bold"))
-        title.pack(pady=(8, 6))
-
-        actions_frame = ctk.CTkFrame(self.parent, fg_color="#1F1F1F")
-        actions_frame.pack(fill="x", padx=12, pady=(0,6))
-
-        edit_btn = ctk.CTkButton(actions_frame, text="Edit Team", width=120, fg_color="#FFA500", hover_color="#FFB86B", 
-                                 command=lambda: open_add_team_popup(prefill_name=team_name))
-        edit_btn.pack(side="right", padx=(6,0))
-
-        del_btn = ctk.CTkButton(actions_frame, text="Delete Team", width=120, fg_color="#D9534F", hover_color="#FF6B6B", 
-                                command=lambda: self._delete_team_logic(team_name))
-        del_btn.pack(side="right", padx=(6,0))
-
-        history_btn = ctk.CTkButton(actions_frame, text="View Games", width=120, fg_color="#1F75FE", hover_color="#4A90E2", 
-                                    command=lambda: open_team_history_popup(team_name))
-        history_btn.pack(side="right", padx=(6,0))
-
-        header_row = ctk.CTkFrame(self.parent, fg_color="#222222")
-        header_row.pack(fill="x", padx=12, pady=(6,2))
-        ctk.CTkLabel(header_row, text="Player", anchor="w").pack(side="left", padx=(6,0))
-        ctk.CTkLabel(header_row, text="Actions", anchor="e").pack(side="right", padx=(0,26))
-
-        scroll_area = ctk.CTkScrollableFrame(self.parent, fg_color="transparent")
-        scroll_area.pack(fill="both", expand=True, padx=8, pady=2)
-
-        self._render_player_list(team_name, scroll_area)
-
-        self._render_add_player_form(team_name)
-
-    def _render_player_list(self, team_name, scroll_area):
-        search_query = ""
-        try:
-            if refs.get('teams_search_var'):
-                search_query = refs['teams_search_var'].get().strip().lower()
-        except Exception:
-            pass
-        
-        filter_active = False
-        if search_query and (search_query not in team_name.lower()):
-            filter_active = True
-
-        if teams_cache.get(team_name):
-            visible_count = 0
-            for p in teams_cache[team_name]:
-                name = p.get('name')
-                jersey = p.get('jersey')
-                pid = p.get('id')
-
-                if filter_active and search_query not in name.lower():
-                    continue
-                
-                visible_count += 1
-                self._create_player_row(scroll_area, team_name, pid, name, jersey)
-
-            if visible_count == 0 and filter_active:
-                ctk.CTkLabel(scroll_area, text=f"No players match '{search_query}'", text_color="#BBBBBB").pack(pady=6)
-        else:
-            ctk.CTkLabel(scroll_area, text="(No players yet)", text_color="#BBBBBB").pack(pady=6)
-
-    def _create_player_row(self, container, team_name, pid, name, jersey):
-        row = ctk.CTkFrame(container, fg_color="#333333")
-        row.pack(fill="x", pady=2)
-        
-        ctk.CTkLabel(row, text=(f"#{jersey} " if jersey is not None else ""), anchor="e").pack(side="left", padx=(0,6))
-        ctk.CTkLabel(row, text=name, anchor="w").pack(side="left", padx=(6,0))
-
-        btns = ctk.CTkFrame(row, fg_color="#333333")
-        btns.pack(side="right", padx=(6,6))
-
-        edit_btn = ctk.CTkButton(btns, text="Edit", width=60, height=26, hover_color="#FFA500",
-                                 command=lambda: self._edit_player_popup(team_name, pid, name, jersey))
-        edit_btn.pack(side="left", padx=(0,6))
-        
-        del_btn = ctk.CTkButton(btns, text="Del", width=60, height=26, hover_color="#FF6B6B",
-                                command=lambda: self._delete_player_logic(team_name, pid, name))
-        del_btn.pack(side="left")
-
-    def _render_add_player_form(self, team_name):
-        add_frame = ctk.CTkFrame(self.parent, fg_color="#333333")
-        add_frame.pack(pady=12, padx=8, fill="x")
-
-        jersey_entry = ctk.CTkEntry(add_frame, placeholder_text="Jersey #", width=80)
-        jersey_entry.pack(side="left", padx=(6,8), pady=8)
-
-        entry = ctk.CTkEntry(add_frame, placeholder_text="Player name")
-        entry.pack(side="left", expand=True, fill="x", padx=(8, 6), pady=8)
-
-        def do_add(event=None):
-            self._add_player_logic(team_name, entry, jersey_entry)
-
-        jersey_entry.bind("<Return>", do_add)
-        entry.bind("<Return>", do_add)
-
-        add_btn = ctk.CTkButton(add_frame, text="Add Player", command=do_add, width=100, hover_color="#4A90E2")
-        add_btn.pack(side="right", padx=(6, 8), pady=8)
-
-    def _delete_team_logic(self, team_name):
-        if not messagebox.askyesno("Delete Team", f"Are you sure you want to delete the team '{team_name}'? This will remove the team and may remove scheduled games."):
-            return
-        cur = sched_mgr.mydb.cursor()
-        try:
-            cur.execute("SELECT id FROM teams WHERE teamName = ?", (team_name,))
-            row = cur.fetchone()
-            if not row:
-                messagebox.showwarning("Not found", "Team not found in database.")
-                return
-            team_id = row['id']
-            cur.execute("SELECT COUNT(*) FROM games WHERE team1_id = ? OR team2_id = ?", (team_id, team_id))
-            cnt = cur.fetchone()[0]
-            if cnt and cnt > 0:
-                if not messagebox.askyesno("Team Has Games", f"Team has {cnt} scheduled game(s). Delete those games and the team? This cannot be undone."):
-                    return
-                cur.execute("DELETE FROM games WHERE team1_id = ? OR team2_id = ?", (team_id, team_id))
-            cur.execute("DELETE FROM players WHERE team_id = ?", (team_id,))
-            cur.execute("DELETE FROM teams WHERE id = ?", (team_id,))
-            sched_mgr.mydb.commit()
-        finally:
-            cur.close()
-
-        teams_cache.pop(team_name, None)
-        
-        try:
-            from standingsTab import standings as _standings
-            _standings.pop(team_name, None)
-        except Exception:
-            pass
-
-        load_scheduled_games_from_db()
-        refresh_scheduled_games_table(refs.get('scheduled_games_table'))
-        try:
-            if refs.get('standings_table'):
-                refresh_standings_table(refs.get('standings_table'))
-        except Exception as e:
-            print(f"Error refreshing standings: {e}")
-
-        try:
-            _sidebar_mgr.load_data()
-            _sidebar_mgr.refresh_sidebar_ui(refs.get('teams_sidebar_scroll'), refs.get('team_players_area'), refs.get('teams_search_var'))
-        except Exception:
-            pass
-        
-        for w in self.parent.winfo_children(): w.destroy()
-
-    def _delete_player_logic(self, team_name, pid, pname):
-        if not messagebox.askyesno("Delete Player", f"Delete player '{pname}'?"):
-            return
-        cur = sched_mgr.mydb.cursor()
-        try:
-            cur.execute("DELETE FROM players WHERE id = ?", (pid,))
-            sched_mgr.mydb.commit()
-        finally:
-            cur.close()
-        
-        _sidebar_mgr.load_data()
-        self.display_team(team_name)
-        update_schedule_optionmenus(refs.get('tab3_team1_opt'), refs.get('tab3_team2_opt'), refs.get('tab3_venue_opt'))
-
-    def _add_player_logic(self, team_name, name_entry, jersey_entry):
-        name = name_entry.get().strip()
-        if not name:
-            messagebox.showwarning("Missing", "Enter a player name.")
-            return
-
-        if len(name) > 50:
-            messagebox.showwarning("Invalid", "Player name must be 50 characters or fewer.")
-            return
-            
-        if any(char.isdigit() for char in name):
-            messagebox.showwarning("Invalid", "Player name cannot contain numbers.")
-            return
-
-        jersey_text = jersey_entry.get().strip()
-        if jersey_text == "":
-            messagebox.showwarning("Missing", "Jersey number is required.")
-            return
-        if not jersey_text.isdigit():
-            messagebox.showwarning("Invalid", "Jersey number must be an integer between 1 and 99.")
-            return
-
-        jersey_num = int(jersey_text)
-        if jersey_num < 1 or jersey_num > 99:
-            messagebox.showwarning("Invalid", "Jersey number must be between 1 and 99.")
-            return
-
-        cur = sched_mgr.mydb.cursor()
-        try:
-            cur.execute("SELECT id FROM teams WHERE teamName = ?", (team_name,))
-            row = cur.fetchone()
-            if not row:
-                messagebox.showwarning("Error", "Team not found in database.")
-                return
-            team_id = row['id']
-        finally:
-            cur.close()
-
-        cur2 = sched_mgr.mydb.cursor()
-        try:
-            cur2.execute("SELECT COUNT(*) FROM players WHERE team_id = ? AND jerseyNumber = ?", (team_id, jersey_num))
-            cnt = cur2.fetchone()[0]
-            if cnt > 0:
-                messagebox.showwarning("Duplicate", f"Jersey number #{jersey_num} is already taken on this team.")
-                return
-        finally:
-            cur2.close()
-
-        try:
-            team_obj = Team(team_name, team_id)
-            player_obj = Player(name, jersey_num)
-            team_obj.addPlayer(player_obj)
-        except Exception as e:
-            messagebox.showwarning("Error", f"Could not add player: {e}")
-            return
-
-        _sidebar_mgr.load_data()
-        name_entry.delete(0, "end")
-        jersey_entry.delete(0, "end")
-        jersey_entry.focus_set()
-
-        self.display_team(team_name)
-        update_schedule_optionmenus(refs.get('tab3_team1_opt'), refs.get('tab3_team2_opt'), refs.get('tab3_venue_opt'))
-
-    def _edit_player_popup(self, team_name, pid, pname, pjersey):
-        win = ctk.CTkToplevel(app)
-        win.title("Edit Player")
-        win.geometry("360x260")
-        win.transient(app)
-
-        ctk.CTkLabel(win, text="Player Name:").pack(pady=(12,4), anchor="w", padx=12)
-        name_e = ctk.CTkEntry(win)
-        name_e.insert(0, pname)
-        name_e.pack(fill="x", padx=12)
-
-        ctk.CTkLabel(win, text="Jersey #:").pack(pady=(8,4), anchor="w", padx=12)
-        jersey_e = ctk.CTkEntry(win)
-        jersey_e.insert(0, str(pjersey) if pjersey is not None else "")
-        jersey_e.pack(fill="x", padx=12)
-
-        validated = {'ok': False}
-        msg_lbl = ctk.CTkLabel(win, text="", text_color="#FFD700")
-        msg_lbl.pack(pady=(6,0))
-
-        btn_frame2 = ctk.CTkFrame(win, fg_color="#2A2A2A")
-        btn_frame2.pack(side="bottom", pady=12, fill="x")
-
-        def validate_inputs():
-            new_name = name_e.get().strip()
-            jersey_txt = jersey_e.get().strip()
-            if not new_name:
-                msg_lbl.configure(text="Player name cannot be empty.")
-                validated['ok'] = False
-                confirm_btn.configure(state="disabled")
-                return
-            if len(new_name) > 50:
-                msg_lbl.configure(text="Player name must be 50 characters or fewer.")
-                validated['ok'] = False
-                confirm_btn.configure(state="disabled")
-                return
-            if any(char.isdigit() for char in new_name):
-                msg_lbl.configure(text="Player name cannot contain numbers.")
-                validated['ok'] = False
-                confirm_btn.configure(state="disabled")
-                return
-
-            if jersey_txt == "":
-                msg_lbl.configure(text="Jersey number is required.")
-                validated['ok'] = False
-                confirm_btn.configure(state="disabled")
-                return
-            if not jersey_txt.isdigit():
-                msg_lbl.configure(text="Jersey number must be an integer.")
-                validated['ok'] = False
-                confirm_btn.configure(state="disabled")
-                return
-            new_jersey = int(jersey_txt)
-            if new_jersey < 1 or new_jersey > 99:
-                msg_lbl.configure(text="Jersey number must be between 1 and 99.")
-                validated['ok'] = False
-                confirm_btn.configure(state="disabled")
-                return
-
-            cur = sched_mgr.mydb.cursor()
-            try:
-                cur.execute("SELECT id FROM teams WHERE teamName = ?", (team_name,))
-                rowt = cur.fetchone()
-                if not rowt:
-                    msg_lbl.configure(text="Team not found in DB.")
-                    validated['ok'] = False
-                    confirm_btn.configure(state="disabled")
-                    return
-                team_id_local = rowt['id']
-                if new_jersey is not None:
-                    cur.execute("SELECT COUNT(*) FROM players WHERE team_id = ? AND jerseyNumber = ? AND id != ?", (team_id_local, new_jersey, pid))
-                    cnt = cur.fetchone()[0]
-                    if cnt and cnt > 0:
-                        msg_lbl.configure(text=f"Jersey #{new_jersey} is already used on this team.")
-                        validated['ok'] = False
-                        confirm_btn.configure(state="disabled")
-                        return
-            finally:
-                cur.close()
-
-            msg_lbl.configure(text="Validation OK — click Confirm to save", text_color="#7CFC00")
-            validated['ok'] = True
-            confirm_btn.configure(state="normal")
-
-        def save_player_edit():
-            if not validated.get('ok'):
-                messagebox.showwarning("Not Validated", "Please validate changes before confirming.")
-                return
-            new_name = name_e.get().strip()
-            jersey_txt = jersey_e.get().strip()
-            new_jersey = int(jersey_txt)
-
-            cur = sched_mgr.mydb.cursor()
-            try:
-                cur.execute("UPDATE players SET name = ?, jerseyNumber = ? WHERE id = ?", (new_name, new_jersey, pid))
-                sched_mgr.mydb.commit()
-            finally:
-                cur.close()
-            win.destroy()
-            _sidebar_mgr.load_data()
-            self.display_team(team_name)
-            update_schedule_optionmenus(refs.get('tab3_team1_opt'), refs.get('tab3_team2_opt'), refs.get('tab3_venue_opt'))
-
-        validate_btn = ctk.CTkButton(btn_frame2, text="Validate", command=validate_inputs, hover_color="#4A90E2")
-        validate_btn.pack(side="left", padx=8, pady=6)
-        confirm_btn = ctk.CTkButton(btn_frame2, text="Confirm", command=save_player_edit, hover_color="#7CFC00")
-        confirm_btn.pack(side="left", padx=8, pady=6)
-        confirm_btn.configure(state="disabled")
-
-class TeamControlPanel:
-    def __init__(self):
-        pass
-    
-    def open_add_team_popup(self, prefill_name=None):
-        win = ctk.CTkToplevel(app)
-        win.title("Add Team")
-        win.geometry("360x140")
-        win.transient(app)
-
-        ctk.CTkLabel(win, text="New Team Name:").pack(pady=(12,6), anchor="w", padx=12)
-        name_entry = ctk.CTkEntry(win)
-        name_entry.pack(fill="x", padx=12)
-
-        editing = False
-        original_name = None
-        if prefill_name:
-            editing = True
-            original_name = prefill_name
-            name_entry.insert(0, prefill_name)
-
-        def save_team(event=None):
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("Missing", "Team name cannot be empty.")
-                return
-
-            if any(char.isdigit() for char in name):
-                messagebox.showwarning("Invalid", "Team name cannot contain numbers.")
-                return
-
-            if editing:
-                cur = sched_mgr.mydb.cursor()
-                try:
-                    cur.execute("SELECT id FROM teams WHERE teamName = ?", (original_name,))
-                    row = cur.fetchone()
-                    if not row:
-                        messagebox.showwarning("Not found", "Original team not found in DB.")
-                        return
-                    team_id = row['id']
-                    
-                    if name != original_name:
-                        cur.execute("SELECT 1 FROM teams WHERE teamName = ?", (name,))
-                        if cur.fetchone():
-                            messagebox.showwarning("Error", f"Team '{name}' already exists.")
-                            return
-
-                    cur.execute("UPDATE teams SET teamName = ? WHERE id = ?", (name, team_id))
-                    sched_mgr.mydb.commit()
-                except Exception as e:
-                    messagebox.showerror("Error", f"Database error: {e}")
-                    return
-                finally:
-                    cur.close()
-            else:
-                cur = sched_mgr.mydb.cursor()
-                try:
-                    cur.execute("SELECT 1 FROM teams WHERE teamName = ?", (name,))
-                    if cur.fetchone():
-                        messagebox.showwarning("Error", f"Team '{name}' already exists.")
-                        return
-                finally:
-                    cur.close()
-
-                try:
-                    t = Team(name)
-                    sched_mgr.addTeam(t)
-                except Exception as e:
-                    messagebox.showwarning("Error", f"Team could not be added: {e}")
-                    return
-
-            _sidebar_mgr.load_data()
-            try:
-                from standingsTab import standings as _standings
-                if editing and original_name and original_name in _standings:
-                    if name != original_name:
-                        _standings[name] = _standings.pop(original_name)
-                elif name not in _standings:
-                    _standings[name] = {"mvp": "N/A", "wins": 0}
-            except Exception:
-                pass
-
-            try:
-                _sidebar_mgr.refresh_sidebar_ui(refs.get('teams_sidebar_scroll'), refs.get('team_players_area'), refs.get('teams_search_var'))
-                
-                if editing and original_name and refs.get('current_team') == original_name:
-                    _show_team_wrapper(name, refs.get('team_players_area'))
-            except Exception:
-                pass
-
-            update_schedule_optionmenus(refs.get('tab3_team1_opt'), refs.get('tab3_team2_opt'), refs.get('tab3_venue_opt'))
-            win.destroy()
-
-        name_entry.bind("<Return>", save_team)
-        
-        btn_text = "Save Changes" if prefill_name else "Add Team"
-        ctk.CTkButton(win, text=btn_text, command=save_team, hover_color="#4A90E2").pack(pady=12)
-
-_sidebar_mgr = TeamSidebarManager()
-_controls = TeamControlPanel()
-
-def load_teams_from_db():
-    _sidebar_mgr.load_data()
-    global teams
-    teams = teams_cache
-
-def refresh_team_sidebar(sidebar_scrollable, players_area, team_buttons_list, search_var=None):
-    _sidebar_mgr.refresh_sidebar_ui(sidebar_scrollable, players_area, search_var)
-
-def open_add_team_popup(prefill_name=None):
-    _controls.open_add_team_popup(prefill_name)
-
-def _show_team_wrapper(team_name, players_frame):
-    viewer = TeamRosterViewer(players_frame)
-    viewer.display_team(team_name)
-
-def open_team_history_popup(team_name=None):
-    sel_team = team_name or (refs.get('current_team') if isinstance(refs, dict) else None)
-    if not sel_team:
-        messagebox.showwarning("No Team Selected", "No team selected. Open a team first from the sidebar.")
-        return
-
-    cur = sched_mgr.mydb.cursor()
-    try:
-        cur.execute("SELECT id FROM teams WHERE teamName = ?", (sel_team,))
-        row = cur.fetchone()
-        if not row:
-            messagebox.showwarning("Not Found", "Team not found in database.")
-            return
-        team_id = row['id']
-
-        cur.execute("""
-            SELECT
-                g.id, g.team1_id, g.team2_id,
-                t1.teamName AS team1_name, t2.teamName AS team2_name,
-                v.venueName AS venue,
-                g.game_date, g.start_time, g.end_time,
-                g.is_final, g.winner_team_id,
-                COALESCE(g.team1_score, 0) AS team1_score,
-                COALESCE(g.team2_score, 0) AS team2_score
-            FROM games g
-            LEFT JOIN teams t1 ON g.team1_id = t1.id
-            LEFT JOIN teams t2 ON g.team2_id = t2.id
-            LEFT JOIN venues v ON g.venue_id = v.id
-            WHERE g.team1_id = ? OR g.team2_id = ?
-            ORDER BY g.game_date DESC, g.start_time DESC
-        """, (team_id, team_id))
-        games = cur.fetchall()
-    finally:
-        try: cur.close()
-        except Exception: pass
-
-    win = ctk.CTkToplevel(app)
-    win.title(f"Game History — {sel_team}")
-    win.geometry("700x420")
-    win.transient(app)
-
-    header = ctk.CTkLabel(win, text=f"Game History — {sel_team}", font=ctk.CTkFont(size=16, weight="bold"))
-    header.pack(pady=(12,6))
-
-    container = ctk.CTkScrollableFrame(win, width=660, height=320, fg_color="#0F0F0F")
-    container.pack(padx=12, pady=(6,12), fill="both", expand=True)
-
-    if not games:
-        ctk.CTkLabel(container, text="No games found for this team.", anchor="w", text_color="#BBBBBB").pack(padx=8, pady=8)
-        return
-
-    for g in games:
-        # gid = g['id']
-        team1 = g['team1_name'] or "Unknown"
-        team2 = g['team2_name'] or "Unknown"
-        venue = g['venue'] or "Unknown"
-        date = g['game_date'] or ""
-        start = g['start_time'] or "00:00"
-        end = g['end_time'] or "00:00"
-        is_final = bool(g['is_final']) if 'is_final' in g.keys() else False
-        t1_score = g['team1_score'] if 'team1_score' in g.keys() else 0
-        t2_score = g['team2_score'] if 'team2_score' in g.keys() else 0
-
-        if g['team1_id'] == team_id:
-            opponent = team2
-            score_display = f"{t1_score} - {t2_score}"
-            won = (g['winner_team_id'] == team_id) if g['winner_team_id'] is not None else None
-        else:
-            opponent = team1
-            score_display = f"{t1_score} - {t2_score}"
-            won = (g['winner_team_id'] == team_id) if g['winner_team_id'] is not None else None
-
-        status = "Ended" if is_final else "Active"
-        result = ""
-        if is_final:
-            if g['winner_team_id'] is None:
-                result = "Tie"
-            else:
-                result = "W" if won else "L"
-
-        row = ctk.CTkFrame(container, fg_color="#1F1F1F")
-        row.pack(fill="x", padx=8, pady=6)
-        row.grid_columnconfigure(0, weight=3)
-        row.grid_columnconfigure(1, weight=1)
-        row.grid_columnconfigure(2, weight=1)
-        row.grid_columnconfigure(3, weight=1)
-
-        ctk.CTkLabel(row, text=f"{date} {start}-{end}", anchor="w").grid(row=0, column=0, padx=8, pady=4, sticky="w")
-        ctk.CTkLabel(row, text=f"vs {opponent}", anchor="w").grid(row=0, column=1, padx=8, pady=4, sticky="w")
-        ctk.CTkLabel(row, text=venue, anchor="w").grid(row=0, column=2, padx=8, pady=4, sticky="w")
-        ctk.CTkLabel(row, text=f"{status}{(' • ' + result) if result else ''}", anchor="w").grid(row=0, column=3, padx=8, pady=4, sticky="w")
-
-        if is_final:
-            score_lbl = ctk.CTkLabel(row, text=f"Score: {score_display}", text_color="#FFD700")
-            score_lbl.grid(row=1, column=0, columnspan=4, sticky="w", padx=8, pady=(0,6))
-
-    btn_frame = ctk.CTkFrame(win, fg_color="#181818")
-    btn_frame.pack(fill="x", padx=12, pady=(0,12))
-    ctk.CTkButton(btn_frame, text="Close", command=win.destroy, width=100).pack(side="right", padx=8, pady=8)
-
+import tkinter as tk
+import customtkinter as ctk
+from tkinter import messagebox
+from theDB import *
+from dbExecutor import db_executor
+
+app = None
+sched_mgr = None
+refs = {}
+
+update_schedule_optionmenus = lambda *a, **k: None
+
+teams_cache = {}
+_team_ids = {}
+
+# The sidebar filter runs this long after the last keystroke in the search box.
+SEARCH_DEBOUNCE_MS = 150
+
+_ROSTER_SELECT = """
+    SELECT t.id AS team_id, t.teamName, p.id, p.name, p.jerseyNumber
+    FROM teams t
+    LEFT JOIN players p ON p.team_id = t.id
+"""
+_ROSTER_ORDER = " ORDER BY t.teamName, t.id, CAST(p.jerseyNumber AS INTEGER) ASC"
+
+class RosterPlayer:
+    """One player in teams_cache. Answers p['name'] and p.get('name') like the dicts it replaces."""
+    __slots__ = ("id", "name", "jersey")
+
+    def __init__(self, pid, name, jersey):
+        self.id = pid
+        self.name = name
+        self.jersey = jersey
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in RosterPlayer.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in RosterPlayer.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f"RosterPlayer(#{self.id} {self.name} {self.jersey})"
+
+
+def fetch_rosters(conn):
+    """Every team joined with its players, in sidebar order; safe to call from a DB executor thread."""
+    return conn.execute(_ROSTER_SELECT + _ROSTER_ORDER).fetchall()
+
+
+def _group_rosters(rows):
+    """Folds ordered (team, player) join rows into {team_id: (teamName, [RosterPlayer])} in one pass."""
+    rosters = {}
+    for r in rows:
+        entry = rosters.get(r['team_id'])
+        if entry is None:
+            entry = rosters[r['team_id']] = (r['teamName'], [])
+        if r['id'] is not None:
+            entry[1].append(RosterPlayer(r['id'], r['name'], r['jerseyNumber']))
+    return rosters
+
+
+class TeamSearchIndex:
+    """
+    Case-insensitive substring search over team and player names.
+
+    Every 1-, 2- and 3-gram of every name maps to the ids of the teams that
+    contain it. Queries up to three characters are a single lookup; longer
+    ones intersect the postings of their trigrams (rarest first) and confirm
+    the few remaining candidates with a plain substring test.
+    """
+    GRAM = 3
+
+    def __init__(self):
+        self._postings = {}
+        self._grams = {}
+        self._texts = {}
+
+    @classmethod
+    def _grams_of(cls, text):
+        grams = set()
+        for n in range(1, cls.GRAM + 1):
+            for i in range(len(text) - n + 1):
+                grams.add(text[i:i + n])
+        return grams
+
+    def clear(self):
+        self._postings.clear()
+        self._grams.clear()
+        self._texts.clear()
+
+    def set_team(self, team_id, name, player_names):
+        self.remove_team(team_id)
+        texts = [name.lower()] + [p.lower() for p in player_names if p]
+        grams = set()
+        for t in texts:
+            grams |= self._grams_of(t)
+        for g in grams:
+            self._postings.setdefault(g, set()).add(team_id)
+        self._grams[team_id] = grams
+        self._texts[team_id] = texts
+
+    def remove_team(self, team_id):
+        for g in self._grams.pop(team_id, ()):
+            ids = self._postings.get(g)
+            if ids is not None:
+                ids.discard(team_id)
+                if not ids:
+                    del self._postings[g]
+        self._texts.pop(team_id, None)
+
+    def search(self, query):
+        """Ids of the teams whose name or any player's name contains query."""
+        q = query.strip().lower()
+        if not q:
+            return set(self._texts)
+        if len(q) <= self.GRAM:
+            return set(self._postings.get(q, ()))
+        grams = {q[i:i + self.GRAM] for i in range(len(q) - self.GRAM + 1)}
+        candidates = None
+        for g in sorted(grams, key=lambda g: len(self._postings.get(g, ()))):
+            ids = self._postings.get(g)
+            if not ids:
+                return set()
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return {tid for tid in candidates if any(q in t for t in self._texts[tid])}
+
+
+class TeamSidebarManager:
+    def __init__(self):
+        self.buttons_list = []
+        self.buttons = {}
+        self._shown = set()
+        self._search_job = None
+        self.index = TeamSearchIndex()
+        self.synced_version = None
+
+    def load_data(self, rows=None):
+        """Rebuilds teams_cache from roster join rows, querying them when none are given."""
+        if rows is None:
+            rows = fetch_rosters(sched_mgr.mydb)
+        teams_cache.clear()
+        _team_ids.clear()
+        rosters = _group_rosters(rows)
+        self.synced_version = roster_version()
+        self.index.clear()
+        for team_id, (name, players) in rosters.items():
+            teams_cache[name] = players
+            _team_ids[name] = team_id
+            self.index.set_team(team_id, name, [p.name for p in players])
+
+    def load_team(self, team_id):
+        """Reloads one team's roster into teams_cache; returns its name (None if it no longer exists)."""
+        for name, tid in list(_team_ids.items()):
+            if tid == team_id:
+                del _team_ids[name]
+                teams_cache.pop(name, None)
+        self.index.remove_team(team_id)
+        cur = sched_mgr.mydb.cursor()
+        try:
+            cur.execute(_ROSTER_SELECT + " WHERE t.id = ?" + _ROSTER_ORDER, (team_id,))
+            rosters = _group_rosters(cur.fetchall())
+        finally:
+            cur.close()
+        if team_id not in rosters:
+            return None
+        name, players = rosters[team_id]
+        teams_cache[name] = players
+        _team_ids[name] = team_id
+        self.index.set_team(team_id, name, [p.name for p in players])
+        return name
+
+    def refresh_sidebar_ui(self, scroll_frame, players_area, search_var=None):
+        """Recreates one button per team, then shows the ones matching the search box."""
+        for btn in list(self.buttons_list):
+            try:
+                btn.destroy()
+            except Exception:
+                pass
+        self.buttons_list.clear()
+        self.buttons.clear()
+        self._shown.clear()
+
+        for t in sorted(teams_cache.keys()):
+            b = ctk.CTkButton(
+                scroll_frame,
+                text=f"🏆 {t}",
+                width=220,
+                height=35,
+                command=lambda name=t: _show_team_wrapper(name, players_area),
+                hover_color="#4A90E2",
+                fg_color="#2E2E2E"
+            )
+            self.buttons[t] = b
+            self.buttons_list.append(b)
+
+        self.apply_filter(search_var.get() if search_var else "")
+        
+        if refs and 'teams_buttons' in refs:
+            refs['teams_buttons'] = self.buttons_list
+
+    def apply_filter(self, query):
+        """Packs or forgets existing buttons so only matching teams show, keeping name order."""
+        ids = self.index.search(query)
+        visible = {name for name, tid in _team_ids.items() if tid in ids}
+        next_shown = None
+        # Walk backwards so every button after the current one is already final
+        # and can serve as the anchor for pack(before=...).
+        for name in reversed(sorted(self.buttons)):
+            btn = self.buttons[name]
+            if name in visible:
+                if name not in self._shown:
+                    if next_shown is not None:
+                        btn.pack(padx=8, pady=4, fill="x", before=self.buttons[next_shown])
+                    else:
+                        btn.pack(padx=8, pady=4, fill="x")
+                    self._shown.add(name)
+                next_shown = name
+            elif name in self._shown:
+                btn.pack_forget()
+                self._shown.discard(name)
+
+    def schedule_search(self, search_var):
+        """Debounces search box keystrokes into one apply_filter call."""
+        if self._search_job is not None:
+            try: app.after_cancel(self._search_job)
+            except Exception: pass
+        self._search_job = app.after(SEARCH_DEBOUNCE_MS, self._run_search, search_var)
+
+    def _run_search(self, search_var):
+        self._search_job = None
+        try:
+            self.apply_filter(search_var.get())
+        except Exception as e:
+            print(f"Error filtering teams sidebar: {e}")
+
+class TeamRosterViewer:
+    def __init__(self, parent_frame):
+        self.parent = parent_frame
+
+    def display_team(self, team_name):
+        try:
+            if isinstance(refs, dict):
+                refs['current_team'] = team_name
+        except Exception:
+            pass
+
+        for w in self.parent.winfo_children():
+            w.destroy()
+
+        title = ctk.CTkLabel(self.parent, text=f"🏆 Team: {team_name}", font=ctk.CTkFont(size=18, weight="bold"))
+        title.pack(pady=(8, 6))
+
+        actions_frame = ctk.CTkFrame(self.parent, fg_color="#1F1F1F")
+        actions_frame.pack(fill="x", padx=12, pady=(0,6))
+
+        edit_btn = ctk.CTkButton(actions_frame, text="Edit Team", width=120, fg_color="#FFA500", hover_color="#FFB86B", 
+                                 command=lambda: open_add_team_popup(prefill_name=team_name))
+        edit_btn.pack(side="right", padx=(6,0))
+
+        del_btn = ctk.CTkButton(actions_frame, text="Delete Team", width=120, fg_color="#D9534F", hover_color="#FF6B6B", 
+                                command=lambda: self._delete_team_logic(team_name))
+        del_btn.pack(side="right", padx=(6,0))
+
+        history_btn = ctk.CTkButton(actions_frame, text="View Games", width=120, fg_color="#1F75FE", hover_color="#4A90E2", 
+                                    command=lambda: open_team_history_popup(team_name))
+        history_btn.pack(side="right", padx=(6,0))
+
+        header_row = ctk.CTkFrame(self.parent, fg_color="#222222")
+        header_row.pack(fill="x", padx=12, pady=(6,2))
+        ctk.CTkLabel(header_row, text="Player", anchor="w").pack(side="left", padx=(6,0))
+        ctk.CTkLabel(header_row, text="Actions", anchor="e").pack(side="right", padx=(0,26))
+
+        scroll_area = ctk.CTkScrollableFrame(self.parent, fg_color="transparent")
+        scroll_area.pack(fill="both", expand=True, padx=8, pady=2)
+
+        self._render_player_list(team_name, scroll_area)
+
+        self._render_add_player_form(team_name)
+
+    def _render_player_list(self, team_name, scroll_area):
+        search_query = ""
+        try:
+            if refs.get('teams_search_var'):
+                search_query = refs['teams_search_var'].get().strip().lower()
+        except Exception:
+            pass
+        
+        filter_active = False
+        if search_query and (search_query not in team_name.lower()):
+            filter_active = True
+
+        if teams_cache.get(team_name):
+            visible_count = 0
+            for p in teams_cache[team_name]:
+                name = p.get('name')
+                jersey = p.get('jersey')
+                pid = p.get('id')
+
+                if filter_active and search_query not in name.lower():
+                    continue
+                
+                visible_count += 1
+                self._create_player_row(scroll_area, team_name, pid, name, jersey)
+
+            if visible_count == 0 and filter_active:
+                ctk.CTkLabel(scroll_area, text=f"No players match '{search_query}'", text_color="#BBBBBB").pack(pady=6)
+        else:
+            ctk.CTkLabel(scroll_area, text="(No players yet)", text_color="#BBBBBB").pack(pady=6)
+
+    def _create_player_row(self, container, team_name, pid, name, jersey):
+        row = ctk.CTkFrame(container, fg_color="#333333")
+        row.pack(fill="x", pady=2)
+        
+        ctk.CTkLabel(row, text=(f"#{jersey} " if jersey is not None else ""), anchor="e").pack(side="left", padx=(0,6))
+        ctk.CTkLabel(row, text=name, anchor="w").pack(side="left", padx=(6,0))
+
+        btns = ctk.CTkFrame(row, fg_color="#333333")
+        btns.pack(side="right", padx=(6,6))
+
+        edit_btn = ctk.CTkButton(btns, text="Edit", width=60, height=26, hover_color="#FFA500",
+                                 command=lambda: self._edit_player_popup(team_name, pid, name, jersey))
+        edit_btn.pack(side="left", padx=(0,6))
+        
+        del_btn = ctk.CTkButton(btns, text="Del", width=60, height=26, hover_color="#FF6B6B",
+                                command=lambda: self._delete_player_logic(team_name, pid, name))
+        del_btn.pack(side="left")
+
+    def _render_add_player_form(self, team_name):
+        add_frame = ctk.CTkFrame(self.parent, fg_color="#333333")
+        add_frame.pack(pady=12, padx=8, fill="x")
+
+        jersey_entry = ctk.CTkEntry(add_frame, placeholder_text="Jersey #", width=80)
+        jersey_entry.pack(side="left", padx=(6,8), pady=8)
+
+        entry = ctk.CTkEntry(add_frame, placeholder_text="Player name")
+        entry.pack(side="left", expand=True, fill="x", padx=(8, 6), pady=8)
+
+        def do_add(event=None):
+            self._add_player_logic(team_name, entry, jersey_entry)
+
+        jersey_entry.bind("<Return>", do_add)
+        entry.bind("<Return>", do_add)
+
+        add_btn = ctk.CTkButton(add_frame, text="Add Player", command=do_add, width=100, hover_color="#4A90E2")
+        add_btn.pack(side="right", padx=(6, 8), pady=8)
+
+    def _delete_team_logic(self, team_name):
+        if not messagebox.askyesno("Delete Team", f"Are you sure you want to delete the team '{team_name}'? This will remove the team and may remove scheduled games."):
+            return
+        cur = sched_mgr.mydb.cursor()
+        try:
+            cur.execute("SELECT id FROM teams WHERE teamName = ?", (team_name,))
+            row = cur.fetchone()
+            if not row:
+                messagebox.showwarning("Not found", "Team not found in database.")
+                return
+            team_id = row['id']
+            cur.execute("SELECT COUNT(*) FROM games WHERE team1_id = ? OR team2_id = ?", (team_id, team_id))
+            cnt = cur.fetchone()[0]
+            if cnt and cnt > 0:
+                if not messagebox.askyesno("Team Has Games", f"Team has {cnt} scheduled game(s). Delete those games and the team? This cannot be undone."):
+                    return
+        finally:
+            cur.close()
+
+        sched_mgr.deleteTeam(team_id)
+
+    def _delete_player_logic(self, team_name, pid, pname):
+        if not messagebox.askyesno("Delete Player", f"Delete player '{pname}'?"):
+            return
+        sched_mgr.deletePlayer(pid, _team_ids.get(team_name))
+
+    def _add_player_logic(self, team_name, name_entry, jersey_entry):
+        name = name_entry.get().strip()
+        if not name:
+            messagebox.showwarning("Missing", "Enter a player name.")
+            return
+
+        if len(name) > 50:
+            messagebox.showwarning("Invalid", "Player name must be 50 characters or fewer.")
+            return
+            
+        if any(char.isdigit() for char in name):
+            messagebox.showwarning("Invalid", "Player name cannot contain numbers.")
+            return
+
+        jersey_text = jersey_entry.get().strip()
+        if jersey_text == "":
+            messagebox.showwarning("Missing", "Jersey number is required.")
+            return
+        if not jersey_text.isdigit():
+            messagebox.showwarning("Invalid", "Jersey number must be an integer between 1 and 99.")
+            return
+
+        jersey_num = int(jersey_text)
+        if jersey_num < 1 or jersey_num > 99:
+            messagebox.showwarning("Invalid", "Jersey number must be between 1 and 99.")
+            return
+
+        cur = sched_mgr.mydb.cursor()
+        try:
+            cur.execute("SELECT id FROM teams WHERE teamName = ?", (team_name,))
+            row = cur.fetchone()
+            if not row:
+                messagebox.showwarning("Error", "Team not found in database.")
+                return
+            team_id = row['id']
+        finally:
+            cur.close()
+
+        cur2 = sched_mgr.mydb.cursor()
+        try:
+            cur2.execute("SELECT COUNT(*) FROM players WHERE team_id = ? AND jerseyNumber = ?", (team_id, jersey_num))
+            cnt = cur2.fetchone()[0]
+            if cnt > 0:
+                messagebox.showwarning("Duplicate", f"Jersey number #{jersey_num} is already taken on this team.")
+                return
+        finally:
+            cur2.close()
+
+        try:
+            team_obj = Team(team_name, team_id)
+            player_obj = Player(name, jersey_num)
+            team_obj.addPlayer(player_obj)
+        except Exception as e:
+            messagebox.showwarning("Error", f"Could not add player: {e}")
+            return
+
+    def _edit_player_popup(self, team_name, pid, pname, pjersey):
+        win = ctk.CTkToplevel(app)
+        win.title("Edit Player")
+        win.geometry("360x260")
+        win.transient(app)
+
+        ctk.CTkLabel(win, text="Player Name:").pack(pady=(12,4), anchor="w", padx=12)
+        name_e = ctk.CTkEntry(win)
+        name_e.insert(0, pname)
+        name_e.pack(fill="x", padx=12)
+
+        ctk.CTkLabel(win, text="Jersey #:").pack(pady=(8,4), anchor="w", padx=12)
+        jersey_e = ctk.CTkEntry(win)
+        jersey_e.insert(0, str(pjersey) if pjersey is not None else "")
+        jersey_e.pack(fill="x", padx=12)
+
+        validated = {'ok': False}
+        msg_lbl = ctk.CTkLabel(win, text="", text_color="#FFD700")
+        msg_lbl.pack(pady=(6,0))
+
+        btn_frame2 = ctk.CTkFrame(win, fg_color="#2A2A2A")
+        btn_frame2.pack(side="bottom", pady=12, fill="x")
+
+        def validate_inputs():
+            new_name = name_e.get().strip()
+            jersey_txt = jersey_e.get().strip()
+            if not new_name:
+                msg_lbl.configure(text="Player name cannot be empty.")
+                validated['ok'] = False
+                confirm_btn.configure(state="disabled")
+                return
+            if len(new_name) > 50:
+                msg_lbl.configure(text="Player name must be 50 characters or fewer.")
+                validated['ok'] = False
+                confirm_btn.configure(state="disabled")
+                return
+            if any(char.isdigit() for char in new_name):
+                msg_lbl.configure(text="Player name cannot contain numbers.")
+                validated['ok'] = False
+                confirm_btn.configure(state="disabled")
+                return
+
+            if jersey_txt == "":
+                msg_lbl.configure(text="Jersey number is required.")
+                validated['ok'] = False
+                confirm_btn.configure(state="disabled")
+                return
+            if not jersey_txt.isdigit():
+                msg_lbl.configure(text="Jersey number must be an integer.")
+                validated['ok'] = False
+                confirm_btn.configure(state="disabled")
+                return
+            new_jersey = int(jersey_txt)
+            if new_jersey < 1 or new_jersey > 99:
+                msg_lbl.configure(text="Jersey number must be between 1 and 99.")
+                validated['ok'] = False
+                confirm_btn.configure(state="disabled")
+                return
+
+            cur = sched_mgr.mydb.cursor()
+            try:
+                cur.execute("SELECT id FROM teams WHERE teamName = ?", (team_name,))
+                rowt = cur.fetchone()
+                if not rowt:
+                    msg_lbl.configure(text="Team not found in DB.")
+                    validated['ok'] = False
+                    confirm_btn.configure(state="disabled")
+                    return
+                team_id_local = rowt['id']
+                if new_jersey is not None:
+                    cur.execute("SELECT COUNT(*) FROM players WHERE team_id = ? AND jerseyNumber = ? AND id != ?", (team_id_local, new_jersey, pid))
+                    cnt = cur.fetchone()[0]
+                    if cnt and cnt > 0:
+                        msg_lbl.configure(text=f"Jersey #{new_jersey} is already used on this team.")
+                        validated['ok'] = False
+                        confirm_btn.configure(state="disabled")
+                        return
+            finally:
+                cur.close()
+
+            msg_lbl.configure(text="Validation OK — click Confirm to save", text_color="#7CFC00")
+            validated['ok'] = True
+            confirm_btn.configure(state="normal")
+
+        def save_player_edit():
+            if not validated.get('ok'):
+                messagebox.showwarning("Not Validated", "Please validate changes before confirming.")
+                return
+            new_name = name_e.get().strip()
+            jersey_txt = jersey_e.get().strip()
+            new_jersey = int(jersey_txt)
+
+            sched_mgr.updatePlayer(pid, _team_ids.get(team_name), new_name, new_jersey)
+            win.destroy()
+
+        validate_btn = ctk.CTkButton(btn_frame2, text="Validate", command=validate_inputs, hover_color="#4A90E2")
+        validate_btn.pack(side="left", padx=8, pady=6)
+        confirm_btn = ctk.CTkButton(btn_frame2, text="Confirm", command=save_player_edit, hover_color="#7CFC00")
+        confirm_btn.pack(side="left", padx=8, pady=6)
+        confirm_btn.configure(state="disabled")
+
+class TeamControlPanel:
+    def __init__(self):
+        pass
+    
+    def open_add_team_popup(self, prefill_name=None):
+        win = ctk.CTkToplevel(app)
+        win.title("Add Team")
+        win.geometry("360x140")
+        win.transient(app)
+
+        ctk.CTkLabel(win, text="New Team Name:").pack(pady=(12,6), anchor="w", padx=12)
+        name_entry = ctk.CTkEntry(win)
+        name_entry.pack(fill="x", padx=12)
+
+        editing = False
+        original_name = None
+        if prefill_name:
+            editing = True
+            original_name = prefill_name
+            name_entry.insert(0, prefill_name)
+
+        def save_team(event=None):
+            name = name_entry.get().strip()
+            if not name:
+                messagebox.showwarning("Missing", "Team name cannot be empty.")
+                return
+
+            if any(char.isdigit() for char in name):
+                messagebox.showwarning("Invalid", "Team name cannot contain numbers.")
+                return
+
+            if editing:
+                cur = sched_mgr.mydb.cursor()
+                try:
+                    cur.execute("SELECT id FROM teams WHERE teamName = ?", (original_name,))
+                    row = cur.fetchone()
+                    if not row:
+                        messagebox.showwarning("Not found", "Original team not found in DB.")
+                        return
+                    team_id = row['id']
+                    
+                    if name != original_name:
+                        cur.execute("SELECT 1 FROM teams WHERE teamName = ?", (name,))
+                        if cur.fetchone():
+                            messagebox.showwarning("Error", f"Team '{name}' already exists.")
+                            return
+
+                    if name != original_name:
+                        sched_mgr.renameTeam(team_id, name)
+                except Exception as e:
+                    messagebox.showerror("Error", f"Database error: {e}")
+                    return
+                finally:
+                    cur.close()
+            else:
+                cur = sched_mgr.mydb.cursor()
+                try:
+                    cur.execute("SELECT 1 FROM teams WHERE teamName = ?", (name,))
+                    if cur.fetchone():
+                        messagebox.showwarning("Error", f"Team '{name}' already exists.")
+                        return
+                finally:
+                    cur.close()
+
+                try:
+                    t = Team(name)
+                    sched_mgr.addTeam(t)
+                except Exception as e:
+                    messagebox.showwarning("Error", f"Team could not be added: {e}")
+                    return
+
+            win.destroy()
+
+        name_entry.bind("<Return>", save_team)
+        
+        btn_text = "Save Changes" if prefill_name else "Add Team"
+        ctk.CTkButton(win, text=btn_text, command=save_team, hover_color="#4A90E2").pack(pady=12)
+
+_sidebar_mgr = TeamSidebarManager()
+_controls = TeamControlPanel()
+
+def load_teams_from_db():
+    if _sidebar_mgr.synced_version != roster_version():
+        _sidebar_mgr.load_data()
+    global teams
+    teams = teams_cache
+
+def prime_rosters(rows, version):
+    """Loads roster rows fetched elsewhere (e.g. a warm-up thread) if no roster write happened since `version`."""
+    if version != roster_version() or _sidebar_mgr.synced_version == version:
+        return False
+    _sidebar_mgr.load_data(rows)
+    return True
+
+def _on_roster_changed(event):
+    """Patches the cache, the sidebar and the open roster for the one team that changed."""
+    if sched_mgr is None: return
+    old_name = next((n for n, tid in _team_ids.items() if tid == event.team_id), None)
+    new_name = _sidebar_mgr.load_team(event.team_id)
+    if _sidebar_mgr.synced_version is not None and _sidebar_mgr.synced_version + 1 == roster_version():
+        _sidebar_mgr.synced_version = roster_version()
+
+    try:
+        if refs.get('teams_sidebar_scroll'):
+            if new_name != old_name:
+                _sidebar_mgr.refresh_sidebar_ui(refs.get('teams_sidebar_scroll'), refs.get('team_players_area'), refs.get('teams_search_var'))
+            elif refs.get('teams_search_var') and refs['teams_search_var'].get().strip():
+                _sidebar_mgr.apply_filter(refs['teams_search_var'].get())
+
+        players_area = refs.get('team_players_area')
+        if old_name and refs.get('current_team') == old_name and players_area and players_area.winfo_exists():
+            if new_name:
+                _show_team_wrapper(new_name, players_area)
+            else:
+                refs['current_team'] = None
+                for w in players_area.winfo_children(): w.destroy()
+    except Exception as e:
+        print(f"Error refreshing teams tab: {e}")
+
+    update_schedule_optionmenus(refs.get('tab3_team1_opt'), refs.get('tab3_team2_opt'), refs.get('tab3_venue_opt'))
+
+bus.subscribe(RosterChanged, _on_roster_changed)
+
+def refresh_team_sidebar(sidebar_scrollable, players_area, team_buttons_list, search_var=None):
+    _sidebar_mgr.refresh_sidebar_ui(sidebar_scrollable, players_area, search_var)
+
+def schedule_team_search(search_var):
+    _sidebar_mgr.schedule_search(search_var)
+
+def open_add_team_popup(prefill_name=None):
+    _controls.open_add_team_popup(prefill_name)
+
+def _show_team_wrapper(team_name, players_frame):
+    viewer = TeamRosterViewer(players_frame)
+    viewer.display_team(team_name)
+
+# Games fetched per history page; the next page loads as the list nears its end.
+HISTORY_PAGE_SIZE = 40
+
+_HISTORY_COLUMNS = """
+    g.id, g.team1_id, g.team2_id,
+    t1.teamName AS team1_name, t2.teamName AS team2_name,
+    v.venueName AS venue,
+    g.game_date, g.start_time, g.end_time,
+    g.is_final, g.winner_team_id,
+    COALESCE(g.team1_score, 0) AS team1_score,
+    COALESCE(g.team2_score, 0) AS team2_score
+"""
+
+def _fetch_history_page(conn, team_id, after=None, season=None, opponent_id=None, limit=HISTORY_PAGE_SIZE):
+    """
+    One page of a team's games, newest first, strictly before the `after`
+    (game_date, start_time, id) key. Home and away games are read as two
+    branches so each can walk its (team, date, time) history index and stop
+    after `limit` rows; season and opponent filters are applied inside each
+    branch. A missing date or time sorts as '' so legacy rows with NULLs
+    still land on a page. Returns rows, plus one extra when more pages exist.
+    """
+    branches, params = [], []
+    for side, other in (("team1_id", "team2_id"), ("team2_id", "team1_id")):
+        where = [f"{side} = ?"]
+        params.append(team_id)
+        if season is not None:
+            where.append("season_start_year = ?")
+            params.append(season)
+        if opponent_id is not None:
+            where.append(f"{other} = ?")
+            params.append(opponent_id)
+        if after is not None:
+            where.append("(COALESCE(game_date, ''), COALESCE(start_time, ''), id) < (?, ?, ?)")
+            params.extend(after)
+        branches.append(f"""
+            SELECT * FROM (
+                SELECT id FROM games WHERE {' AND '.join(where)}
+                ORDER BY COALESCE(game_date, '') DESC, COALESCE(start_time, '') DESC, id DESC LIMIT ?
+            )""")
+        params.append(limit + 1)
+    params.append(limit + 1)
+    return conn.execute(f"""
+        SELECT {_HISTORY_COLUMNS}
+        FROM ({' UNION ALL '.join(branches)}) page
+        JOIN games g ON g.id = page.id
+        LEFT JOIN teams t1 ON g.team1_id = t1.id
+        LEFT JOIN teams t2 ON g.team2_id = t2.id
+        LEFT JOIN venues v ON g.venue_id = v.id
+        ORDER BY COALESCE(g.game_date, '') DESC, COALESCE(g.start_time, '') DESC, g.id DESC
+        LIMIT ?
+    """, params).fetchall()
+
+class TeamHistoryPopup:
+    """Game history Toplevel that loads one keyset page at a time as the user scrolls."""
+    def __init__(self, team_name, team_id):
+        self.team_name = team_name
+        self.team_id = team_id
+        self.cursor = None
+        self.has_more = True
+        self.loading = False
+        self.request_seq = 0
+        self.season_map = {}
+        self.opponent_map = {}
+
+        self.win = ctk.CTkToplevel(app)
+        self.win.title(f"Game History — {team_name}")
+        self.win.geometry("700x460")
+        self.win.transient(app)
+
+        ctk.CTkLabel(self.win, text=f"Game History — {team_name}", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(12,6))
+        self._build_filters()
+
+        self._build_scroll_area()
+        self.status = ctk.CTkLabel(self.container, text="", anchor="w", text_color="#BBBBBB")
+
+        btn_frame = ctk.CTkFrame(self.win, fg_color="#181818")
+        btn_frame.pack(fill="x", padx=12, pady=(0,12))
+        ctk.CTkButton(btn_frame, text="Close", command=self.win.destroy, width=100).pack(side="right", padx=8, pady=8)
+
+        self.reset()
+
+    def _build_filters(self):
+        bar = ctk.CTkFrame(self.win, fg_color="transparent")
+        bar.pack(fill="x", padx=12)
+
+        self.season_map = {"All Seasons": None}
+        for y in season_index.season_start_years():
+            self.season_map[f"Season {y + 1}"] = y
+        self.season_var = ctk.StringVar(value="All Seasons")
+        ctk.CTkOptionMenu(bar, variable=self.season_var, values=list(self.season_map),
+                          command=lambda _: self.reset()).pack(side="left", padx=(0,8))
+
+        self.opponent_map = {"All Opponents": None}
+        for name in sorted(_team_ids):
+            if _team_ids[name] != self.team_id:
+                self.opponent_map[name] = _team_ids[name]
+        self.opponent_var = ctk.StringVar(value="All Opponents")
+        ctk.CTkOptionMenu(bar, variable=self.opponent_var, values=list(self.opponent_map),
+                          command=lambda _: self.reset()).pack(side="left")
+
+    def _build_scroll_area(self):
+        # A plain canvas we own, so reaching the end of the loaded rows can
+        # ask for the next page from its yscrollcommand.
+        frame = ctk.CTkFrame(self.win, fg_color="#0F0F0F")
+        frame.pack(padx=12, pady=(6,12), fill="both", expand=True)
+        self.canvas = tk.Canvas(frame, width=660, height=320, bg="#0F0F0F", highlightthickness=0)
+        scrollbar = ctk.CTkScrollbar(frame, command=self.canvas.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.container = ctk.CTkFrame(self.canvas, fg_color="#0F0F0F")
+        window = self.canvas.create_window((0, 0), window=self.container, anchor="nw")
+        self.container.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfigure(window, width=e.width))
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 0.95:
+                self.load_more()
+        self.canvas.configure(yscrollcommand=on_scroll)
+
+        self.win.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.win.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.win.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+    def reset(self):
+        """Clears the list and starts again from the newest game with the current filters."""
+        for w in self.container.winfo_children():
+            if w is not self.status:
+                w.destroy()
+        self.cursor = None
+        self.has_more = True
+        self.loading = False
+        self.request_seq += 1
+        self.load_more()
+
+    def load_more(self):
+        if self.loading or not self.has_more:
+            return
+        self.loading = True
+        seq = self.request_seq
+        self.status.configure(text="Loading game history...")
+        self.status.pack(padx=8, pady=8, anchor="w")
+        db_executor.run(self.win, _fetch_history_page, lambda rows: self._on_page(seq, rows),
+                        self.team_id, self.cursor,
+                        self.season_map.get(self.season_var.get()),
+                        self.opponent_map.get(self.opponent_var.get()),
+                        on_error=self._on_error)
+
+    def _on_page(self, seq, rows):
+        if seq != self.request_seq:
+            return
+        self.loading = False
+        self.has_more = len(rows) > HISTORY_PAGE_SIZE
+        rows = rows[:HISTORY_PAGE_SIZE]
+        self.status.pack_forget()
+        for g in rows:
+            _render_history_row(self.container, self.team_id, g)
+        if rows:
+            last = rows[-1]
+            self.cursor = (last['game_date'] or "", last['start_time'] or "", last['id'])
+        if self.has_more:
+            self.status.configure(text="Scroll for more...")
+            self.status.pack(padx=8, pady=8, anchor="w")
+        elif self.cursor is None:
+            self.status.configure(text="No games found for this team.")
+            self.status.pack(padx=8, pady=8, anchor="w")
+
+    def _on_error(self, e):
+        self.loading = False
+        self.status.configure(text=f"Could not load game history: {e}")
+        self.status.pack(padx=8, pady=8, anchor="w")
+
+def open_team_history_popup(team_name=None):
+    sel_team = team_name or (refs.get('current_team') if isinstance(refs, dict) else None)
+    if not sel_team:
+        messagebox.showwarning("No Team Selected", "No team selected. Open a team first from the sidebar.")
+        return
+    team_id = _team_ids.get(sel_team)
+    if team_id is None:
+        messagebox.showwarning("Not Found", "Team not found in database.")
+        return
+    TeamHistoryPopup(sel_team, team_id)
+
+def _render_history_row(container, team_id, g):
+    team1 = g['team1_name'] or "Unknown"
+    team2 = g['team2_name'] or "Unknown"
+    venue = g['venue'] or "Unknown"
+    date = g['game_date'] or ""
+    start = g['start_time'] or "00:00"
+    end = g['end_time'] or "00:00"
+    is_final = bool(g['is_final']) if 'is_final' in g.keys() else False
+    t1_score = g['team1_score'] if 'team1_score' in g.keys() else 0
+    t2_score = g['team2_score'] if 'team2_score' in g.keys() else 0
+
+    if g['team1_id'] == team_id:
+        opponent = team2
+        score_display = f"{t1_score} - {t2_score}"
+        won = (g['winner_team_id'] == team_id) if g['winner_team_id'] is not None else None
+    else:
+        opponent = team1
+        score_display = f"{t1_score} - {t2_score}"
+        won = (g['winner_team_id'] == team_id) if g['winner_team_id'] is not None else None
+
+    status = "Ended" if is_final else "Active"
+    result = ""
+    if is_final:
+        if g['winner_team_id'] is None:
+            result = "Tie"
+        else:
+            result = "W" if won else "L"
+
+    row = ctk.CTkFrame(container, fg_color="#1F1F1F")
+    row.pack(fill="x", padx=8, pady=6)
+    row.grid_columnconfigure(0, weight=3)
+    row.grid_columnconfigure(1, weight=1)
+    row.grid_columnconfigure(2, weight=1)
+    row.grid_columnconfigure(3, weight=1)
+
+    ctk.CTkLabel(row, text=f"{date} {start}-{end}", anchor="w").grid(row=0, column=0, padx=8, pady=4, sticky="w")
+    ctk.CTkLabel(row, text=f"vs {opponent}", anchor="w").grid(row=0, column=1, padx=8, pady=4, sticky="w")
+    ctk.CTkLabel(row, text=venue, anchor="w").grid(row=0, column=2, padx=8, pady=4, sticky="w")
+    ctk.CTkLabel(row, text=f"{status}{(' • ' + result) if result else ''}", anchor="w").grid(row=0, column=3, padx=8, pady=4, sticky="w")
+
+    if is_final:
+        score_lbl = ctk.CTkLabel(row, text=f"Score: {score_display}", text_color="#FFD700")
+        score_lbl.grid(row=1, column=0, columnspan=4, sticky="w", padx=8, pady=(0,6))
+
 teams = teams_cache
\ No newline at end of file
@@ -1,352 +1,1511 @@
-import sqlite3
-from pathlib import Path
-from datetime import datetime
-
-DB_FILE = Path(__file__).with_name('sports_schedule.db')
-
-mydb = sqlite3.connect(str(DB_FILE))
-mydb.row_factory = sqlite3.Row
-cur = mydb.cursor()
-cur.execute("PRAGMA foreign_keys = ON")
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS teams (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    teamName TEXT NOT NULL UNIQUE,
-    totalPoints INTEGER DEFAULT 0,
-    wins INTEGER DEFAULT 0
-)
-""")
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS players (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL,
-    jerseyNumber INTEGER,
-    points INTEGER DEFAULT 0,
-    team_id INTEGER,
-    FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
-)
-""")
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS venues (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    venueName TEXT NOT NULL UNIQUE,
-    location TEXT NOT NULL,
-    capacity INTEGER NOT NULL
-)
-""")
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS team_season_totals (
-    team_id INTEGER,
-    season_year INTEGER,
-    totalPoints INTEGER DEFAULT 0,
-    PRIMARY KEY (team_id, season_year),
-    FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
-)
-""")
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS game_player_stats (
-    game_id INTEGER,
-    player_id INTEGER,
-    points INTEGER DEFAULT 0,
-    PRIMARY KEY (game_id, player_id),
-    FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE,
-    FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
-)
-""")
-
-cur_m = mydb.cursor()
-existing_cols = [r[1] for r in cur_m.execute("PRAGMA table_info(games)").fetchall()]
-
-if 'team1_id' not in existing_cols:
-    cur_m.execute("""
-    CREATE TABLE IF NOT EXISTS games_new (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        team1_id INTEGER,
-        team2_id INTEGER,
-        venue_id INTEGER,
-        game_date TEXT,
-        team1_score INTEGER DEFAULT 0,
-        team2_score INTEGER DEFAULT 0,
-        start_time TEXT DEFAULT '00:00',
-        end_time TEXT DEFAULT '00:00',
-        is_final INTEGER DEFAULT 0,
-        winner_team_id INTEGER DEFAULT NULL,
-        FOREIGN KEY (team1_id) REFERENCES teams(id),
-        FOREIGN KEY (team2_id) REFERENCES teams(id),
-        FOREIGN KEY (venue_id) REFERENCES venues(id)
-    )
-    """)
-    has_home = 'home_team_id' in existing_cols
-    has_away = 'away_team_id' in existing_cols
-    has_home_score = 'home_score' in existing_cols
-    has_away_score = 'away_score' in existing_cols
-    has_start = 'start_time' in existing_cols
-    has_end = 'end_time' in existing_cols
-    has_is_final = 'is_final' in existing_cols
-    has_winner = 'winner_team_id' in existing_cols
-
-    select_parts = []
-    if has_home: select_parts.append("home_team_id AS team1_id")
-    else: select_parts.append("NULL AS team1_id")
-    if has_away: select_parts.append("away_team_id AS team2_id")
-    else: select_parts.append("NULL AS team2_id")
-    select_parts.append("venue_id")
-    select_parts.append("game_date")
-    if has_home_score: select_parts.append("home_score AS team1_score")
-    else: select_parts.append("0 AS team1_score")
-    if has_away_score: select_parts.append("away_score AS team2_score")
-    else: select_parts.append("0 AS team2_score")
-    if has_start: select_parts.append("start_time")
-    else: select_parts.append("'00:00' AS start_time")
-    if has_end: select_parts.append("end_time")
-    else: select_parts.append("'00:00' AS end_time")
-    if has_is_final: select_parts.append("is_final")
-    else: select_parts.append("0 AS is_final")
-    if has_winner: select_parts.append("winner_team_id")
-    else: select_parts.append("NULL AS winner_team_id")
-
-    select_clause = ", ".join(select_parts)
-    try:
-        cur_m.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='games'")
-        if cur_m.fetchone():
-            cur_m.execute(f"INSERT INTO games_new (team1_id, team2_id, venue_id, game_date, team1_score, team2_score, start_time, end_time, is_final, winner_team_id) SELECT {select_clause} FROM games")
-            cur_m.execute("DROP TABLE IF EXISTS games")
-        cur_m.execute("ALTER TABLE games_new RENAME TO games")
-        mydb.commit()
-    except Exception:
-        try:
-            cur_m.execute("DROP TABLE IF EXISTS games_new")
-            mydb.commit()
-        except Exception:
-            pass
-
-cur_m.close()
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS mvps (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    player_id INTEGER NOT NULL,
-    team_id INTEGER NOT NULL,
-    year INTEGER NOT NULL,
-    FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE,
-    FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE,
-    UNIQUE(player_id, year)
-)
-""")
-
-mydb.commit()
-cur.close()
-
-class ScheduleManager:
-    def __init__(self):
-        self.mydb = mydb
-
-    def addTeam(self, team):
-        if isinstance(team, Team):
-            cursor = self.mydb.cursor()
-            cursor.execute("INSERT INTO teams (teamName, totalPoints) VALUES (?, ?)", (team.teamName, team.totalPoints))
-            self.mydb.commit()
-            team.id = cursor.lastrowid
-            cursor.close()
-
-    def addVenue(self, venue):
-        if isinstance(venue, Venue):
-            cursor = self.mydb.cursor()
-            cursor.execute("INSERT INTO venues (venueName, location, capacity) VALUES (?, ?, ?)", (venue.venueName, venue.location, venue.capacity))
-            self.mydb.commit()
-            venue.venueID = cursor.lastrowid
-            cursor.close()
-
-    def gameResults(self, gameID):
-        cursor = self.mydb.cursor()
-        cursor.execute("""
-        SELECT g.id, t1.teamName AS team1, t2.teamName AS team2, v.venueName, g.game_date, g.team1_score, g.team2_score
-        FROM games g
-        LEFT JOIN teams t1 ON g.team1_id = t1.id
-        LEFT JOIN teams t2 ON g.team2_id = t2.id
-        LEFT JOIN venues v ON g.venue_id = v.id
-        WHERE g.id = ?
-        """, (gameID,))
-        result = cursor.fetchone()
-        cursor.close()
-        if result:
-            return {
-                'gameID': result['id'],
-                'team1': result['team1'],
-                'team2': result['team2'],
-                'venue': result['venueName'],
-                'date': result['game_date'],
-                'score': f"{result['team1_score']}-{result['team2_score']}"
-            }
-        return None
-
-    def scheduleGame(self, team1_id, team2_id, venue_id, game_date):
-        cursor = self.mydb.cursor()
-        cursor.execute("INSERT INTO games (team1_id, team2_id, venue_id, game_date, start_time, end_time, team1_score, team2_score) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                       (team1_id, team2_id, venue_id, game_date, '00:00', '00:00', 0, 0))
-        self.mydb.commit()
-        game_id = cursor.lastrowid
-        cursor.close()
-        return game_id
-
-    def updateGame(self, game_id, team1_id, team2_id, venue_id, game_date, start_time='00:00', end_time='00:00'):
-        cursor = self.mydb.cursor()
-        cursor.execute("""
-            UPDATE games SET team1_id = ?, team2_id = ?, venue_id = ?, game_date = ?, start_time = ?, end_time = ?
-            WHERE id = ?
-        """, (team1_id, team2_id, venue_id, game_date, start_time, end_time, game_id))
-        self.mydb.commit()
-        cursor.close()
-
-    def deleteGame(self, game_id):
-        cursor = self.mydb.cursor()
-        cursor.execute("DELETE FROM games WHERE id = ?", (game_id,))
-        self.mydb.commit()
-        cursor.close()
-
-    def isGameFinal(self, game_id):
-        cursor = self.mydb.cursor()
-        cursor.execute("SELECT is_final FROM games WHERE id = ?", (game_id,))
-        r = cursor.fetchone()
-        cursor.close()
-        return bool(r['is_final']) if r and 'is_final' in r.keys() else False
-
-    def endGame(self, game_id):
-        cursor = self.mydb.cursor()
-        cursor.execute("SELECT team1_id, team2_id, team1_score, team2_score FROM games WHERE id = ?", (game_id,))
-        row = cursor.fetchone()
-        if not row:
-            cursor.close()
-            raise ValueError("Game not found")
-
-        t1_id = row['team1_id']
-        t2_id = row['team2_id']
-        t1_score = row['team1_score']
-        t2_score = row['team2_score']
-
-        winner = None
-        if t1_score > t2_score:
-            winner = t1_id
-        elif t2_score > t1_score:
-            winner = t2_id
-        else:
-            winner = None
-            
-        cursor.execute("UPDATE games SET is_final = 1, winner_team_id = ? WHERE id = ?", (winner, game_id))
-        self.mydb.commit()
-        cursor.close()
-        return winner
-
-class Venue:
-    def __init__(self, venueName, location, capacity, venueID=None):
-        self.venueName = venueName
-        self.location = location
-        self.capacity = capacity
-        self.venueID = venueID
-    def checkAvailability(self, date):
-        cursor = mydb.cursor()
-        cursor.execute("SELECT COUNT(*) FROM games WHERE venue_id = ? AND game_date = ?", (self.venueID, date))
-        count = cursor.fetchone()[0]
-        cursor.close()
-        return count == 0
-
-class Team:
-    def __init__(self, teamName, teamID=None):
-        self.teamName = teamName
-        self.id = teamID
-        self.totalPoints = 0
-    def addPlayer(self, player):
-        if isinstance(player, Player):
-            cursor = mydb.cursor()
-            cursor.execute("INSERT INTO players (name, jerseyNumber, points, team_id) VALUES (?, ?, ?, ?)",
-                           (player.name, player.jerseyNumber, player.points, self.id))
-            mydb.commit()
-            player.id = cursor.lastrowid
-            cursor.close()
-            self.calcTotalPoints()
-    def calcTotalPoints(self):
-        cursor = mydb.cursor()
-        cursor.execute("SELECT SUM(points) FROM players WHERE team_id = ?", (self.id,))
-        result = cursor.fetchone()
-        self.totalPoints = result[0] if result[0] else 0
-        cursor.execute("UPDATE teams SET totalPoints = ? WHERE id = ?", (self.totalPoints, self.id))
-        mydb.commit()
-        cursor.close()
-
-class Player:
-    def __init__(self, name, jerseyNumber, playerID=None):
-        self.name = name
-        self.jerseyNumber = jerseyNumber
-        self.points = 0
-        self.id = playerID
-    def addPoints(self, p):
-        self.points += p
-        cursor = mydb.cursor()
-        cursor.execute("UPDATE players SET points = ? WHERE id = ?", (self.points, self.id))
-        mydb.commit()
-        cursor.close()
-
-class MVP(Player):
-    def __init__(self, name, jerseyNumber, year, playerID):
-        super().__init__(name, jerseyNumber, playerID)
-        self.year = year
-    def addMVP(self, mvp, year):
-        if isinstance(mvp, Player):
-            cursor = self.mydb.cursor()
-            cursor.execute("INSERT INTO mvps (player_id, team_id, year) VALUES (?, ?, ?)", (mvp.name, mvp.jerseyNumber, year))
-            self.mydb.commit()
-            cursor.close()
-
-class Season:
-    def __init__(self, year=None):
-        self.year = year
-        self.season_definitions = {
-            "Pre-season": ((9, 25), (10, 16)),
-            "Regular Season": ((10, 17), (4, 16)),  
-            "Play-in": ((4, 17), (4, 24)),
-            "Playoff": ((4, 25), (6, 8)),
-            "Finals": ((6, 9), (6, 24)),
-            "Off-season": ((6, 25), (9, 24)),
-        }
-
-    def get_team_points_for_season(self, team_id, season_year):
-        c = mydb.cursor()
-        c.execute("SELECT totalPoints FROM team_season_totals WHERE team_id = ? AND season_year = ?", (team_id, season_year))
-        row = c.fetchone()
-        c.close()
-        return row['totalPoints'] if row else 0
-
-    def set_team_points_for_season(self, team_id, season_year, points):
-        c = mydb.cursor()
-        c.execute("""INSERT INTO team_season_totals (team_id, season_year, totalPoints)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(team_id, season_year) DO UPDATE SET totalPoints=excluded.totalPoints
-                """, (team_id, season_year, points))
-        mydb.commit()
-        c.close()
-
-    def get_range(self, season_name, start_year):
-        if season_name not in self.season_definitions:
-            return None, None
-        (sm, sd), (em, ed) = self.season_definitions[season_name]
-        start = datetime(start_year, sm, sd).date()
-        if (em, ed) < (sm, sd):
-            end = datetime(start_year + 1, em, ed).date()
-        else:
-            end = datetime(start_year, em, ed).date()
-        return start, end
-
-    def get_current_season_year(self, game_date_str):
-        try:
-            dt = datetime.strptime(game_date_str, "%Y-%m-%d").date()
-        except:
-            return datetime.now().year - 1
-        if dt.month >= 9:
-            return dt.year
-        else:
-            return dt.year - 1
\ No newline at end of file
+import functools
+import json
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from pathlib import Path
+from datetime import date, datetime
+from eventBus import *
+
+DB_FILE = Path(__file__).with_name('sports_schedule.db')
+
+SCHEMA_VERSION = 12
+
+# Write a game_snapshots row after this many new events for a game.
+SNAPSHOT_INTERVAL = 50
+
+# Elo ratings: every team starts at ELO_INITIAL, ELO_K scales each game's
+# update, and a team keeps ELO_SEASON_CARRYOVER of its distance from the
+# mean when its first game of a new season is rated.
+ELO_INITIAL = 1500.0
+ELO_K = 20.0
+ELO_SEASON_CARRYOVER = 0.75
+
+# SQLite waits this long for a lock before reporting "database is locked";
+# a failed write transaction is then retried with exponential backoff.
+BUSY_TIMEOUT_MS = 5000
+WRITE_RETRIES = 4
+RETRY_BACKOFF = 0.05
+
+def _is_busy(e):
+    msg = str(e).lower()
+    return "locked" in msg or "busy" in msg
+
+class ConnectionManager:
+    """
+    Owns every SQLite connection. The database runs in WAL mode so readers
+    never block the writer or each other: each thread gets its own read-only
+    connection from reader(), and all writes go through the single writer()
+    connection (the module-level `mydb`), serialized by write_lock.
+    """
+    def __init__(self, path):
+        self.path = str(path)
+        self.write_lock = threading.RLock()
+        self._local = threading.local()
+        self._writer = None
+
+    def _open(self, check_same_thread=True):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -16000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def writer(self):
+        if self._writer is None:
+            self._writer = self._open(check_same_thread=False)
+            mode = self._writer.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if mode.lower() != "wal":
+                print(f"[theDB] WAL not available, using {mode} journal mode")
+        return self._writer
+
+    def reader(self):
+        """Read-only connection private to the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.writer()  # make sure the file is in WAL mode first
+            conn = self._open()
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+        return conn
+
+    def after_commit(self, fn, *args):
+        """Runs fn(*args) once this thread's write in progress has returned and released the lock; at once outside a write."""
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            fn(*args)
+        else:
+            pending.append((fn, args))
+
+    def retrying(self, fn, *args, **kwargs):
+        """
+        Calls fn holding the write lock, rolling back and retrying while the
+        database is busy. Callbacks queued with after_commit() run only after
+        the outermost call succeeds and the lock is released; those of a
+        failed attempt are dropped, so a retry does not repeat them.
+        """
+        outer = getattr(self._local, "pending", None) is None
+        with self.write_lock:
+            if outer: self._local.pending = []
+            pending = self._local.pending
+            try:
+                for attempt in range(WRITE_RETRIES + 1):
+                    mark = len(pending)
+                    try:
+                        result = fn(*args, **kwargs)
+                        break
+                    except Exception as e:
+                        del pending[mark:]
+                        if attempt == WRITE_RETRIES or not isinstance(e, sqlite3.OperationalError) or not _is_busy(e):
+                            raise
+                        try: self.writer().rollback()
+                        except Exception: pass
+                        print(f"[theDB] Database busy, retrying write ({attempt + 1}/{WRITE_RETRIES})")
+                        time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            finally:
+                if outer: self._local.pending = None
+        if outer:
+            for callback, cb_args in pending:
+                callback(*cb_args)
+        return result
+
+    def write(self, fn, *args):
+        """Runs fn(conn, *args) as one transaction on the writer connection. Safe from any thread."""
+        def txn():
+            conn = self.writer()
+            try:
+                result = fn(conn, *args)
+                conn.commit()
+                return result
+            except Exception:
+                conn.rollback()
+                raise
+        return self.retrying(txn)
+
+connections = ConnectionManager(DB_FILE)
+mydb = connections.writer()
+
+def _serialized_write(method):
+    """Runs a ScheduleManager write under the writer lock and retries it if the database is busy."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        return connections.retrying(method, *args, **kwargs)
+    return wrapper
+
+def _migration_1_base_schema(cur):
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS teams (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        teamName TEXT NOT NULL UNIQUE,
+        totalPoints INTEGER DEFAULT 0,
+        wins INTEGER DEFAULT 0
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS players (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        jerseyNumber INTEGER,
+        points INTEGER DEFAULT 0,
+        team_id INTEGER,
+        FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS venues (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        venueName TEXT NOT NULL UNIQUE,
+        location TEXT NOT NULL,
+        capacity INTEGER NOT NULL
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS team_season_totals (
+        team_id INTEGER,
+        season_year INTEGER,
+        totalPoints INTEGER DEFAULT 0,
+        PRIMARY KEY (team_id, season_year),
+        FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS game_player_stats (
+        game_id INTEGER,
+        player_id INTEGER,
+        points INTEGER DEFAULT 0,
+        PRIMARY KEY (game_id, player_id),
+        FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE,
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+    )
+    """)
+
+    existing_cols = [r[1] for r in cur.execute("PRAGMA table_info(games)").fetchall()]
+
+    if 'team1_id' not in existing_cols:
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS games_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team1_id INTEGER,
+            team2_id INTEGER,
+            venue_id INTEGER,
+            game_date TEXT,
+            team1_score INTEGER DEFAULT 0,
+            team2_score INTEGER DEFAULT 0,
+            start_time TEXT DEFAULT '00:00',
+            end_time TEXT DEFAULT '00:00',
+            is_final INTEGER DEFAULT 0,
+            winner_team_id INTEGER DEFAULT NULL,
+            FOREIGN KEY (team1_id) REFERENCES teams(id),
+            FOREIGN KEY (team2_id) REFERENCES teams(id),
+            FOREIGN KEY (venue_id) REFERENCES venues(id)
+        )
+        """)
+        has_home = 'home_team_id' in existing_cols
+        has_away = 'away_team_id' in existing_cols
+        has_home_score = 'home_score' in existing_cols
+        has_away_score = 'away_score' in existing_cols
+        has_start = 'start_time' in existing_cols
+        has_end = 'end_time' in existing_cols
+        has_is_final = 'is_final' in existing_cols
+        has_winner = 'winner_team_id' in existing_cols
+
+        select_parts = []
+        if has_home: select_parts.append("home_team_id AS team1_id")
+        else: select_parts.append("NULL AS team1_id")
+        if has_away: select_parts.append("away_team_id AS team2_id")
+        else: select_parts.append("NULL AS team2_id")
+        select_parts.append("venue_id")
+        select_parts.append("game_date")
+        if has_home_score: select_parts.append("home_score AS team1_score")
+        else: select_parts.append("0 AS team1_score")
+        if has_away_score: select_parts.append("away_score AS team2_score")
+        else: select_parts.append("0 AS team2_score")
+        if has_start: select_parts.append("start_time")
+        else: select_parts.append("'00:00' AS start_time")
+        if has_end: select_parts.append("end_time")
+        else: select_parts.append("'00:00' AS end_time")
+        if has_is_final: select_parts.append("is_final")
+        else: select_parts.append("0 AS is_final")
+        if has_winner: select_parts.append("winner_team_id")
+        else: select_parts.append("NULL AS winner_team_id")
+
+        select_clause = ", ".join(select_parts)
+        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='games'")
+        if cur.fetchone():
+            cur.execute(f"INSERT INTO games_new (team1_id, team2_id, venue_id, game_date, team1_score, team2_score, start_time, end_time, is_final, winner_team_id) SELECT {select_clause} FROM games")
+            cur.execute("DROP TABLE IF EXISTS games")
+        cur.execute("ALTER TABLE games_new RENAME TO games")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS mvps (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_id INTEGER NOT NULL,
+        team_id INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE,
+        FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE,
+        UNIQUE(player_id, year)
+    )
+    """)
+
+def _migration_2_indexes(cur):
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_date ON games (game_date, start_time)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_venue_date ON games (venue_id, game_date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_team1_date ON games (team1_id, game_date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_team2_date ON games (team2_id, game_date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_final_date ON games (is_final, game_date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_winner_date ON games (winner_team_id, game_date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_gps_player ON game_player_stats (player_id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_players_team ON players (team_id)")
+
+def _migration_3_team_season_standings(cur):
+    # team_season_totals was never written to; the per-phase standings table
+    # below replaces it and carries points along with the win/loss record.
+    cur.execute("DROP TABLE IF EXISTS team_season_totals")
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS team_season_standings (
+        team_id INTEGER NOT NULL,
+        season_year INTEGER NOT NULL,
+        phase TEXT NOT NULL,
+        games_played INTEGER DEFAULT 0,
+        wins INTEGER DEFAULT 0,
+        losses INTEGER DEFAULT 0,
+        ties INTEGER DEFAULT 0,
+        points_for INTEGER DEFAULT 0,
+        points_against INTEGER DEFAULT 0,
+        PRIMARY KEY (team_id, season_year, phase),
+        FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE CASCADE
+    )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_standings_season ON team_season_standings (season_year, phase)")
+    _rebuild_team_season_standings(cur)
+
+def _migration_4_season_start_year(cur):
+    # Virtual generated column: always consistent with game_date, and indexable
+    # so the distinct season list is a single index scan.
+    sm, sd = Season().season_definitions["Pre-season"][0]
+    cur.execute(f"""
+        ALTER TABLE games ADD COLUMN season_start_year INTEGER
+        GENERATED ALWAYS AS (
+            CAST(substr(game_date, 1, 4) AS INTEGER) - (substr(game_date, 6, 5) < '{sm:02d}-{sd:02d}')
+        ) VIRTUAL
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_games_season ON games (season_start_year, game_date)")
+
+def _migration_5_live_scoring_state(cur):
+    # Highest live-scoring journal sequence number already written for a game,
+    # so a journal replayed after a crash never applies the same click twice.
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS live_scoring_state (
+        game_id INTEGER PRIMARY KEY,
+        last_seq INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+    )
+    """)
+
+def _migration_6_game_events(cur):
+    # Append-only scoring log. game_player_stats, players.points, the games
+    # scores and team_season_standings are all derivable from it by replay.
+    # Events outlive deleted games and players (SET NULL) so career totals and
+    # recorded team scores still replay correctly.
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS game_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
+        game_id INTEGER,
+        player_id INTEGER,
+        team_id INTEGER,
+        delta INTEGER NOT NULL DEFAULT 0,
+        event_type TEXT NOT NULL,
+        FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE SET NULL,
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE SET NULL,
+        FOREIGN KEY (team_id) REFERENCES teams(id) ON DELETE SET NULL
+    )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_game ON game_events (game_id, id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_player ON game_events (player_id)")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS game_snapshots (
+        game_id INTEGER PRIMARY KEY,
+        last_event_id INTEGER NOT NULL,
+        box_score TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
+        FOREIGN KEY (game_id) REFERENCES games(id) ON DELETE CASCADE
+    )
+    """)
+
+    # Seed the log from the existing counters: one 'baseline' event per box
+    # score line, team-level remainders so replayed scores match the stored
+    # ones, and 'career_adjust' events for points not attributed to a game.
+    cur.execute("""
+        INSERT INTO game_events (game_id, player_id, team_id, delta, event_type)
+        SELECT gps.game_id, gps.player_id, p.team_id, gps.points, 'baseline'
+        FROM game_player_stats gps
+        JOIN players p ON p.id = gps.player_id
+        WHERE gps.points != 0
+        ORDER BY gps.game_id, gps.player_id
+    """)
+    for side in ("team1", "team2"):
+        cur.execute(f"""
+            INSERT INTO game_events (game_id, team_id, delta, event_type)
+            SELECT id, tid, diff, 'baseline' FROM (
+                SELECT g.id, g.{side}_id AS tid,
+                       COALESCE(g.{side}_score, 0) - COALESCE((
+                           SELECT SUM(e.delta) FROM game_events e
+                           WHERE e.game_id = g.id AND e.team_id = g.{side}_id
+                       ), 0) AS diff
+                FROM games g WHERE g.{side}_id IS NOT NULL
+            ) WHERE diff != 0
+        """)
+    cur.execute("""
+        INSERT INTO game_events (player_id, team_id, delta, event_type)
+        SELECT id, team_id, diff, 'career_adjust' FROM (
+            SELECT p.id, p.team_id,
+                   COALESCE(p.points, 0) - COALESCE((
+                       SELECT SUM(gps.points) FROM game_player_stats gps WHERE gps.player_id = p.id
+                   ), 0) AS diff
+            FROM players p
+        ) WHERE diff != 0
+    """)
+    cur.execute("""
+        INSERT INTO game_events (game_id, team_id, event_type)
+        SELECT id, winner_team_id, 'final' FROM games WHERE is_final = 1
+    """)
+
+# search_index rowids are id * 4 + kind code, so a trigger can drop one
+# document by rowid without scanning the index.
+_SEARCH_VIEWS = {
+    'search_team_docs': """
+        SELECT id * 4 AS doc_id, 'team' AS kind, id AS ref_id, teamName AS title, '' AS body
+        FROM teams
+    """,
+    'search_player_docs': """
+        SELECT p.id * 4 + 1 AS doc_id, 'player' AS kind, p.id AS ref_id, p.name AS title,
+               COALESCE('#' || p.jerseyNumber || ' ', '') || COALESCE(t.teamName, '') AS body,
+               p.team_id
+        FROM players p LEFT JOIN teams t ON t.id = p.team_id
+    """,
+    'search_venue_docs': """
+        SELECT id * 4 + 2 AS doc_id, 'venue' AS kind, id AS ref_id, venueName AS title,
+               COALESCE(location, '') || ' ' || COALESCE(capacity, '') AS body
+        FROM venues
+    """,
+    'search_game_docs': """
+        SELECT g.id * 4 + 3 AS doc_id, 'game' AS kind, g.id AS ref_id,
+               COALESCE(t1.teamName, 'Unknown') || ' vs ' || COALESCE(t2.teamName, 'Unknown') AS title,
+               COALESCE(v.venueName, '') || ' ' || COALESCE(g.game_date, '') || ' ' || COALESCE(g.start_time, '') AS body,
+               g.team1_id, g.team2_id, g.venue_id
+        FROM games g
+        LEFT JOIN teams t1 ON t1.id = g.team1_id
+        LEFT JOIN teams t2 ON t2.id = g.team2_id
+        LEFT JOIN venues v ON v.id = g.venue_id
+    """,
+}
+
+def _search_reindex(view, where):
+    return f"""
+        DELETE FROM search_index WHERE rowid IN (SELECT doc_id FROM {view} WHERE {where});
+        INSERT INTO search_index (rowid, kind, ref_id, title, body)
+            SELECT doc_id, kind, ref_id, title, body FROM {view} WHERE {where};
+    """
+
+def _migration_7_search_index(cur):
+    # Full-text index over team, player, venue and game names, kept in sync by
+    # triggers. Score updates do not touch any indexed column, so live scoring
+    # never writes to it.
+    cur.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+            kind UNINDEXED, ref_id UNINDEXED, title, body,
+            tokenize = 'unicode61', prefix = '2 3'
+        )
+    """)
+    for view, sql in _SEARCH_VIEWS.items():
+        cur.execute(f"CREATE VIEW IF NOT EXISTS {view} AS {sql}")
+        cur.execute(f"INSERT INTO search_index (rowid, kind, ref_id, title, body) SELECT doc_id, kind, ref_id, title, body FROM {view}")
+
+    triggers = {
+        'teams': (0, 'teamName',
+                  _search_reindex('search_team_docs', 'ref_id = new.id')
+                  + _search_reindex('search_player_docs', 'team_id = new.id')
+                  + _search_reindex('search_game_docs', 'team1_id = new.id OR team2_id = new.id')),
+        'players': (1, 'name, jerseyNumber, team_id', _search_reindex('search_player_docs', 'ref_id = new.id')),
+        'venues': (2, 'venueName, location, capacity',
+                   _search_reindex('search_venue_docs', 'ref_id = new.id')
+                   + _search_reindex('search_game_docs', 'venue_id = new.id')),
+        'games': (3, 'team1_id, team2_id, venue_id, game_date, start_time',
+                  _search_reindex('search_game_docs', 'ref_id = new.id')),
+    }
+    views = {'teams': 'search_team_docs', 'players': 'search_player_docs',
+             'venues': 'search_venue_docs', 'games': 'search_game_docs'}
+    for table, (code, columns, reindex) in triggers.items():
+        cur.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} BEGIN
+                {_search_reindex(views[table], 'ref_id = new.id')}
+            END
+        """)
+        cur.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_au AFTER UPDATE OF {columns} ON {table} BEGIN
+                {reindex}
+            END
+        """)
+        cur.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM search_index WHERE rowid = old.id * 4 + {code};
+            END
+        """)
+
+def _migration_8_team_ratings(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS team_ratings (
+            team_id INTEGER PRIMARY KEY,
+            rating REAL NOT NULL,
+            games INTEGER NOT NULL DEFAULT 0,
+            season_start_year INTEGER,
+            FOREIGN KEY(team_id) REFERENCES teams(id) ON DELETE CASCADE
+        )
+    """)
+    # seq is the order games were rated in, so "rating after a team's last
+    # game" is a max(seq) lookup even for games on the same day.
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS rating_history (
+            seq INTEGER NOT NULL,
+            game_id INTEGER NOT NULL,
+            team_id INTEGER NOT NULL,
+            season_start_year INTEGER,
+            game_date TEXT,
+            rating_before REAL NOT NULL,
+            rating_after REAL NOT NULL,
+            PRIMARY KEY (game_id, team_id)
+        )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_rating_history_team ON rating_history (team_id, seq)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_rating_history_season ON rating_history (season_start_year, team_id, seq)")
+    _rebuild_team_ratings(cur)
+
+def _migration_9_drop_team_season_standings(cur):
+    # Standings are computed from games by standingsEngine; nothing read the
+    # materialized table any more, yet every game write had to maintain it.
+    cur.execute("DROP INDEX IF EXISTS idx_standings_season")
+    cur.execute("DROP TABLE IF EXISTS team_season_standings")
+
+def _migration_10_rating_history_seq(cur):
+    # Lets _refresh_ratings find the next seq with a MAX() index lookup.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_rating_history_seq ON rating_history (seq)")
+
+def _migration_11_restore_team_season_standings(cur):
+    # Migration 9 dropped the table, but standingsEngine reads its totals;
+    # recreate and backfill it exactly as migration 3 does.
+    _migration_3_team_season_standings(cur)
+
+def _migration_12_team_history_indexes(cur):
+    # Match the NULL-safe keyset of the team history popup, so each branch
+    # walks an index newest first instead of sorting the team's games.
+    for side in ("team1_id", "team2_id"):
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_games_{side.split('_')[0]}_history
+            ON games ({side}, COALESCE(game_date, ''), COALESCE(start_time, ''))
+        """)
+
+# Each entry upgrades the schema from version N-1 to N. Append new steps at the
+# end and bump SCHEMA_VERSION; never edit a step that has already shipped.
+_MIGRATIONS = [
+    _migration_1_base_schema,
+    _migration_2_indexes,
+    _migration_3_team_season_standings,
+    _migration_4_season_start_year,
+    _migration_5_live_scoring_state,
+    _migration_6_game_events,
+    _migration_7_search_index,
+    _migration_8_team_ratings,
+    _migration_9_drop_team_season_standings,
+    _migration_10_rating_history_seq,
+    _migration_11_restore_team_season_standings,
+    _migration_12_team_history_indexes,
+]
+
+def migrate(conn):
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    if current >= SCHEMA_VERSION:
+        return current
+
+    cur = conn.cursor()
+    try:
+        for version in range(current + 1, SCHEMA_VERSION + 1):
+            try:
+                cur.execute("BEGIN")
+                _MIGRATIONS[version - 1](cur)
+                cur.execute(f"PRAGMA user_version = {version}")
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"[theDB] Migration {version} failed: {e}")
+                raise
+    finally:
+        cur.close()
+    return SCHEMA_VERSION
+
+_games_version = 0
+_roster_version = 0
+_venues_version = 0
+
+def games_version():
+    """Counter bumped by every GameChanged event; used to invalidate caches."""
+    return _games_version
+
+def roster_version():
+    """Counter bumped by every RosterChanged event."""
+    return _roster_version
+
+def venues_version():
+    """Counter bumped by every VenueChanged event."""
+    return _venues_version
+
+def _deliver(event):
+    global _games_version, _roster_version, _venues_version
+    if isinstance(event, GameChanged):
+        _games_version += 1
+    elif isinstance(event, RosterChanged):
+        _roster_version += 1
+    elif isinstance(event, VenueChanged):
+        _venues_version += 1
+    bus.publish(event)
+
+def _publish(event):
+    """Publishes a change on the event bus, bumping games_version for games writes.
+
+    Inside a ScheduleManager write the event waits until the write has
+    committed and released the writer lock, so subscribers never run under it.
+    """
+    connections.after_commit(_deliver, event)
+
+def _season_of(game_date):
+    return season_calendar.classify(game_date)[0] if game_date else None
+
+_FINAL_GAME_COLUMNS = "id, team1_id, team2_id, team1_score, team2_score, winner_team_id, game_date, start_time, is_final"
+
+def _standings_deltas(game, sign):
+    """Per-team standings rows contributed by one finalized game (sign=-1 reverts it)."""
+    season_year, phase = season_calendar.classify(game['game_date'])
+    if season_year is None or phase is None:
+        return []
+    s1 = game['team1_score'] or 0
+    s2 = game['team2_score'] or 0
+    winner = game['winner_team_id']
+    deltas = []
+    for tid, pts_for, pts_against in ((game['team1_id'], s1, s2), (game['team2_id'], s2, s1)):
+        if tid is None:
+            continue
+        win = 1 if winner is not None and winner == tid else 0
+        loss = 1 if winner is not None and winner != tid else 0
+        tie = 1 if winner is None else 0
+        deltas.append((tid, season_year, phase, sign, sign * win, sign * loss, sign * tie,
+                       sign * pts_for, sign * pts_against))
+    return deltas
+
+def _apply_standings_deltas(cur, deltas):
+    if not deltas:
+        return
+    cur.executemany("""
+        INSERT INTO team_season_standings
+            (team_id, season_year, phase, games_played, wins, losses, ties, points_for, points_against)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(team_id, season_year, phase) DO UPDATE SET
+            games_played = games_played + excluded.games_played,
+            wins = wins + excluded.wins,
+            losses = losses + excluded.losses,
+            ties = ties + excluded.ties,
+            points_for = points_for + excluded.points_for,
+            points_against = points_against + excluded.points_against
+    """, deltas)
+    # Only the keys just touched can have dropped to zero games; each is a primary key lookup.
+    cur.executemany("""
+        DELETE FROM team_season_standings
+        WHERE team_id = ? AND season_year = ? AND phase = ? AND games_played <= 0
+    """, list({d[:3] for d in deltas}))
+
+def _apply_final_game(cur, game, sign):
+    if game and game['is_final']:
+        _apply_standings_deltas(cur, _standings_deltas(game, sign))
+
+def _rebuild_team_season_standings(cur):
+    cur.execute("DELETE FROM team_season_standings")
+    cur.execute(f"SELECT {_FINAL_GAME_COLUMNS} FROM games WHERE is_final = 1")
+    deltas = []
+    for game in cur.fetchall():
+        deltas.extend(_standings_deltas(game, 1))
+    _apply_standings_deltas(cur, deltas)
+
+def _elo_step(state, game, season):
+    """
+    Rates one finalized game of `season` against state ({team_id: [rating, games, season_start_year]}),
+    updating it in place. Returns the two rating_history rows without seq.
+    """
+    t1, t2 = game['team1_id'], game['team2_id']
+    if t1 is None or t2 is None:
+        return []
+    ratings = []
+    for tid in (t1, t2):
+        entry = state.setdefault(tid, [ELO_INITIAL, 0, season])
+        if season is not None and entry[2] is not None and season != entry[2]:
+            entry[0] = ELO_INITIAL + ELO_SEASON_CARRYOVER * (entry[0] - ELO_INITIAL)
+        entry[2] = season if season is not None else entry[2]
+        ratings.append(entry[0])
+    r1, r2 = ratings
+    s1, s2 = game['team1_score'] or 0, game['team2_score'] or 0
+    expected = 1.0 / (1.0 + 10 ** ((r2 - r1) / 400.0))
+    winner = game['winner_team_id']
+    if winner is None:
+        actual, multiplier = 0.5, 1.0
+    else:
+        actual = 1.0 if winner == t1 else 0.0
+        winner_edge = (r1 - r2) if winner == t1 else (r2 - r1)
+        # Margin-of-victory multiplier, damped when the favourite wins. The
+        # denominator is floored so an upset across a gap of 1250+ points
+        # cannot divide by zero or flip the sign of the update.
+        multiplier = (abs(s1 - s2) + 3) ** 0.8 / max(7.5 + 0.006 * winner_edge, 1.0)
+    delta = ELO_K * multiplier * (actual - expected)
+    rows = []
+    for tid, before, after in ((t1, r1, r1 + delta), (t2, r2, r2 - delta)):
+        state[tid][0] = after
+        state[tid][1] += 1
+        rows.append((game['id'], tid, season, game['game_date'], before, after))
+    return rows
+
+def _write_ratings(cur, state, history, first_seq):
+    cur.executemany("""
+        INSERT INTO rating_history (seq, game_id, team_id, season_start_year, game_date, rating_before, rating_after)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, [(first_seq + i,) + row for i, row in enumerate(history)])
+    cur.executemany("""
+        INSERT INTO team_ratings (team_id, rating, games, season_start_year) VALUES (?, ?, ?, ?)
+        ON CONFLICT(team_id) DO UPDATE SET rating = excluded.rating, games = excluded.games,
+            season_start_year = excluded.season_start_year
+    """, [(tid, r, n, season) for tid, (r, n, season) in state.items()])
+
+def _rebuild_team_ratings(cur):
+    """Replays every finalized game in date order into team_ratings and rating_history."""
+    cur.execute("DELETE FROM rating_history")
+    cur.execute("DELETE FROM team_ratings")
+    cur.execute(f"""
+        SELECT {_FINAL_GAME_COLUMNS} FROM games WHERE is_final = 1
+        ORDER BY game_date, start_time, id
+    """)
+    games = cur.fetchall()
+    seasons = season_calendar.classify_many([g['game_date'] for g in games])
+    state = {}
+    history = []
+    for game, (season, _) in zip(games, seasons):
+        history.extend(_elo_step(state, game, season))
+    _write_ratings(cur, state, history, 1)
+    return len(history) // 2
+
+def _rating_order(game_date, start_time, game_id):
+    """Sort key matching the ORDER BY of _rebuild_team_ratings."""
+    return (game_date or "", start_time or "", game_id)
+
+def _refresh_ratings(cur, *game_ids):
+    """
+    Keeps ratings current after games changed: a newly finalized game is rated
+    in O(1) from the two teams' current ratings. Changing or removing a game
+    that was already rated, or finalizing one that sorts before a team's last
+    rated game, replays the whole history so it stays in date order.
+    """
+    ids = [g for g in game_ids if g is not None]
+    if not ids:
+        return
+    cur.execute(f"SELECT 1 FROM rating_history WHERE game_id IN ({','.join('?' * len(ids))}) LIMIT 1", ids)
+    if cur.fetchone():
+        _rebuild_team_ratings(cur)
+        return
+    cur.execute(f"SELECT {_FINAL_GAME_COLUMNS} FROM games WHERE is_final = 1 AND id IN ({','.join('?' * len(ids))}) "
+                "ORDER BY game_date, start_time, id", ids)
+    games = cur.fetchall()
+    if not games:
+        return
+    first = {}
+    for g in games:
+        for t in (g['team1_id'], g['team2_id']):
+            if t is not None and t not in first:
+                first[t] = _rating_order(g['game_date'], g['start_time'], g['id'])
+    for t, key in first.items():
+        cur.execute("""
+            SELECT h.game_id, h.game_date, g.start_time FROM rating_history h
+            LEFT JOIN games g ON g.id = h.game_id
+            WHERE h.team_id = ? ORDER BY h.seq DESC LIMIT 1
+        """, (t,))
+        last = cur.fetchone()
+        if last and _rating_order(last['game_date'], last['start_time'], last['game_id']) > key:
+            _rebuild_team_ratings(cur)
+            return
+    teams = set(first)
+    cur.execute(f"SELECT team_id, rating, games, season_start_year FROM team_ratings WHERE team_id IN ({','.join('?' * len(teams))})",
+                list(teams))
+    state = {r['team_id']: [r['rating'], r['games'], r['season_start_year']] for r in cur.fetchall()}
+    history = []
+    for game, (season, _) in zip(games, season_calendar.classify_many([g['game_date'] for g in games])):
+        history.extend(_elo_step(state, game, season))
+    cur.execute("SELECT MAX(seq) FROM rating_history")
+    _write_ratings(cur, {t: state[t] for t in teams if t in state}, history, (cur.fetchone()[0] or 0) + 1)
+
+def _log_events(cur, game_id, events, event_type):
+    """Appends (ts, player_id, team_id, delta) events; a ts of None means now."""
+    cur.executemany("""
+        INSERT INTO game_events (ts, game_id, player_id, team_id, delta, event_type)
+        VALUES (COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', 'now')), ?, ?, ?, ?, ?)
+    """, [(ts, game_id, pid, tid, delta, event_type) for ts, pid, tid, delta in events])
+
+def _write_snapshot(cur, game_id, players, teams, last_event_id):
+    box = {'players': {str(k): v for k, v in players.items()}, 'teams': {str(k): v for k, v in teams.items()}}
+    cur.execute("""
+        INSERT INTO game_snapshots (game_id, last_event_id, box_score) VALUES (?, ?, ?)
+        ON CONFLICT(game_id) DO UPDATE SET last_event_id = excluded.last_event_id,
+            box_score = excluded.box_score, created_at = strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    """, (game_id, last_event_id, json.dumps(box)))
+
+def _maybe_snapshot(cur, game_id, force=False):
+    """Snapshots a game's box score once SNAPSHOT_INTERVAL events have piled up since the last one."""
+    cur.execute("SELECT last_event_id FROM game_snapshots WHERE game_id = ?", (game_id,))
+    row = cur.fetchone()
+    since = row['last_event_id'] if row else 0
+    cur.execute("SELECT COUNT(*) AS n, MAX(id) AS last_id FROM game_events WHERE game_id = ? AND id > ?", (game_id, since))
+    row = cur.fetchone()
+    if not row['n'] or (not force and row['n'] < SNAPSHOT_INTERVAL):
+        return
+    cur.execute("SELECT player_id, points FROM game_player_stats WHERE game_id = ?", (game_id,))
+    players = {r['player_id']: r['points'] for r in cur.fetchall()}
+    cur.execute("SELECT team1_id, team2_id, team1_score, team2_score FROM games WHERE id = ?", (game_id,))
+    g = cur.fetchone()
+    teams = {g['team1_id']: g['team1_score'] or 0, g['team2_id']: g['team2_score'] or 0}
+    _write_snapshot(cur, game_id, players, teams, row['last_id'])
+
+def rebuild_team_season_standings():
+    cur = mydb.cursor()
+    try:
+        _rebuild_team_season_standings(cur)
+        mydb.commit()
+    finally:
+        cur.close()
+
+class ScheduleManager:
+    def __init__(self):
+        self.mydb = mydb
+
+    @_serialized_write
+    def addTeam(self, team):
+        if isinstance(team, Team):
+            cursor = self.mydb.cursor()
+            cursor.execute("INSERT INTO teams (teamName, totalPoints) VALUES (?, ?)", (team.teamName, team.totalPoints))
+            self.mydb.commit()
+            team.id = cursor.lastrowid
+            cursor.close()
+            _publish(RosterChanged(team.id, "added", team.teamName))
+
+    @_serialized_write
+    def addVenue(self, venue):
+        if isinstance(venue, Venue):
+            cursor = self.mydb.cursor()
+            cursor.execute("INSERT INTO venues (venueName, location, capacity) VALUES (?, ?, ?)", (venue.venueName, venue.location, venue.capacity))
+            self.mydb.commit()
+            venue.venueID = cursor.lastrowid
+            cursor.close()
+            _publish(VenueChanged(venue.venueID, "added", venue.venueName))
+
+    @_serialized_write
+    def _write(self, sql, params, event):
+        cursor = self.mydb.cursor()
+        try:
+            cursor.execute(sql, params)
+            self.mydb.commit()
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+        _publish(event)
+
+    def renameTeam(self, team_id, name):
+        self._write("UPDATE teams SET teamName = ? WHERE id = ?", (name, team_id), RosterChanged(team_id, "renamed", name))
+
+    @_serialized_write
+    def deleteTeam(self, team_id):
+        """Deletes the team, its players and every game it played in, in one transaction."""
+        cursor = self.mydb.cursor()
+        try:
+            seasons = self._delete_team_games(cursor, team_id)
+            cursor.execute("DELETE FROM players WHERE team_id = ?", (team_id,))
+            cursor.execute("DELETE FROM teams WHERE id = ?", (team_id,))
+            self.mydb.commit()
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+        _publish(GamesReset(seasons=seasons))
+        _publish(RosterChanged(team_id, "deleted"))
+
+    def updatePlayer(self, player_id, team_id, name, jersey_number):
+        self._write("UPDATE players SET name = ?, jerseyNumber = ? WHERE id = ?", (name, jersey_number, player_id),
+                    RosterChanged(team_id, "players"))
+
+    def deletePlayer(self, player_id, team_id):
+        self._write("DELETE FROM players WHERE id = ?", (player_id,), RosterChanged(team_id, "players"))
+
+    def updateVenue(self, venue_id, name, location, capacity):
+        self._write("UPDATE venues SET venueName = ?, location = ?, capacity = ? WHERE id = ?",
+                    (name, location, capacity, venue_id), VenueChanged(venue_id, "updated", name))
+
+    def deleteVenue(self, venue_id):
+        self._write("DELETE FROM venues WHERE id = ?", (venue_id,), VenueChanged(venue_id, "deleted"))
+
+    def gameResults(self, gameID):
+        cursor = self.mydb.cursor()
+        cursor.execute("""
+        SELECT g.id, t1.teamName AS team1, t2.teamName AS team2, v.venueName, g.game_date, g.team1_score, g.team2_score
+        FROM games g
+        LEFT JOIN teams t1 ON g.team1_id = t1.id
+        LEFT JOIN teams t2 ON g.team2_id = t2.id
+        LEFT JOIN venues v ON g.venue_id = v.id
+        WHERE g.id = ?
+        """, (gameID,))
+        result = cursor.fetchone()
+        cursor.close()
+        if result:
+            return {
+                'gameID': result['id'],
+                'team1': result['team1'],
+                'team2': result['team2'],
+                'venue': result['venueName'],
+                'date': result['game_date'],
+                'score': f"{result['team1_score']}-{result['team2_score']}"
+            }
+        return None
+
+    @_serialized_write
+    def scheduleGame(self, team1_id, team2_id, venue_id, game_date, start_time='00:00', end_time='00:00'):
+        cursor = self.mydb.cursor()
+        cursor.execute("INSERT INTO games (team1_id, team2_id, venue_id, game_date, start_time, end_time, team1_score, team2_score) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (team1_id, team2_id, venue_id, game_date, start_time, end_time, 0, 0))
+        self.mydb.commit()
+        game_id = cursor.lastrowid
+        cursor.close()
+        _publish(GameScheduled(game_id, (_season_of(game_date),)))
+        return game_id
+
+    @_serialized_write
+    def _insert_games(self, rows):
+        """executemany insert in one transaction; returns the new ids in row order."""
+        cursor = self.mydb.cursor()
+        try:
+            cursor.executemany("INSERT INTO games (team1_id, team2_id, venue_id, game_date, start_time, end_time, team1_score, team2_score) VALUES (?, ?, ?, ?, ?, ?, 0, 0)", rows)
+            # AUTOINCREMENT ids are handed out consecutively inside a single transaction.
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+            self.mydb.commit()
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+        _publish(GamesReset(seasons={_season_of(r[3]) for r in rows}))
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def scheduleGames(self, games):
+        """Inserts (team1_id, team2_id, venue_id, game_date, start_time, end_time) rows in one transaction."""
+        rows = [tuple(g) for g in games]
+        if not rows: return 0
+        self._insert_games(rows)
+        return len(rows)
+
+    def bulk_schedule_games(self, games):
+        """Validates and schedules many games by name in a single transaction.
+
+        Each item is a dict with team1, team2, venue, date (YYYY-MM-DD), start and
+        end (HH:MM), or a tuple in that order. Rows are checked against booked
+        games and against each other with the same rules as the Schedule Game
+        form. Returns one report dict per input row:
+        {'row': index, 'ok': bool, 'game_id': id or None, 'error': message or None}.
+        """
+        from conflictEngine import conflict_engine
+
+        keys = ('team1', 'team2', 'venue', 'date', 'start', 'end')
+        items = [dict(g) if isinstance(g, dict) else dict(zip(keys, g)) for g in games]
+        report = [{'row': i, 'ok': False, 'game_id': None, 'error': None} for i in range(len(items))]
+        if not items: return report
+
+        team_names = {str(it.get('team1') or '') for it in items} | {str(it.get('team2') or '') for it in items}
+        venue_names = {str(it.get('venue') or '') for it in items}
+        cursor = self.mydb.cursor()
+        try:
+            cursor.execute(f"SELECT id, teamName FROM teams WHERE teamName IN ({','.join(['?'] * len(team_names))})", list(team_names))
+            team_ids = {r['teamName']: r['id'] for r in cursor.fetchall()}
+            cursor.execute(f"SELECT id, venueName FROM venues WHERE venueName IN ({','.join(['?'] * len(venue_names))})", list(venue_names))
+            venue_ids = {r['venueName']: r['id'] for r in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+        candidates = []
+        for i, it in enumerate(items):
+            t1, t2, v = it.get('team1'), it.get('team2'), it.get('venue')
+            if not all(it.get(k) for k in keys):
+                report[i]['error'] = "Missing fields."
+                continue
+            if t1 == t2:
+                report[i]['error'] = "Teams must be different."
+                continue
+            if t1 not in team_ids or t2 not in team_ids or v not in venue_ids:
+                report[i]['error'] = "Teams or Venue not found."
+                continue
+            try:
+                game_date = datetime.strptime(str(it['date']), "%Y-%m-%d").date().isoformat()
+                s_time = datetime.strptime(str(it['start']), "%H:%M").strftime("%H:%M")
+                e_time = datetime.strptime(str(it['end']), "%H:%M").strftime("%H:%M")
+            except ValueError:
+                report[i]['error'] = "Check Date (YYYY-MM-DD) and Time (HH:MM)."
+                continue
+            if e_time <= s_time:
+                report[i]['error'] = "End time must be after start time."
+                continue
+            candidates.append((i, (team_ids[t1], team_ids[t2], venue_ids[v], game_date, s_time, e_time)))
+
+        labels = [((items[i]['team1'], items[i]['team2']), items[i]['venue']) for i, _ in candidates]
+        results = conflict_engine.check_batch([row for _, row in candidates], labels=labels)
+        to_insert = []
+        for (i, row), msg in zip(candidates, results):
+            if msg:
+                report[i]['error'] = msg
+            else:
+                to_insert.append((i, row))
+
+        if to_insert:
+            new_ids = self._insert_games([row for _, row in to_insert])
+            for (i, _), gid in zip(to_insert, new_ids):
+                report[i]['ok'] = True
+                report[i]['game_id'] = gid
+        return report
+
+    def _fetch_game(self, cursor, game_id):
+        cursor.execute(f"SELECT {_FINAL_GAME_COLUMNS} FROM games WHERE id = ?", (game_id,))
+        return cursor.fetchone()
+
+    @_serialized_write
+    def updateGame(self, game_id, team1_id, team2_id, venue_id, game_date, start_time='00:00', end_time='00:00'):
+        cursor = self.mydb.cursor()
+        try:
+            old = self._fetch_game(cursor, game_id)
+            _apply_final_game(cursor, old, -1)
+            cursor.execute("""
+                UPDATE games SET team1_id = ?, team2_id = ?, venue_id = ?, game_date = ?, start_time = ?, end_time = ?
+                WHERE id = ?
+            """, (team1_id, team2_id, venue_id, game_date, start_time, end_time, game_id))
+            _apply_final_game(cursor, self._fetch_game(cursor, game_id), 1)
+            _refresh_ratings(cursor, game_id)
+            self.mydb.commit()
+            _publish(GameUpdated(game_id, (_season_of(old['game_date']) if old else None, _season_of(game_date))))
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @_serialized_write
+    def applyScoreDeltas(self, game_id, player_deltas, team1_score, team2_score, last_seq=None, events=None):
+        """Writes coalesced live-scoring deltas ({player_id: points}) and both team scores in one transaction.
+
+        events holds the individual (ts, player_id, team_id, delta) clicks behind
+        the deltas; they are appended to game_events in the same transaction.
+        """
+        cursor = self.mydb.cursor()
+        try:
+            game = self._fetch_game(cursor, game_id)
+            if not game:
+                raise ValueError("Game not found")
+            if game['is_final']:
+                raise ValueError("Game is over.")
+            deltas = [(pid, d) for pid, d in player_deltas.items() if d]
+            cursor.executemany("""
+                INSERT INTO game_player_stats (game_id, player_id, points) VALUES (?, ?, ?)
+                ON CONFLICT(game_id, player_id) DO UPDATE SET points = points + excluded.points
+            """, [(game_id, pid, d) for pid, d in deltas])
+            cursor.executemany("UPDATE players SET points = points + ? WHERE id = ?", [(d, pid) for pid, d in deltas])
+            cursor.execute("UPDATE games SET team1_score = ?, team2_score = ? WHERE id = ?", (team1_score, team2_score, game_id))
+            if events:
+                _log_events(cursor, game_id, events, 'points')
+                _maybe_snapshot(cursor, game_id)
+            if last_seq is not None:
+                cursor.execute("""
+                    INSERT INTO live_scoring_state (game_id, last_seq) VALUES (?, ?)
+                    ON CONFLICT(game_id) DO UPDATE SET last_seq = excluded.last_seq
+                """, (game_id, last_seq))
+            self.mydb.commit()
+            _publish(ScoreChanged(game_id, (_season_of(game['game_date']),)))
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @_serialized_write
+    def deleteGame(self, game_id):
+        cursor = self.mydb.cursor()
+        try:
+            game = self._fetch_game(cursor, game_id)
+            _apply_final_game(cursor, game, -1)
+            cursor.execute("DELETE FROM games WHERE id = ?", (game_id,))
+            _refresh_ratings(cursor, game_id)
+            self.mydb.commit()
+            _publish(GameDeleted(game_id, (_season_of(game['game_date']) if game else None,)))
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _delete_team_games(self, cursor, team_id):
+        """Deletes a team's games with their standings and ratings upkeep, uncommitted; returns the seasons touched."""
+        cursor.execute(f"SELECT {_FINAL_GAME_COLUMNS} FROM games WHERE team1_id = ? OR team2_id = ?",
+                       (team_id, team_id))
+        games = cursor.fetchall()
+        deltas = []
+        for game in games:
+            if game['is_final']:
+                deltas.extend(_standings_deltas(game, -1))
+        _apply_standings_deltas(cursor, deltas)
+        cursor.execute("DELETE FROM games WHERE team1_id = ? OR team2_id = ?", (team_id, team_id))
+        _refresh_ratings(cursor, *(g['id'] for g in games))
+        cursor.execute("DELETE FROM team_ratings WHERE team_id = ?", (team_id,))
+        return {_season_of(g['game_date']) for g in games}
+
+    @_serialized_write
+    def deleteTeamGames(self, team_id):
+        cursor = self.mydb.cursor()
+        try:
+            seasons = self._delete_team_games(cursor, team_id)
+            self.mydb.commit()
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+        _publish(GamesReset(seasons=seasons))
+
+    @_serialized_write
+    def recordCorrection(self, game_id, player_id, team_id, delta):
+        """Appends a 'correction' event; run ReplayEngine.rebuild() to fold it into the counters."""
+        cursor = self.mydb.cursor()
+        try:
+            _log_events(cursor, game_id, [(None, player_id, team_id, delta)], 'correction')
+            self.mydb.commit()
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @_serialized_write
+    def replaceScoringTotals(self, box_scores, team_scores, careers, last_event_ids):
+        """Overwrites every derived scoring counter with replayed values in one transaction.
+
+        box_scores maps (game_id, player_id) -> points, team_scores maps
+        (game_id, team_id) -> points, careers maps player_id -> points and
+        last_event_ids maps game_id -> the last event folded into it.
+        """
+        cursor = self.mydb.cursor()
+        try:
+            cursor.execute("SELECT id FROM games")
+            game_ids = {r['id'] for r in cursor.fetchall()}
+            cursor.execute("SELECT id FROM players")
+            player_ids = {r['id'] for r in cursor.fetchall()}
+
+            cursor.execute("DELETE FROM game_player_stats")
+            cursor.executemany("INSERT INTO game_player_stats (game_id, player_id, points) VALUES (?, ?, ?)",
+                               [(gid, pid, pts) for (gid, pid), pts in box_scores.items()
+                                if pts and gid in game_ids and pid in player_ids])
+            cursor.execute("UPDATE players SET points = 0")
+            cursor.executemany("UPDATE players SET points = ? WHERE id = ?",
+                               [(pts, pid) for pid, pts in careers.items() if pid in player_ids])
+
+            cursor.execute("SELECT id, team1_id, team2_id FROM games")
+            rows = [(team_scores.get((r['id'], r['team1_id']), 0), team_scores.get((r['id'], r['team2_id']), 0), r['id'])
+                    for r in cursor.fetchall()]
+            cursor.executemany("UPDATE games SET team1_score = ?, team2_score = ? WHERE id = ?", rows)
+            cursor.execute("""
+                UPDATE games SET winner_team_id = CASE
+                    WHEN team1_score > team2_score THEN team1_id
+                    WHEN team2_score > team1_score THEN team2_id
+                END
+                WHERE is_final = 1
+            """)
+            cursor.execute("""
+                UPDATE teams SET wins = (SELECT COUNT(*) FROM games g WHERE g.is_final = 1 AND g.winner_team_id = teams.id)
+            """)
+            _rebuild_team_season_standings(cursor)
+            _rebuild_team_ratings(cursor)
+
+            per_game = {gid: ({}, {}) for gid in last_event_ids if gid in game_ids}
+            for (gid, pid), pts in box_scores.items():
+                if gid in per_game: per_game[gid][0][pid] = pts
+            for (gid, tid), pts in team_scores.items():
+                if gid in per_game: per_game[gid][1][tid] = pts
+            cursor.execute("DELETE FROM game_snapshots")
+            for gid, (players, teams) in per_game.items():
+                _write_snapshot(cursor, gid, players, teams, last_event_ids[gid])
+            self.mydb.commit()
+            _publish(GamesReset())
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @_serialized_write
+    def rebuildRatings(self):
+        """Replays every finalized game into the Elo tables; returns the number of games rated."""
+        cursor = self.mydb.cursor()
+        try:
+            rated = _rebuild_team_ratings(cursor)
+            self.mydb.commit()
+            return rated
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def isGameFinal(self, game_id):
+        cursor = self.mydb.cursor()
+        cursor.execute("SELECT is_final FROM games WHERE id = ?", (game_id,))
+        r = cursor.fetchone()
+        cursor.close()
+        return bool(r['is_final']) if r and 'is_final' in r.keys() else False
+
+    @_serialized_write
+    def endGame(self, game_id):
+        cursor = self.mydb.cursor()
+        row = self._fetch_game(cursor, game_id)
+        if not row:
+            cursor.close()
+            raise ValueError("Game not found")
+
+        t1_id = row['team1_id']
+        t2_id = row['team2_id']
+        t1_score = row['team1_score']
+        t2_score = row['team2_score']
+
+        winner = None
+        if t1_score > t2_score:
+            winner = t1_id
+        elif t2_score > t1_score:
+            winner = t2_id
+        else:
+            winner = None
+
+        try:
+            _apply_final_game(cursor, row, -1)
+            cursor.execute("UPDATE games SET is_final = 1, winner_team_id = ? WHERE id = ?", (winner, game_id))
+            if winner and not row['is_final']:
+                cursor.execute("UPDATE teams SET wins = wins + 1 WHERE id = ?", (winner,))
+            _apply_final_game(cursor, self._fetch_game(cursor, game_id), 1)
+            _refresh_ratings(cursor, game_id)
+            _log_events(cursor, game_id, [(None, None, winner, 0)], 'final')
+            _maybe_snapshot(cursor, game_id, force=True)
+            self.mydb.commit()
+            _publish(GameFinalized(game_id, (_season_of(row['game_date']),), winner))
+        except Exception:
+            self.mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+        return winner
+
+class SeasonIndex:
+    """Distinct season start years that have games, cached until the games table changes."""
+    def __init__(self):
+        self._years = None
+        self._version = None
+
+    def season_start_years(self):
+        if self._years is None or self._version != games_version():
+            cur = mydb.cursor()
+            try:
+                cur.execute("""
+                    SELECT DISTINCT season_start_year FROM games
+                    WHERE game_date IS NOT NULL AND season_start_year IS NOT NULL
+                    ORDER BY season_start_year DESC
+                """)
+                self._years = [r[0] for r in cur.fetchall()]
+                self._version = games_version()
+            finally:
+                cur.close()
+        return list(self._years)
+
+    def prime(self, years, version):
+        """Accepts a year list computed off the Tk thread if the games table has not changed since."""
+        if version == games_version():
+            self._years = sorted(years, reverse=True)
+            self._version = version
+
+    def invalidate(self):
+        self._years = None
+
+season_index = SeasonIndex()
+
+class Venue:
+    def __init__(self, venueName, location, capacity, venueID=None):
+        self.venueName = venueName
+        self.location = location
+        self.capacity = capacity
+        self.venueID = venueID
+    def checkAvailability(self, date):
+        cursor = mydb.cursor()
+        cursor.execute("SELECT COUNT(*) FROM games WHERE venue_id = ? AND game_date = ?", (self.venueID, date))
+        count = cursor.fetchone()[0]
+        cursor.close()
+        return count == 0
+
+class Team:
+    def __init__(self, teamName, teamID=None):
+        self.teamName = teamName
+        self.id = teamID
+        self.totalPoints = 0
+    @_serialized_write
+    def addPlayer(self, player):
+        """Inserts the player and refreshes the team's totalPoints in one transaction."""
+        if isinstance(player, Player):
+            cursor = mydb.cursor()
+            try:
+                cursor.execute("INSERT INTO players (name, jerseyNumber, points, team_id) VALUES (?, ?, ?, ?)",
+                               (player.name, player.jerseyNumber, player.points, self.id))
+                player_id = cursor.lastrowid
+                self._store_total_points(cursor)
+                mydb.commit()
+            except Exception:
+                mydb.rollback()
+                raise
+            finally:
+                cursor.close()
+            player.id = player_id
+            _publish(RosterChanged(self.id, "players"))
+    @_serialized_write
+    def calcTotalPoints(self):
+        cursor = mydb.cursor()
+        try:
+            self._store_total_points(cursor)
+            mydb.commit()
+        except Exception:
+            mydb.rollback()
+            raise
+        finally:
+            cursor.close()
+    def _store_total_points(self, cursor):
+        cursor.execute("SELECT SUM(points) FROM players WHERE team_id = ?", (self.id,))
+        result = cursor.fetchone()
+        self.totalPoints = result[0] if result[0] else 0
+        cursor.execute("UPDATE teams SET totalPoints = ? WHERE id = ?", (self.totalPoints, self.id))
+
+class Player:
+    def __init__(self, name, jerseyNumber, playerID=None):
+        self.name = name
+        self.jerseyNumber = jerseyNumber
+        self.points = 0
+        self.id = playerID
+    @_serialized_write
+    def addPoints(self, p):
+        self.points += p
+        cursor = mydb.cursor()
+        cursor.execute("UPDATE players SET points = ? WHERE id = ?", (self.points, self.id))
+        mydb.commit()
+        cursor.close()
+
+class MVP(Player):
+    def __init__(self, name, jerseyNumber, year, playerID):
+        super().__init__(name, jerseyNumber, playerID)
+        self.year = year
+    def addMVP(self, mvp, year):
+        if isinstance(mvp, Player):
+            cursor = self.mydb.cursor()
+            cursor.execute("INSERT INTO mvps (player_id, team_id, year) VALUES (?, ?, ?)", (mvp.name, mvp.jerseyNumber, year))
+            self.mydb.commit()
+            cursor.close()
+
+class Season:
+    def __init__(self, year=None):
+        self.year = year
+        self.season_definitions = {
+            "Pre-season": ((9, 25), (10, 16)),
+            "Regular Season": ((10, 17), (4, 16)),  
+            "Play-in": ((4, 17), (4, 24)),
+            "Playoff": ((4, 25), (6, 8)),
+            "Finals": ((6, 9), (6, 24)),
+            "Off-season": ((6, 25), (9, 24)),
+        }
+
+    def get_team_points_for_season(self, team_id, season_year, phase=None):
+        c = mydb.cursor()
+        if phase:
+            c.execute("SELECT SUM(points_for) FROM team_season_standings WHERE team_id = ? AND season_year = ? AND phase = ?",
+                      (team_id, season_year, phase))
+        else:
+            c.execute("SELECT SUM(points_for) FROM team_season_standings WHERE team_id = ? AND season_year = ?",
+                      (team_id, season_year))
+        row = c.fetchone()
+        c.close()
+        return row[0] if row and row[0] is not None else 0
+
+    def get_range(self, season_name, start_year):
+        if season_name not in self.season_definitions:
+            return None, None
+        (sm, sd), (em, ed) = self.season_definitions[season_name]
+        start = datetime(start_year, sm, sd).date()
+        if (em, ed) < (sm, sd):
+            end = datetime(start_year + 1, em, ed).date()
+        else:
+            end = datetime(start_year, em, ed).date()
+        return start, end
+
+    def get_current_season_year(self, game_date_str):
+        try:
+            dt = datetime.strptime(game_date_str, "%Y-%m-%d").date()
+        except:
+            return datetime.now().year - 1
+        if dt.month >= 9:
+            return dt.year
+        else:
+            return dt.year - 1
+
+    def season_start_year(self, d):
+        """Start year of the season (Pre-season through Off-season) containing date d."""
+        sm, sd = self.season_definitions["Pre-season"][0]
+        return d.year if (d.month, d.day) >= (sm, sd) else d.year - 1
+
+    def phase_window(self, season_name, season_start_year):
+        """Like get_range, but anchored on the season's start year instead of the phase's own calendar year."""
+        if season_name not in self.season_definitions:
+            return None, None
+        phase_start = self.season_definitions[season_name][0]
+        if phase_start < self.season_definitions["Pre-season"][0]:
+            return self.get_range(season_name, season_start_year + 1)
+        return self.get_range(season_name, season_start_year)
+
+    def classify(self, game_date):
+        """Returns (season_start_year, phase name) for a date or ISO string, or (None, None)."""
+        return season_calendar.classify(game_date)
+
+
+def _to_ordinal(d):
+    """Proleptic ordinal of a date, ISO string or ordinal int; None if it cannot be read."""
+    if isinstance(d, int):
+        return d
+    if isinstance(d, str):
+        try:
+            return date.fromisoformat(d[:10]).toordinal()
+        except ValueError:
+            return None
+    if isinstance(d, datetime):
+        return d.date().toordinal()
+    if isinstance(d, date):
+        return d.toordinal()
+    return None
+
+class SeasonCalendar:
+    """
+    Precomputed phase windows for a span of season start years.
+
+    The windows of every covered year are flattened into one sorted list
+    of phase start ordinals, so classifying a date is a single bisect
+    instead of rebuilding each phase's range. classify_many() takes a
+    whole column of dates (ISO strings, dates or ordinal ints) at once;
+    the span grows automatically when a date falls outside it.
+
+    DbExecutor threads classify too, so the span lives in one immutable
+    (first, last, bounds, labels) tuple that a rebuild swaps in with a
+    single assignment; readers work on the tuple they fetched. Rebuilds
+    are serialized so the span only ever grows.
+    """
+    def __init__(self, season=None):
+        self.season = season or Season()
+        self._table = (None, None, (), ())
+        self._build_lock = threading.Lock()
+        self._ranges = {}
+        self._windows = {}
+
+    def _build(self, first, last):
+        bounds, labels = [], []
+        for year in range(first, last + 1):
+            for name in self.season.season_definitions:
+                start, end = self.season.phase_window(name, year)
+                if bounds and labels[-1][1] is not None and start.toordinal() > prev_end + 1:
+                    bounds.append(prev_end + 1)
+                    labels.append((labels[-1][0], None))
+                bounds.append(start.toordinal())
+                labels.append((year, name))
+                prev_end = end.toordinal()
+        bounds.append(prev_end + 1)
+        labels.append((None, None))
+        return first, last, tuple(bounds), tuple(labels)
+
+    def _cover(self, ordinals):
+        """The current table, rebuilt first if it does not span the given ordinals."""
+        table = self._table
+        if not ordinals:
+            return table
+        lo = self.season.season_start_year(date.fromordinal(min(ordinals))) - 1
+        hi = self.season.season_start_year(date.fromordinal(max(ordinals))) + 1
+        if table[0] is not None and table[0] <= lo and hi <= table[1]:
+            return table
+        with self._build_lock:
+            table = self._table
+            first, last = table[0], table[1]
+            if first is None or lo < first or hi > last:
+                table = self._build(lo if first is None else min(lo, first), hi if last is None else max(hi, last))
+                self._table = table
+        return table
+
+    def classify_many(self, dates):
+        """[(season_start_year, phase)] for each date, (None, None) where a date is missing or invalid."""
+        ordinals = [_to_ordinal(d) for d in dates]
+        _, _, bounds, labels = self._cover([o for o in ordinals if o is not None])
+        out = []
+        for o in ordinals:
+            i = bisect_right(bounds, o) - 1 if o is not None else -1
+            out.append(labels[i] if i >= 0 else (None, None))
+        return out
+
+    def classify(self, d):
+        return self.classify_many((d,))[0]
+
+    def phase_of(self, d):
+        """Phase name of one date, or "" if it has none."""
+        return self.classify(d)[1] or ""
+
+    def phase_range(self, season_name, start_year):
+        """Memoized Season.get_range (anchored on the phase's own calendar year)."""
+        key = (season_name, start_year)
+        if key not in self._ranges:
+            self._ranges[key] = self.season.get_range(season_name, start_year)
+        return self._ranges[key]
+
+    def phase_window(self, season_name, season_start_year):
+        """Memoized Season.phase_window (anchored on the season's start year)."""
+        key = (season_name, season_start_year)
+        if key not in self._windows:
+            self._windows[key] = self.season.phase_window(season_name, season_start_year)
+        return self._windows[key]
+
+    def window(self, start_year):
+        """(first day of Pre-season, last day of Off-season) of one season."""
+        start, _ = self.phase_range("Pre-season", start_year)
+        _, end = self.phase_range("Off-season", start_year + 1)
+        return start, end
+
+season_calendar = SeasonCalendar()
+
+migrate(mydb)
\ No newline at end of file
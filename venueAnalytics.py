@@ -0,0 +1,175 @@
+import calendar
+from datetime import date, timedelta
+from theDB import *
+
+# Bookable window of a venue per day, used for the available-hours figure.
+VENUE_OPEN = "08:00"
+VENUE_CLOSE = "22:00"
+
+def _minutes_sql(col):
+    return (f"(CAST(substr({col}, 1, instr({col}, ':') - 1) AS INTEGER) * 60"
+            f" + CAST(substr({col}, instr({col}, ':') + 1) AS INTEGER))")
+
+# One indexed range scan on idx_games_venue_date, grouped by day and start slot.
+# The ids of the counted games come back with each group for the game -> venue map.
+_UTILIZATION_SQL = f"""
+    SELECT game_date, start_time, COUNT(*) AS bookings, GROUP_CONCAT(id) AS game_ids,
+           SUM(MAX(0, {_minutes_sql('end_time')} - {_minutes_sql('start_time')})) AS minutes
+    FROM games
+    WHERE venue_id = ? AND game_date BETWEEN ? AND ?
+    GROUP BY game_date, start_time
+"""
+
+def month_range(year, month):
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+class VenueUtilization:
+    """Bookings of one venue over a date range, aggregated per day and per start slot."""
+    def __init__(self, venue_id, start, end, rows):
+        self.venue_id = venue_id
+        self.start = start
+        self.end = end
+        self.days = {}
+        self.slots = {}
+        self.game_ids = []
+        for r in rows:
+            self.game_ids.extend(int(i) for i in r['game_ids'].split(','))
+            bookings, minutes = self.days.get(r['game_date'], (0, 0))
+            self.days[r['game_date']] = (bookings + r['bookings'], minutes + (r['minutes'] or 0))
+            slot = r['start_time'] or "00:00"
+            self.slots[slot] = self.slots.get(slot, 0) + r['bookings']
+
+    @property
+    def day_count(self):
+        return (self.end - self.start).days + 1
+
+    @property
+    def total_bookings(self):
+        return sum(b for b, _ in self.days.values())
+
+    @property
+    def occupied_hours(self):
+        return sum(m for _, m in self.days.values()) / 60
+
+    @property
+    def available_hours(self):
+        open_min, close_min = (int(t[:2]) * 60 + int(t[3:]) for t in (VENUE_OPEN, VENUE_CLOSE))
+        return self.day_count * (close_min - open_min) / 60
+
+    @property
+    def utilization(self):
+        available = self.available_hours
+        return self.occupied_hours / available if available else 0.0
+
+    def day(self, d):
+        """(bookings, occupied minutes) for a date or ISO string."""
+        return self.days.get(d.isoformat() if isinstance(d, date) else d, (0, 0))
+
+    def idle_days(self):
+        return [self.start + timedelta(days=i) for i in range(self.day_count)
+                if (self.start + timedelta(days=i)).isoformat() not in self.days]
+
+    def peak_slots(self, n=3):
+        return sorted(self.slots.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+    def weekly(self):
+        """Bookings per week as [(monday, bookings)], covering every week in the range."""
+        weeks = {}
+        monday = self.start - timedelta(days=self.start.weekday())
+        while monday <= self.end:
+            weeks[monday] = 0
+            monday += timedelta(days=7)
+        for iso, (bookings, _) in self.days.items():
+            d = date.fromisoformat(iso)
+            weeks[d - timedelta(days=d.weekday())] += bookings
+        return sorted(weeks.items())
+
+
+def fetch_utilization(conn, venue_id, start, end):
+    """Runs the grouped query; safe to call from a DB executor thread."""
+    rows = conn.execute(_UTILIZATION_SQL, (venue_id, start.isoformat(), end.isoformat())).fetchall()
+    return VenueUtilization(venue_id, start, end, rows)
+
+
+class VenueAnalytics:
+    """
+    Cache of VenueUtilization results keyed by (venue, start, end).
+
+    Entries for a venue are dropped when one of its games is scheduled,
+    moved, rescheduled or deleted. A game -> venue map of the games counted
+    in cached results is kept so a game moved between venues invalidates
+    both; it is filled from the results themselves. version(venue_id) lets
+    callers computing off-thread detect that the venue changed meanwhile.
+    """
+    def __init__(self, db=None):
+        self.db = db
+        self._cache = {}
+        self._versions = {}
+        self._venue_of = {}
+        self._epoch = 0
+        self._unmapped = 0
+
+    def attach(self):
+        bus.subscribe(GameChanged, self._on_games_changed)
+        bus.subscribe(VenueChanged, self._on_venue_changed)
+        return self
+
+    def version(self, venue_id):
+        return (self._epoch, self._unmapped, self._versions.get(venue_id, 0))
+
+    def cached(self, venue_id, start, end):
+        return self._cache.get((venue_id, start, end))
+
+    def store(self, result, version):
+        """Keeps a result computed elsewhere unless the venue changed since `version`."""
+        if version != self.version(result.venue_id):
+            return False
+        for game_id in result.game_ids:
+            self._venue_of[game_id] = result.venue_id
+        self._cache[(result.venue_id, result.start, result.end)] = result
+        return True
+
+    def utilization(self, venue_id, start, end):
+        """Synchronous lookup on the shared connection, filling the cache."""
+        result = self.cached(venue_id, start, end)
+        if result is None:
+            version = self.version(venue_id)
+            result = fetch_utilization(self.db, venue_id, start, end)
+            self.store(result, version)
+        return result
+
+    def invalidate(self, venue_id):
+        self._versions[venue_id] = self._versions.get(venue_id, 0) + 1
+        for key in [k for k in self._cache if k[0] == venue_id]:
+            del self._cache[key]
+
+    def _reset(self):
+        self._epoch += 1
+        self._cache.clear()
+        self._venue_of.clear()
+
+    def _on_games_changed(self, event):
+        if isinstance(event, (ScoreChanged, GameFinalized)):
+            return
+        if isinstance(event, GamesReset):
+            self._reset()
+            return
+        if event.game_id not in self._venue_of:
+            # Its old venue is unknown here; a result still in flight may
+            # have counted it, so that result must not be stored.
+            self._unmapped += 1
+        old = self._venue_of.pop(event.game_id, None)
+        row = self.db.execute("SELECT venue_id FROM games WHERE id = ?", (event.game_id,)).fetchone()
+        new = row['venue_id'] if row else None
+        if new is not None:
+            self._venue_of[event.game_id] = new
+        for venue_id in {old, new} - {None}:
+            self.invalidate(venue_id)
+
+    def _on_venue_changed(self, event):
+        if event.change == "deleted":
+            self.invalidate(event.venue_id)
+
+
+venue_analytics = VenueAnalytics(mydb).attach()
@@ -1,242 +1,353 @@
-import customtkinter as ctk
-from tkinter import messagebox
-from datetime import datetime, date as _date
-from theDB import *
-
-refs = None
-scheduled_games = [] 
-
-def _season_windows_for_year(year):
-    s_helper = Season()
-    start, _ = s_helper.get_range("Pre-season", year)
-    _, end = s_helper.get_range("Off-season", year + 1)
-    return start, end
-
-def _season_from_iso(date_iso):
-    try:
-        dt = datetime.strptime(date_iso, "%Y-%m-%d").date()
-    except Exception:
-        return ""
-    
-    s_helper = Season()
-    for season_name in s_helper.season_definitions:
-        for anchor in (dt.year, dt.year - 1):
-            start, end = s_helper.get_range(season_name, anchor)
-            if start and start <= dt <= end:
-                return season_name
-    return ""
-
-def _parse_iso(date_iso):
-    try:
-        if not date_iso: return None
-        return datetime.strptime(date_iso, "%Y-%m-%d").date()
-    except Exception:
-        return None
-
-def _fetch_games_from_db_direct():
-    games = []
-    try:
-        cur = mydb.cursor()
-        cur.execute("""
-        SELECT g.id, t1.teamName AS team1, t2.teamName AS team2, v.venueName AS venue, 
-               g.game_date AS date, g.start_time AS start, g.end_time AS end, g.is_final,
-               g.team1_id, g.team2_id, g.team1_score, g.team2_score, g.winner_team_id
-        FROM games g
-        LEFT JOIN teams t1 ON g.team1_id = t1.id
-        LEFT JOIN teams t2 ON g.team2_id = t2.id
-        LEFT JOIN venues v ON g.venue_id = v.id
-        ORDER BY g.game_date, g.start_time
-        """)
-        rows = cur.fetchall()
-        for r in rows:
-            g = dict(r)
-            if not g.get('start'): g['start'] = '00:00'
-            if not g.get('end'): g['end'] = '00:00'
-            games.append(g)
-        cur.close()
-    except Exception as e:
-        print(f"Direct DB fetch failed: {e}")
-    return games
-
-def _compute_season_start_years_with_games():
-    cur = mydb.cursor()
-    try:
-        cur.execute("SELECT MIN(substr(game_date,1,4)) as miny, MAX(substr(game_date,1,4)) as maxy FROM games WHERE game_date IS NOT NULL")
-        r = cur.fetchone()
-        if not r or not r['miny']:
-            return []
-        
-        miny, maxy = int(r['miny']), int(r['maxy'])
-        years_with_games = []
-        for y in range(max(1900, miny - 1), maxy + 1):
-            s, e = _season_windows_for_year(y)
-            cur.execute("SELECT 1 FROM games WHERE game_date BETWEEN ? AND ? LIMIT 1", (s.isoformat(), e.isoformat()))
-            if cur.fetchone():
-                years_with_games.append(y)
-        years_with_games.sort(reverse=True)
-        return years_with_games
-    finally:
-        cur.close()
-
-def _format_season_header(year):
-    s, e = _season_windows_for_year(year)
-    return f"Season {e.year} — {s} → {e}"
-
-class GamePreviewPanel:
-    def show_details(self, index, game_data):
-        game = game_data
-        if not game: return
-        
-        if refs and isinstance(refs, dict):
-            refs["selected_game"] = game
-        
-        s1 = int(game.get('team1_score') or 0)
-        s2 = int(game.get('team2_score') or 0)
-        
-        is_final = bool(game.get('is_final'))
-        
-        winner_text = "TBD"
-        if is_final:
-            if game.get('winner_team_id'):
-                w_id = game.get('winner_team_id')
-                if w_id == game.get('team1_id'):
-                    winner_text = game.get('team1')
-                elif w_id == game.get('team2_id'):
-                    winner_text = game.get('team2')
-            else:
-                winner_text = "Tie"
-
-        details = (
-            f"Matchup: {game.get('team1')} vs {game.get('team2')}\n"
-            f"Venue:   {game.get('venue')}\n\n"
-            f"Date:    {game.get('date')}\n"
-            f"Time:    {game.get('start')} - {game.get('end')}\n\n"
-            f"Score:   {s1} - {s2}\n"
-            f"Status:  {'Final' if is_final else 'Active'}\n"
-            f"Winner:  {winner_text if is_final else 'N/A'}"
-        )
-        if refs.get("details_content"):
-            refs["details_content"].configure(text=details)
-
-class GameButtonControls:
-    def __init__(self, preview_handler):
-        self.preview = preview_handler
-
-    def create_buttons(self, parent_frame, game_data, index_in_group):
-        ctk.CTkButton(parent_frame, text="View", width=60, 
-                      command=lambda g=game_data, i=index_in_group: self.preview.show_details(i, g)
-                      ).grid(row=0, column=7, padx=4)
-        
-        ctk.CTkButton(parent_frame, text="Delete", width=60, fg_color="#F44336", 
-                      command=lambda gid=game_data['id']: self.delete_logic(gid)
-                      ).grid(row=0, column=8, padx=4)
-
-    def delete_logic(self, game_id):
-        if messagebox.askyesno("Delete", "Delete this game?"):
-            sm = ScheduleManager()
-            try:
-                sm.deleteGame(game_id)
-                if refs.get('scheduled_games_table'):
-                    refresh_scheduled_games_table(refs['scheduled_games_table'])
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not delete game: {e}")
-
-class ScheduledGamesDisplay:
-    def __init__(self, container):
-        self.container = container
-        self.preview_handler = GamePreviewPanel()
-        self.button_controls = GameButtonControls(self.preview_handler)
-
-    def render(self):
-        for widget in self.container.winfo_children():
-            widget.destroy()
-
-        src_games = _fetch_games_from_db_direct()
-        
-        scheduled_games.clear()
-        scheduled_games.extend(src_games)
-        try:
-            import scheduleGameTab as sgt
-            sgt.scheduled_games.clear()
-            sgt.scheduled_games.extend(src_games)
-        except Exception:
-            pass
-
-        years = _compute_season_start_years_with_games()
-
-        if not years:
-            ctk.CTkLabel(self.container, text="No scheduled seasons found (DB empty or dates invalid).").pack(padx=8, pady=8)
-            return
-
-        for year in years:
-            self._render_season_block(year, src_games)
-
-    def _render_season_block(self, year, all_games):
-        start_dt, end_dt = _season_windows_for_year(year)
-        
-        h = ctk.CTkFrame(self.container, fg_color="#1E1E1E")
-        h.pack(fill="x", padx=8, pady=(12, 6))
-        ctk.CTkLabel(h, text=_format_season_header(year), font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=8, pady=6)
-
-        cols = ctk.CTkFrame(self.container, fg_color="#1F1F1F")
-        cols.pack(fill="x", padx=8, pady=(0, 4))
-        
-        headers = ["Team 1", "Team 2", "Venue", "Date", "Season", "Score", "Status", "View", "Delete"]
-        for i, t in enumerate(headers):
-            cols.grid_columnconfigure(i, weight=1 if i <= 6 else 0)
-            ctk.CTkLabel(cols, text=t, font=ctk.CTkFont(size=14, weight="bold")).grid(row=0, column=i, padx=8, pady=4, sticky="w")
-
-        group_games = []
-        for g in all_games:
-            dt = _parse_iso(g.get('date'))
-            if dt and start_dt <= dt <= end_dt:
-                group_games.append(g)
-        
-        group_games.sort(key=lambda x: (x.get('date', ''), x.get('start', '')))
-
-        if not group_games:
-            ctk.CTkLabel(self.container, text="(No games in this season window)").pack()
-            return
-
-        for idx_in_group, game in enumerate(group_games):
-            self._render_game_row(game, idx_in_group)
-
-    def _render_game_row(self, game, idx):
-        row = ctk.CTkFrame(self.container, fg_color="#2A2A2A")
-        row.pack(fill="x", padx=8, pady=2)
-        
-        for i in range(9): 
-            row.grid_columnconfigure(i, weight=1 if i <= 6 else 0)
-
-        ctk.CTkLabel(row, text=game.get('team1')).grid(row=0, column=0, sticky="w", padx=8)
-        ctk.CTkLabel(row, text=game.get('team2')).grid(row=0, column=1, sticky="w", padx=8)
-        ctk.CTkLabel(row, text=game.get('venue')).grid(row=0, column=2, sticky="w", padx=8)
-        ctk.CTkLabel(row, text=game.get('date')).grid(row=0, column=3, sticky="w", padx=8)
-        ctk.CTkLabel(row, text=_season_from_iso(game.get('date'))).grid(row=0, column=4, sticky="w", padx=8)
-        
-        s1 = int(game.get('team1_score') or 0)
-        s2 = int(game.get('team2_score') or 0)
-        score_txt = f"{s1} - {s2}"
-        ctk.CTkLabel(row, text=score_txt).grid(row=0, column=5, sticky="w", padx=8)
-
-        is_fin = bool(game.get('is_final'))
-        status = "Final" if is_fin else "Active"
-        color = "#D9534F" if is_fin else "#7CFC00"
-        ctk.CTkLabel(row, text=status, text_color=color).grid(row=0, column=6, sticky="w", padx=8)
-        
-        self.button_controls.create_buttons(row, game, idx)
-
-def refresh_scheduled_games_table(table_frame):
-    display = ScheduledGamesDisplay(table_frame)
-    display.render()
-
-def delete_scheduled_game(game_id):
-    controls = GameButtonControls(None)
-    controls.delete_logic(game_id)
-
-def show_game_details(index, game_data):
-    panel = GamePreviewPanel()
-    panel.show_details(index, game_data)
-
-def _get_scheduled_games_source():
-    return scheduled_games
\ No newline at end of file
+import sys
+import customtkinter as ctk
+from tkinter import messagebox
+from datetime import datetime, date as _date
+from theDB import *
+from gameStore import game_store
+
+refs = None
+
+ROW_HEIGHT = 34
+ROW_BUFFER = 2
+COLUMNS = ["Team 1", "Team 2", "Venue", "Date", "Season", "Score", "Status", "View", "Delete"]
+
+def _parse_iso(date_iso):
+    try:
+        if not date_iso: return None
+        return datetime.strptime(date_iso, "%Y-%m-%d").date()
+    except Exception:
+        return None
+
+def _format_season_header(year):
+    s, e = season_calendar.window(year)
+    return f"Season {e.year} — {s} → {e}"
+
+class GamePreviewPanel:
+    def show_details(self, index, game_data):
+        game = game_data
+        if not game: return
+        
+        if refs and isinstance(refs, dict):
+            refs["selected_game"] = game
+        
+        s1 = int(game.get('team1_score') or 0)
+        s2 = int(game.get('team2_score') or 0)
+        
+        is_final = bool(game.get('is_final'))
+        
+        winner_text = "TBD"
+        if is_final:
+            if game.get('winner_team_id'):
+                w_id = game.get('winner_team_id')
+                if w_id == game.get('team1_id'):
+                    winner_text = game.get('team1')
+                elif w_id == game.get('team2_id'):
+                    winner_text = game.get('team2')
+            else:
+                winner_text = "Tie"
+
+        details = (
+            f"Matchup: {game.get('team1')} vs {game.get('team2')}\n"
+            f"Venue:   {game.get('venue')}\n\n"
+            f"Date:    {game.get('date')}\n"
+            f"Time:    {game.get('start')} - {game.get('end')}\n\n"
+            f"Score:   {s1} - {s2}\n"
+            f"Status:  {'Final' if is_final else 'Active'}\n"
+            f"Winner:  {winner_text if is_final else 'N/A'}"
+        )
+        if refs.get("details_content"):
+            refs["details_content"].configure(text=details)
+
+class GameButtonControls:
+    def __init__(self, preview_handler):
+        self.preview = preview_handler
+
+    def delete_logic(self, game_id):
+        if messagebox.askyesno("Delete", "Delete this game?"):
+            sm = ScheduleManager()
+            try:
+                sm.deleteGame(game_id)
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not delete game: {e}")
+
+def _configure_columns(frame):
+    for i in range(len(COLUMNS)):
+        if i <= 6:
+            frame.grid_columnconfigure(i, weight=1, uniform="games")
+        else:
+            frame.grid_columnconfigure(i, weight=0, minsize=68)
+
+
+class _RowSlot:
+    """One recycled table row, shown either as a title line or as a game with its buttons."""
+    def __init__(self, table):
+        self.table = table
+        self.mode = None
+        self.game_id = None
+        self._texts = {}
+
+        self.frame = ctk.CTkFrame(table.body, height=ROW_HEIGHT, corner_radius=0, fg_color="transparent")
+        self.frame.pack_propagate(False)
+        self.frame.pack(fill="x")
+
+        self.title = ctk.CTkLabel(self.frame, text="", anchor="w")
+        self.cells_frame = ctk.CTkFrame(self.frame, corner_radius=0, fg_color="#2A2A2A")
+        _configure_columns(self.cells_frame)
+        self.cells = []
+        for i in range(7):
+            lbl = ctk.CTkLabel(self.cells_frame, text="", anchor="w")
+            lbl.grid(row=0, column=i, sticky="w", padx=8)
+            self.cells.append(lbl)
+        self.view_btn = ctk.CTkButton(self.cells_frame, text="View", width=60, command=lambda: table.on_view(self.game_id))
+        self.view_btn.grid(row=0, column=7, padx=4)
+        self.delete_btn = ctk.CTkButton(self.cells_frame, text="Delete", width=60, fg_color="#F44336",
+                                        command=lambda: table.on_delete(self.game_id))
+        self.delete_btn.grid(row=0, column=8, padx=4)
+
+        for w in [self.frame, self.title, self.cells_frame, self.view_btn, self.delete_btn] + self.cells:
+            table.bind_wheel(w)
+
+    def _set_mode(self, mode):
+        if mode == self.mode: return
+        self.title.pack_forget()
+        self.cells_frame.pack_forget()
+        if mode == "game":
+            self.cells_frame.pack(fill="both", expand=True, padx=8, pady=1)
+        elif mode in ("season", "empty"):
+            self.title.pack(fill="both", expand=True, padx=16)
+        self.frame.configure(fg_color="#1E1E1E" if mode == "season" else "transparent")
+        self.mode = mode
+
+    def _configure(self, widget, key, **kwargs):
+        # Only touch Tk when the value actually changed.
+        if self._texts.get(key) != kwargs:
+            widget.configure(**kwargs)
+            self._texts[key] = kwargs
+
+    def show(self, item):
+        kind, value = item
+        self._set_mode(kind)
+        if kind == "game":
+            self._show_game(value)
+        else:
+            self.game_id = None
+            font = self.table.title_font if kind == "season" else self.table.body_font
+            self._configure(self.title, "title", text=value, font=font)
+
+    def _show_game(self, game_id):
+        self.game_id = game_id
+        game = game_store.get(game_id)
+        if not game: return
+        is_fin = bool(game.is_final)
+        values = (game.team1, game.team2, game.venue, game.date, game.phase,
+                  f"{int(game.team1_score or 0)} - {int(game.team2_score or 0)}")
+        for i, text in enumerate(values):
+            self._configure(self.cells[i], i, text=text)
+        self._configure(self.cells[6], 6, text="Final" if is_fin else "Active",
+                        text_color="#D9534F" if is_fin else "#7CFC00")
+
+    def blank(self):
+        self.game_id = None
+        self._set_mode("blank")
+
+
+class VirtualGameTable(ctk.CTkFrame):
+    """
+    Scrolling table that only owns widgets for the visible rows plus a small
+    buffer. items is a flat list of ("season", title), ("game", game_id) and
+    ("empty", text) entries; scrolling moves a window over it and the same
+    row widgets are reconfigured for whatever falls inside.
+    """
+    def __init__(self, master, on_view, on_delete, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.on_view = on_view
+        self.on_delete = on_delete
+        self.items = []
+        self.first = 0
+        self.slots = []
+        self.title_font = ctk.CTkFont(size=14, weight="bold")
+        self.body_font = ctk.CTkFont()
+
+        header = ctk.CTkFrame(self, fg_color="#1F1F1F")
+        header.pack(fill="x", padx=(8, 24), pady=(0, 4))
+        _configure_columns(header)
+        for i, t in enumerate(COLUMNS):
+            ctk.CTkLabel(header, text=t, font=self.title_font).grid(row=0, column=i, padx=8, pady=4, sticky="w")
+
+        wrap = ctk.CTkFrame(self, fg_color="transparent")
+        wrap.pack(fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(wrap, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.body = ctk.CTkFrame(wrap, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.body.pack_propagate(False)
+        self.body.bind("<Configure>", lambda e: self._fill_viewport())
+        self.bind_wheel(self.body)
+
+    def bind_wheel(self, widget):
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(seq, self._on_wheel, add="+")
+
+    def _row_px(self):
+        try:
+            return max(1, int(self._apply_widget_scaling(ROW_HEIGHT)))
+        except Exception:
+            return ROW_HEIGHT
+
+    def _visible_rows(self):
+        return max(1, self.body.winfo_height() // self._row_px())
+
+    def _fill_viewport(self):
+        needed = self._visible_rows() + ROW_BUFFER
+        while len(self.slots) < needed:
+            self.slots.append(_RowSlot(self))
+        self._scroll_to(self.first)
+
+    def set_items(self, items):
+        self.items = items
+        self._scroll_to(self.first)
+
+    def redraw(self):
+        for i, slot in enumerate(self.slots):
+            idx = self.first + i
+            if idx < len(self.items):
+                slot.show(self.items[idx])
+            else:
+                slot.blank()
+        n = len(self.items)
+        if n:
+            self.scrollbar.set(self.first / n, min(1.0, (self.first + self._visible_rows()) / n))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _scroll_to(self, first):
+        last_start = max(0, len(self.items) - self._visible_rows())
+        self.first = max(0, min(int(first), last_start))
+        self.redraw()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._scroll_to(round(float(args[0]) * len(self.items)))
+        elif action == "scroll":
+            step = int(args[0])
+            if len(args) > 1 and args[1] == "pages":
+                step *= self._visible_rows()
+            self._scroll_to(self.first + step)
+
+    def _on_wheel(self, event):
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -3 if event.num == 4 else 3
+        self._scroll_to(self.first + delta)
+
+    def scroll_to_game(self, game_id):
+        for idx, (kind, value) in enumerate(self.items):
+            if kind == "game" and value == game_id:
+                self._scroll_to(idx - 1)
+                return True
+        return False
+
+
+class ScheduledGamesDisplay:
+    """
+    Feeds the virtual table from the GameStore. Score and status events only
+    redraw the visible rows; anything that can move rows rebuilds the item
+    list, which holds no widgets and is cheap to recompute.
+    """
+    def __init__(self, container):
+        self.container = container
+        self.preview_handler = GamePreviewPanel()
+        self.button_controls = GameButtonControls(self.preview_handler)
+        self.table = None
+
+    def render(self):
+        if self.table is None or not self.table.winfo_exists():
+            for widget in self.container.winfo_children():
+                widget.destroy()
+            self.table = VirtualGameTable(
+                self.container,
+                on_view=lambda gid: gid is not None and self.preview_handler.show_details(None, game_store.get(gid)),
+                on_delete=lambda gid: gid is not None and self.button_controls.delete_logic(gid),
+            )
+            self.table.pack(fill="both", expand=True)
+        self.table.set_items(self._build_items())
+
+    def _build_items(self):
+        years = season_index.season_start_years()
+        if not years:
+            return [("empty", "No scheduled seasons found (DB empty or dates invalid).")]
+        items = []
+        for year in years:
+            items.append(("season", _format_season_header(year)))
+            games = game_store.by_season(year)
+            if games:
+                items.extend(("game", g.id) for g in games)
+            else:
+                items.append(("empty", "(No games in this season window)"))
+        return items
+
+    def apply(self, event):
+        """Patches the table for one GameChanged event."""
+        if isinstance(event, (ScoreChanged, GameFinalized)):
+            self.table.redraw()
+        else:
+            self.render()
+        self._refresh_selected(event.game_id)
+
+    def _refresh_selected(self, game_id):
+        selected = refs.get("selected_game") if isinstance(refs, dict) else None
+        if not selected or (game_id is not None and selected.get('id') != game_id):
+            return
+        game = game_store.get(selected.get('id'))
+        if game:
+            self.preview_handler.show_details(None, game)
+        else:
+            refs.pop("selected_game", None)
+            if refs.get("details_content"):
+                refs["details_content"].configure(text="Select a game to view details.")
+
+_display = None
+
+def refresh_scheduled_games_table(table_frame):
+    global _display
+    if table_frame is None: return
+    _display = ScheduledGamesDisplay(table_frame)
+    _display.render()
+
+def _on_games_changed(event):
+    if _display is None or _display.table is None or not _display.container.winfo_exists(): return
+    _display.apply(event)
+
+def _on_names_changed(event):
+    if event.change in ("renamed", "updated") and _display is not None and _display.container.winfo_exists():
+        _display.render()
+
+bus.subscribe(GameChanged, _on_games_changed)
+bus.subscribe(RosterChanged, _on_names_changed)
+bus.subscribe(VenueChanged, _on_names_changed)
+
+def delete_scheduled_game(game_id):
+    controls = GameButtonControls(None)
+    controls.delete_logic(game_id)
+
+def show_game_details(index, game_data):
+    panel = GamePreviewPanel()
+    panel.show_details(index, game_data)
+
+def _get_scheduled_games_source():
+    return game_store.all()
+
+def focus_game(game_id):
+    """Scrolls the games table to a game and shows its details (used by the global search)."""
+    game = game_store.get(game_id)
+    if not game: return False
+    if _display is not None and _display.table is not None and _display.table.winfo_exists():
+        _display.table.scroll_to_game(game_id)
+        _display.preview_handler.show_details(None, game)
+        return True
+    if isinstance(refs, dict):
+        refs["selected_game"] = game
+    return False